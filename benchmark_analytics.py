@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+
+import os
+import csv
+import time
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+import numpy as np
+import pandas as pd
+from colorama import init, Fore, Style
+from tabulate import tabulate
+import growth_engine
+from growth_engine import window_stats, gain_series
+from stats_history import StatsHistory
+from stats_storage import CsvStorage, read_csv_columns
+from calculate_follower_growth import DEFAULT_WINDOWS
+from visualization import frame_from_history, followers_per_post, followers_per_post_loop
+
+init(autoreset=True)  # Initialize colorama
+
+# Hourly windows over the last 30 days, to show batching many windows
+MANY_WINDOWS = [(f"{h}h", f"{h}h", timedelta(hours=h)) for h in range(1, 24 * 30 + 1)]
+
+def make_history(rows, step=60, end=None):
+    """
+    Build a StatsHistory of rows samples, one every step seconds up to end (default: now).
+
+    The columns are filled straight from NumPy so 10M-row histories build in seconds.
+    """
+    history = StatsHistory()
+    end = history.to_seconds(end or datetime.now())
+    rng = np.random.default_rng(0)
+    times = end - step * np.arange(rows - 1, -1, -1, dtype=np.float64)
+    followers = 1_000_000 + np.cumsum(rng.integers(-2, 10, rows))
+    posts = 10_000 + np.cumsum(rng.integers(0, 2, rows))
+    history.times.frombytes(times.tobytes())
+    history.followers.frombytes(followers.astype(np.int64).tobytes())
+    history.posts.frombytes(posts.astype(np.int64).tobytes())
+    return history
+
+def reference_window_stats(history, windows):
+    """The per-window Python loop calculate_growth_stats used before the engine."""
+    current = len(history) - 1
+    stats = {
+        'current_time': history.datetime_at(current),
+        'current_fol': history.followers[current],
+        'current_posts': history.posts[current],
+        'windows': [(key, label) for key, label, _ in windows],
+    }
+    for key, _, window in windows:
+        past = history.nearest(history.times[current] - window.total_seconds(), current)
+        time_diff = (history.times[current] - history.times[past]) / 86400
+        fol_diff = history.followers[current] - history.followers[past]
+        post_diff = history.posts[current] - history.posts[past]
+        stats[key] = {
+            'fol_diff': int(fol_diff), 'fol_rate': fol_diff / time_diff,
+            'post_diff': int(post_diff), 'post_rate': post_diff / time_diff
+        }
+    return stats
+
+def reference_daily_gains(history, days=7):
+    """The day-by-day loop calculate_daily_gains used before the engine."""
+    daily_gains = []
+    for i in range(days):
+        end_date = datetime.now().date() - timedelta(days=i)
+        start_date = end_date - timedelta(days=1)
+        end_index = history.first_on_day(end_date)
+        start_index = history.first_on_day(start_date)
+        if end_index is not None and start_index is not None:
+            daily_gains.append((end_date, history.followers[end_index] - history.followers[start_index]))
+        else:
+            daily_gains.append((end_date, 0))
+    return daily_gains[::-1]
+
+def python_engine(func, *args):
+    """Run an engine function on its pure-Python path, as without NumPy installed."""
+    saved, growth_engine.np = growth_engine.np, None
+    try:
+        return func(*args)
+    finally:
+        growth_engine.np = saved
+
+def time_call(func, args, repeat):
+    """Return (best wall time over repeat runs in seconds, result of the last run)."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def run_suite(sizes, repeat):
+    """
+    Time the reference code and the engine on synthetic 1-minute histories.
+
+    Returns:
+        list: (benchmark, rows, reference seconds, engine seconds, results match) tuples
+    """
+    results = []
+    for rows in sizes:
+        history = make_history(rows)
+        span_days = int(rows * 60 / 86400) + 1
+        span_hours = int(rows * 60 / 3600) + 1
+        cases = [
+            ('default windows', (reference_window_stats, (history, DEFAULT_WINDOWS)),
+             (window_stats, (history, DEFAULT_WINDOWS))),
+            (f'{len(MANY_WINDOWS)} windows', (reference_window_stats, (history, MANY_WINDOWS)),
+             (window_stats, (history, MANY_WINDOWS))),
+            (f'daily gains ({span_days:,} days)', (reference_daily_gains, (history, span_days)),
+             (gain_series, (history, 'day', span_days))),
+            (f'hourly gains ({span_hours:,} hours)', (python_engine, (gain_series, history, 'hour', span_hours)),
+             (gain_series, (history, 'hour', span_hours))),
+        ]
+        for name, (ref_func, ref_args), (engine_func, engine_args) in cases:
+            ref_seconds, expected = time_call(ref_func, ref_args, repeat)
+            engine_seconds, actual = time_call(engine_func, engine_args, repeat)
+            results.append((name, rows, ref_seconds, engine_seconds, results_match(expected, actual)))
+        del history
+    return results
+
+def write_stats_csv(path, rows, step=60):
+    """Write a synthetic <account>_stats.csv with rows samples, one every step seconds, ~1% N/A."""
+    end = datetime.now().replace(microsecond=123456)
+    rng = np.random.default_rng(0)
+    followers = 1_000_000 + np.cumsum(rng.integers(-2, 10, rows))
+    missing = rng.random(rows) < 0.01
+    with open(path, 'w', newline='') as f:
+        f.write('datetime,posts,following,followers\n')
+        for i in range(rows):
+            timestamp = (end - timedelta(seconds=step * (rows - 1 - i))).isoformat()
+            f.write(f"{timestamp},{10_000 + i // 100},{500},{'N/A' if missing[i] else followers[i]}\n")
+
+def dictreader_ingest(path):
+    """The per-row path calculate_growth_stats used before the storage layer."""
+    data = []
+    with open(path, 'r') as file:
+        reader = csv.DictReader(file)
+        for row in reader:
+            if row['followers'] != 'N/A':
+                timestamp = datetime.fromisoformat(row['datetime'].replace('Z', '+00:00'))
+                posts = int(row['posts']) if row['posts'] != 'N/A' else 0
+                data.append((timestamp, int(row['followers']), posts))
+    return len(data)
+
+def pandas_ingest(path):
+    """The pd.read_csv + pd.to_datetime path visualization.py used."""
+    df = pd.read_csv(path)
+    df['datetime'] = pd.to_datetime(df['datetime'])
+    return len(df)
+
+def storage_read_ingest(path):
+    return len(CsvStorage(os.path.dirname(path)).read('bench'))
+
+def columns_ingest(path):
+    return len(read_csv_columns(path))
+
+INGEST_PATHS = {
+    'csv.DictReader + fromisoformat': dictreader_ingest,
+    'CsvStorage.read': storage_read_ingest,
+    'pd.read_csv + to_datetime': pandas_ingest,
+    'read_csv_columns': columns_ingest,
+}
+
+def run_ingest_suite(sizes, repeat):
+    """
+    Time each CSV ingest path on synthetic stats files.
+
+    Returns:
+        list: (path name, rows, seconds) tuples
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'bench_stats.csv')
+        for rows in sizes:
+            write_stats_csv(path, rows)
+            for name, func in INGEST_PATHS.items():
+                seconds, _ = time_call(func, (path,), repeat)
+                results.append((name, rows, seconds))
+    return results
+
+def print_ingest_results(results):
+    rows = [["Ingest path", "Rows", "Time (ms)", "Rows/s"]]
+    for name, size, seconds in results:
+        rows.append([name, f"{size:,}", f"{seconds * 1000:.1f}", f"{size / seconds:,.0f}"])
+    print(f"{Fore.CYAN}{tabulate(rows, headers='firstrow', tablefmt='fancy_grid')}")
+
+def run_followers_per_post_suite(sizes, repeat, window_size=7):
+    """
+    Time visualization's row-by-row followers-per-post loop against the searchsorted version.
+
+    Returns:
+        list: (benchmark, rows, reference seconds, engine seconds, results match) tuples
+    """
+    results = []
+    for rows in sizes:
+        frame = frame_from_history(make_history(rows))
+        ref_seconds, expected = time_call(followers_per_post_loop, (frame, window_size), repeat)
+        engine_seconds, actual = time_call(followers_per_post, (frame, window_size), repeat)
+        results.append((f'followers per post ({window_size}-day window)', rows, ref_seconds, engine_seconds,
+                        expected == actual))
+    return results
+
+def results_match(expected, actual):
+    """Compare stats dicts or gain lists, allowing float rounding in the rates."""
+    if isinstance(expected, dict):
+        return all(expected[key] == actual[key] if not isinstance(expected[key], dict) else
+                   all(abs(expected[key][k] - actual[key][k]) <= 1e-9 * max(1, abs(expected[key][k]))
+                       for k in expected[key])
+                   for key in expected)
+    return expected == actual
+
+def print_results(results):
+    rows = [["Benchmark", "Rows", "Reference (ms)", "Engine (ms)", "Speedup", "Match"]]
+    for name, size, ref_seconds, engine_seconds, match in results:
+        rows.append([name, f"{size:,}", f"{ref_seconds * 1000:.2f}", f"{engine_seconds * 1000:.2f}",
+                     f"{ref_seconds / engine_seconds:.1f}x",
+                     f"{Fore.GREEN}yes{Fore.CYAN}" if match else f"{Fore.RED}NO{Fore.CYAN}"])
+    print(f"{Fore.CYAN}{tabulate(rows, headers='firstrow', tablefmt='fancy_grid')}")
+    if not all(result[4] for result in results):
+        print(f"{Fore.RED}{Style.BRIGHT}Engine results differ from the reference implementation")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark the growth engine, CSV ingest and followers per post against the previous code paths')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 1_000_000, 10_000_000],
+                        help='History sizes in rows, one sample per minute (default: 10000 1000000 10000000)')
+    parser.add_argument('--ingest-sizes', type=int, nargs='+', default=[100_000, 1_000_000],
+                        help='CSV sizes in rows for the ingest benchmark (default: 100000 1000000)')
+    parser.add_argument('--fpp-sizes', type=int, nargs='+', default=[1_000, 10_000],
+                        help='Rows for the followers-per-post benchmark; the reference is O(n^2) (default: 1000 10000)')
+    parser.add_argument('--suite', choices=['engine', 'ingest', 'followers-per-post', 'all'], default='all',
+                        help='Which benchmarks to run (default: all)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Runs per measurement; the best run is reported (default: 3)')
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    if args.suite in ('engine', 'all'):
+        print_results(run_suite(args.sizes, args.repeat))
+    if args.suite in ('ingest', 'all'):
+        print_ingest_results(run_ingest_suite(args.ingest_sizes, args.repeat))
+    if args.suite in ('followers-per-post', 'all'):
+        print_results(run_followers_per_post_suite(args.fpp_sizes, args.repeat))
+
+if __name__ == "__main__":
+    main()
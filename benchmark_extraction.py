@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+from colorama import init, Fore, Style
+from tabulate import tabulate
+from html_sources.extract_interaction import extract_interaction
+from html_sources.extract_post_count import extract_post_count
+from html_sources.profile_extractor import extract_profile_fields
+from get_profile_stats import parse_count, HREF_STAT_PATTERNS
+
+init(autoreset=True)  # Initialize colorama
+
+PROFILE_JSON_LD = (
+    '<script type="application/ld+json">{"@context":"http://schema.org","@type":"ProfilePage",'
+    '"mainEntity":{"@type":"Person","interactionStatistic":['
+    '{"@type":"InteractionCounter","name":"Follows","userInteractionCount":123456},'
+    '{"@type":"InteractionCounter","name":"Friends","userInteractionCount":789},'
+    '{"@type":"InteractionCounter","name":"Tweets","userInteractionCount":4321}]}}</script>'
+)
+
+PROFILE_LINKS = (
+    '<div><a href="/someone/following" role="link"><span><span>789</span></span> <span>Following</span></a>'
+    '<a href="/someone/verified_followers" role="link"><span><span>123.4K</span></span> '
+    '<span>Followers</span></a></div>'
+)
+
+MARKER_POSITIONS = ('start', 'middle', 'end', 'none')
+
+COUNT_TEXTS = ['789', '1,234', '12.3K', '4.5M', '1B', '123,456 Followers', '98.7K Following', 'no count']
+
+def generate_profile_page(size_mb, marker_position='end'):
+    """
+    Build a synthetic profile page of roughly size_mb megabytes.
+
+    Args:
+        size_mb (float): Approximate page size in megabytes
+        marker_position (str): Where the JSON-LD and follower links go: 'start',
+            'middle', 'end', or 'none' for a page without any stats markers
+
+    Returns:
+        str: The page HTML
+    """
+    block = ''.join(
+        f'<div class="css-175oi2r r-account" data-testid="cellInnerDiv"><article>'
+        f'<span>account {i} reply count amount</span><a href="/user{i}/status/{i}">post</a>'
+        f'</article></div>'
+        for i in range(500)
+    )
+    repeats = max(1, int(size_mb * 1_000_000) // len(block))
+    markers = PROFILE_JSON_LD + PROFILE_LINKS
+    if marker_position == 'start':
+        body = markers + block * repeats
+    elif marker_position == 'middle':
+        body = block * (repeats // 2) + markers + block * (repeats - repeats // 2)
+    elif marker_position == 'end':
+        body = block * repeats + markers
+    else:
+        body = block * repeats
+    return f'<html><head></head><body>{body}</body></html>'
+
+def per_field_scan(content):
+    """The per-field path the fetcher used before the single-pass extractor: one scan per field."""
+    fields = {}
+    for name, key in (('followers', 'userInteractionCount'), ('statuses_count', 'statuses_count'),
+                      ('tweet_count', 'tweet_count')):
+        content.find(key)
+        for pattern in (f'"{key}":(\\d+)', f'{key}":(\\d+)', f'{key}=(\\d+)'):
+            match = re.search(pattern, content)
+            if match:
+                fields[name] = int(match.group(1))
+                break
+    for term in ('tweet_count', 'statuses_count'):
+        content.find(term)
+    match = re.search(r'"name":"Tweets","userInteractionCount":(\d+)', content)
+    if match:
+        fields['posts'] = int(match.group(1))
+    match = re.search(r'"friends_count":(\d+)', content)
+    if match:
+        fields['following'] = int(match.group(1))
+    return fields
+
+def href_scan(content):
+    """The DOTALL href regexes find_stats_by_href runs over the page source."""
+    return {name: pattern.search(content) for name, pattern in HREF_STAT_PATTERNS.items()}
+
+PAGE_EXTRACTORS = {
+    'extract_interaction': extract_interaction,
+    'extract_post_count': extract_post_count,
+    'extract_profile_fields': extract_profile_fields,
+    'per_field_scan': per_field_scan,
+    'href_regex': href_scan,
+}
+
+def time_call(func, arg, repeat):
+    """Return the best wall time of func(arg) over repeat runs, in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def parse_count_batch(texts):
+    for text in texts:
+        parse_count(text)
+
+def run_suite(sizes, repeat, corpus_dir=None):
+    """
+    Time every extractor on every generated page.
+
+    Returns:
+        dict: '<extractor>/<size>MB/<position>' -> (seconds, page bytes)
+    """
+    results = {}
+    for size_mb in sizes:
+        for position in MARKER_POSITIONS:
+            content = generate_profile_page(size_mb, position)
+            if corpus_dir:
+                os.makedirs(corpus_dir, exist_ok=True)
+                with open(os.path.join(corpus_dir, f"profile_{size_mb:g}MB_{position}.html"), 'w',
+                          encoding='utf-8') as f:
+                    f.write(content)
+            for name, func in PAGE_EXTRACTORS.items():
+                results[f"{name}/{size_mb:g}MB/{position}"] = (time_call(func, content, repeat), len(content))
+
+    texts = COUNT_TEXTS * 1250
+    results['parse_count/10k'] = (time_call(parse_count_batch, texts, repeat), 0)
+    return results
+
+def print_results(results):
+    rows = [["Benchmark", "Time (ms)", "MB/s", "Pages/s"]]
+    for key, (seconds, size) in results.items():
+        throughput = f"{size / 1_000_000 / seconds:,.0f}" if size else "-"
+        rows.append([key, f"{seconds * 1000:.2f}", throughput, f"{1 / seconds:,.1f}"])
+    print(f"{Fore.CYAN}{tabulate(rows, headers='firstrow', tablefmt='fancy_grid')}")
+
+    # Headline comparison: old per-field scan vs single pass on pages with markers at the end
+    for key in results:
+        if key.startswith('per_field_scan/') and key.endswith('/end'):
+            single_key = key.replace('per_field_scan', 'extract_profile_fields')
+            speedup = results[key][0] / results[single_key][0]
+            print(f"{Fore.YELLOW}{key.split('/')[1]} page: single pass is {Style.BRIGHT}{speedup:.1f}x{Style.NORMAL}"
+                  f" faster than the per-field path")
+
+def check_regressions(results, baseline, tolerance):
+    """Return the benchmarks that are more than tolerance slower than the baseline."""
+    regressions = []
+    for key, (seconds, _) in results.items():
+        if key in baseline and seconds > baseline[key] * (1 + tolerance):
+            regressions.append((key, baseline[key], seconds))
+    return regressions
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark profile extractors on synthetic X profile pages')
+    parser.add_argument('--sizes', type=float, nargs='+', default=[1, 2, 5, 10],
+                        help='Page sizes in MB to benchmark (default: 1 2 5 10)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Runs per measurement; the best run is reported (default: 5)')
+    parser.add_argument('--baseline', type=str, default='extraction_baseline.json',
+                        help='Baseline timings to compare against (default: extraction_baseline.json)')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='Store this run as the new baseline instead of comparing')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed slowdown against the baseline before failing (default: 0.25 = 25%%)')
+    parser.add_argument('--corpus-dir', type=str, default=None,
+                        help='Also write the generated pages to this directory')
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    results = run_suite(args.sizes, args.repeat, args.corpus_dir)
+    print_results(results)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump({key: seconds for key, (seconds, _) in results.items()}, f, indent=2, sort_keys=True)
+        print(f"{Fore.GREEN}Baseline saved to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"{Fore.YELLOW}No baseline at {args.baseline}; run with --save-baseline to create one.")
+        return
+
+    with open(args.baseline, 'r') as f:
+        baseline = json.load(f)
+    regressions = check_regressions(results, baseline, args.tolerance)
+    if regressions:
+        print(f"{Fore.RED}Regressions against {args.baseline}:")
+        for key, before, after in regressions:
+            print(f"{Fore.RED}  {key}: {before * 1000:.2f} ms -> {after * 1000:.2f} ms")
+        sys.exit(1)
+    print(f"{Fore.GREEN}No regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+
+if __name__ == "__main__":
+    main()
@@ -1,110 +1,97 @@
 #!/usr/bin/env python
 
-import csv
+import os
 import sys
 import time
+import fnmatch
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from colorama import init, Fore, Style
 from tabulate import tabulate
+from stats_storage import open_storage
+from stats_history import StatsHistory, load_history
+from stats_rollup import RollupStore
+from growth_engine import PERIODS, window_stats, gain_series
 
 init(autoreset=True)  # Initialize colorama
 
-def calculate_daily_gains(data, days=7):
-    daily_gains = []
-    for i in range(days):
-        end_date = datetime.now().date() - timedelta(days=i)
-        start_date = end_date - timedelta(days=1)
-        
-        end_followers = next((fol for date, fol in data if date.date() == end_date), None)
-        start_followers = next((fol for date, fol in data if date.date() == start_date), None)
-        
-        if end_followers is not None and start_followers is not None:
-            daily_gains.append((end_date, end_followers - start_followers))
-        else:
-            daily_gains.append((end_date, 0))
-    
-    return daily_gains[::-1]  # Reverse the list to have oldest date first
-
-def calculate_growth_stats(account_name):
-    csv_file = f'{account_name}_stats.csv'
-    data = []
-    with open(csv_file, 'r') as file:
-        reader = csv.DictReader(file)
-        timestamp_key = next(key for key in reader.fieldnames if 'time' in key.lower())
-        fol_key = next(key for key in reader.fieldnames if 'follower' in key.lower())
-        post_key = next(key for key in reader.fieldnames if 'post' in key.lower())
-        for row in reader:
-            timestamp = datetime.fromisoformat(row[timestamp_key].replace('Z', '+00:00'))
-            fol = row[fol_key]
-            posts = row[post_key]
-            if fol != 'N/A':
-                post_count = 0 if posts == '' or posts == 'N/A' else int(posts)
-                data.append((timestamp, int(fol), post_count))
-
-    if len(data) < 2:
-        return None
-
-    data.sort(key=lambda x: x[0], reverse=True)  # Sort by timestamp, most recent first
-
-    current_time, current_fol, current_posts = data[0]
-    
-    def calculate_stats(hours):
-        target_time = current_time - timedelta(hours=hours)
-        closest_past = min(data[1:], key=lambda x: abs(x[0] - target_time))
-        past_time, past_fol, past_posts = closest_past
-        time_diff = (current_time - past_time).total_seconds() / 86400  # Convert to days
-        fol_diff = current_fol - past_fol
-        post_diff = current_posts - past_posts
-        fol_growth_rate = fol_diff / time_diff
-        post_growth_rate = post_diff / time_diff
-        return int(fol_diff), fol_growth_rate, int(post_diff), post_growth_rate
-
-    ten_min_fol_diff, ten_min_fol_rate, ten_min_post_diff, ten_min_post_rate = calculate_stats(10/60)  # 10 minutes
-    hourly_fol_diff, hourly_fol_rate, hourly_post_diff, hourly_post_rate = calculate_stats(1)
-    six_hour_fol_diff, six_hour_fol_rate, six_hour_post_diff, six_hour_post_rate = calculate_stats(6)
-    daily_fol_diff, daily_fol_rate, daily_post_diff, daily_post_rate = calculate_stats(24)
-    weekly_fol_diff, weekly_fol_rate, weekly_post_diff, weekly_post_rate = calculate_stats(24 * 7)
-
-    return {
-        'ten_min': {
-            'fol_diff': ten_min_fol_diff, 'fol_rate': ten_min_fol_rate,
-            'post_diff': ten_min_post_diff, 'post_rate': ten_min_post_rate
-        },
-        'current_time': current_time,
-        'current_fol': current_fol,
-        'current_posts': current_posts,
-        'hourly': {
-            'fol_diff': hourly_fol_diff, 'fol_rate': hourly_fol_rate,
-            'post_diff': hourly_post_diff, 'post_rate': hourly_post_rate
-        },
-        'six_hour': {
-            'fol_diff': six_hour_fol_diff, 'fol_rate': six_hour_fol_rate,
-            'post_diff': six_hour_post_diff, 'post_rate': six_hour_post_rate
-        },
-        'daily': {
-            'fol_diff': daily_fol_diff, 'fol_rate': daily_fol_rate,
-            'post_diff': daily_post_diff, 'post_rate': daily_post_rate
-        },
-        'weekly': {
-            'fol_diff': weekly_fol_diff, 'fol_rate': weekly_fol_rate,
-            'post_diff': weekly_post_diff, 'post_rate': weekly_post_rate
-        }
-    }
+# (key, label, window) for the periods shown by default
+DEFAULT_WINDOWS = [
+    ('ten_min', '10-min', timedelta(minutes=10)),
+    ('hourly', '1-hour', timedelta(hours=1)),
+    ('six_hour', '6-hour', timedelta(hours=6)),
+    ('daily', '24-hour', timedelta(hours=24)),
+    ('weekly', '7-day', timedelta(days=7)),
+]
+
+WINDOW_UNITS = {'m': 'minutes', 'h': 'hours', 'd': 'days', 'w': 'weeks'}
+
+def parse_windows(spec):
+    """
+    Parse a comma-separated window list such as '10m,1h,24h,30d'.
+
+    Windows matching a default period keep its key and label, so the output is
+    unchanged for the default list.
+
+    Returns:
+        list: (key, label, timedelta) tuples
+    """
+    defaults = {window: (key, label) for key, label, window in DEFAULT_WINDOWS}
+    windows = []
+    for part in spec.split(','):
+        part = part.strip().lower()
+        if not part:
+            continue
+        unit = WINDOW_UNITS.get(part[-1])
+        try:
+            amount = float(part[:-1])
+        except ValueError:
+            amount = None
+        if unit is None or amount is None or amount <= 0:
+            raise ValueError(f"Invalid window '{part}' (use e.g. 10m, 6h, 7d or 2w)")
+        window = timedelta(**{unit: amount})
+        key, label = defaults.get(window, (part, part))
+        windows.append((key, label, window))
+    return windows
+
+def calculate_daily_gains(history, days=7):
+    return gain_series(history, 'day', days)
+
+PERIOD_SECONDS = {'hour': 3600, 'day': 86400, 'week': 7 * 86400}
+
+def history_seconds(windows, plot_period=None):
+    """Seconds of history the windows (and the gain plot, if any) need from the latest sample."""
+    seconds = max(window for _, _, window in windows).total_seconds()
+    if plot_period:
+        # The plotted buckets plus the baseline bucket before them
+        seconds = max(seconds, (PERIODS[plot_period][2] + 1) * PERIOD_SECONDS[plot_period])
+    return seconds
+
+def load_growth_history(account_name, storage=None, seconds=None, rollups=None):
+    """Load the history for seconds of growth stats, from rollups for long spans when a RollupStore is given."""
+    if rollups is not None:
+        return rollups.load_history(account_name, storage, seconds)
+    return load_history(account_name, storage, seconds)
+
+def calculate_growth_stats(account_name, storage=None, windows=None, rollups=None):
+    windows = windows or DEFAULT_WINDOWS
+    # Only the largest window plus the sample just before it is needed
+    history = load_growth_history(account_name, storage, history_seconds(windows), rollups)
+    return growth_stats_from_history(history, windows)
+
+def growth_stats_from_history(history, windows=None):
+    """Compute growth stats for each window from a StatsHistory."""
+    return window_stats(history, windows or DEFAULT_WINDOWS)
 
 def display_follower_stats(stats):
     print(f"{Fore.BLUE}Timestamp: {Style.BRIGHT}{stats['current_time']:%Y-%m-%d %H:%M:%S}")
     print(f"{Fore.GREEN}Current Fol: {Style.BRIGHT}{stats['current_fol']:,}")
     print()
 
-    table_data = [
-        ["Period", "NF", "   GR day", "   GR week"],
-        ["10-min", f"{Fore.YELLOW}{stats['ten_min']['fol_diff']:,}{Fore.CYAN}", f"{Fore.YELLOW}{int(stats['ten_min']['fol_rate']):>10,}{Fore.CYAN}", f"{Fore.YELLOW}{int(stats['ten_min']['fol_rate'] * 7):>10,}{Fore.CYAN}"],
-        ["1-hour", f"{Fore.YELLOW}{stats['hourly']['fol_diff']:,}{Fore.CYAN}", f"{Fore.YELLOW}{int(stats['hourly']['fol_rate']):>10,}{Fore.CYAN}", f"{Fore.YELLOW}{int(stats['hourly']['fol_rate'] * 7):>10,}{Fore.CYAN}"],
-        ["6-hour", f"{Fore.YELLOW}{stats['six_hour']['fol_diff']:,}{Fore.CYAN}", f"{Fore.YELLOW}{int(stats['six_hour']['fol_rate']):>10,}{Fore.CYAN}", f"{Fore.YELLOW}{int(stats['six_hour']['fol_rate'] * 7):>10,}{Fore.CYAN}"],
-        ["24-hour", f"{Fore.YELLOW}{stats['daily']['fol_diff']:,}{Fore.CYAN}", f"{Fore.YELLOW}{int(stats['daily']['fol_rate']):>10,}{Fore.CYAN}", f"{Fore.YELLOW}{int(stats['daily']['fol_rate'] * 7):>10,}{Fore.CYAN}"],
-        ["7-day", f"{Fore.YELLOW}{stats['weekly']['fol_diff']:,}{Fore.CYAN}", f"{Fore.YELLOW}{int(stats['weekly']['fol_rate']):>10,}{Fore.CYAN}", f"{Fore.YELLOW}{int(stats['weekly']['fol_rate'] * 7):>10,}{Fore.CYAN}"]
-    ]
+    table_data = [["Period", "NF", "   GR day", "   GR week"]]
+    for key, label in stats['windows']:
+        table_data.append([label, f"{Fore.YELLOW}{stats[key]['fol_diff']:,}{Fore.CYAN}", f"{Fore.YELLOW}{int(stats[key]['fol_rate']):>10,}{Fore.CYAN}", f"{Fore.YELLOW}{int(stats[key]['fol_rate'] * 7):>10,}{Fore.CYAN}"])
 
     table = tabulate(table_data, headers="firstrow", tablefmt="fancy_grid")
     print(f"{Fore.CYAN}{table}")
@@ -113,35 +100,220 @@ def display_post_stats(stats):
     print(f"\n{Fore.GREEN}Current Posts: {Style.BRIGHT}{stats['current_posts']:,}")
     print()
 
-    table_data = [
-        ["Period", "NP", "   GR day", "   GR week"],
-        ["10-min", f"{Fore.YELLOW}{stats['ten_min']['post_diff'] or 0:,}{Fore.CYAN}", f"{Fore.YELLOW}{int(stats['ten_min']['post_rate'] or 0):>10,}{Fore.CYAN}", f"{Fore.YELLOW}{int((stats['ten_min']['post_rate'] or 0) * 7):>10,}{Fore.CYAN}"],
-        ["1-hour", f"{Fore.YELLOW}{stats['hourly']['post_diff'] or 0:,}{Fore.CYAN}", f"{Fore.YELLOW}{int(stats['hourly']['post_rate'] or 0):>10,}{Fore.CYAN}", f"{Fore.YELLOW}{int((stats['hourly']['post_rate'] or 0) * 7):>10,}{Fore.CYAN}"],
-        ["6-hour", f"{Fore.YELLOW}{stats['six_hour']['post_diff'] or 0:,}{Fore.CYAN}", f"{Fore.YELLOW}{int(stats['six_hour']['post_rate'] or 0):>10,}{Fore.CYAN}", f"{Fore.YELLOW}{int((stats['six_hour']['post_rate'] or 0) * 7):>10,}{Fore.CYAN}"],
-        ["24-hour", f"{Fore.YELLOW}{stats['daily']['post_diff'] or 0:,}{Fore.CYAN}", f"{Fore.YELLOW}{int(stats['daily']['post_rate'] or 0):>10,}{Fore.CYAN}", f"{Fore.YELLOW}{int((stats['daily']['post_rate'] or 0) * 7):>10,}{Fore.CYAN}"],
-        ["7-day", f"{Fore.YELLOW}{stats['weekly']['post_diff'] or 0:,}{Fore.CYAN}", f"{Fore.YELLOW}{int(stats['weekly']['post_rate'] or 0):>10,}{Fore.CYAN}", f"{Fore.YELLOW}{int((stats['weekly']['post_rate'] or 0) * 7):>10,}{Fore.CYAN}"]
-    ]
+    table_data = [["Period", "NP", "   GR day", "   GR week"]]
+    for key, label in stats['windows']:
+        table_data.append([label, f"{Fore.YELLOW}{stats[key]['post_diff'] or 0:,}{Fore.CYAN}", f"{Fore.YELLOW}{int(stats[key]['post_rate'] or 0):>10,}{Fore.CYAN}", f"{Fore.YELLOW}{int((stats[key]['post_rate'] or 0) * 7):>10,}{Fore.CYAN}"])
+
+    table = tabulate(table_data, headers="firstrow", tablefmt="fancy_grid")
+    print(f"{Fore.CYAN}{table}")
+
+# Storage, windows and rollups of a dashboard worker process, set by _init_dashboard_worker
+_worker_storage = None
+_worker_windows = None
+_worker_rollups = None
+
+def _init_dashboard_worker(storage_spec, windows, rollups_path=None):
+    global _worker_storage, _worker_windows, _worker_rollups
+    _worker_storage = open_storage(storage_spec)
+    _worker_windows = windows
+    _worker_rollups = RollupStore(rollups_path) if rollups_path else None
+
+def _dashboard_growth(account):
+    """Compute one account's growth stats in a worker; returns (account, stats, error)."""
+    try:
+        return account, calculate_growth_stats(account, _worker_storage, _worker_windows, _worker_rollups), None
+    except Exception as e:
+        return account, None, str(e) or type(e).__name__
+
+def dashboard_accounts(items, storage):
+    """
+    Expand dashboard arguments into account names.
+
+    Args:
+        items (list): Account names or shell-style patterns such as '*' or
+            'news_*'; a trailing _stats.csv and any directory are ignored, so
+            '*_stats.csv' selects every account in the storage
+
+    Returns:
+        list: Sorted account names
+    """
+    known = None
+    accounts = set()
+    for item in items:
+        name = os.path.basename(item)
+        if name.endswith('_stats.csv'):
+            name = name[:-len('_stats.csv')]
+        if any(char in name for char in '*?['):
+            known = storage.accounts() if known is None else known
+            accounts.update(fnmatch.filter(known, name))
+        else:
+            accounts.add(name)
+    return sorted(accounts)
+
+class GrowthDashboard:
+    """
+    Growth stats for many accounts, computed in a process pool and cached.
+
+    An account is recomputed only when its storage signature (file size and mtime
+    for CSV files) has changed since the last refresh.
+    """
+
+    def __init__(self, storage_spec, windows=None, workers=None, rollups_path=None):
+        self.storage_spec = storage_spec
+        self.rollups_path = rollups_path
+        self.storage = open_storage(storage_spec)
+        self.windows = windows or DEFAULT_WINDOWS
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = None
+        self.cache = {}  # account -> (signature, stats, error)
+
+    def refresh(self, accounts):
+        """
+        Bring the cache up to date for accounts.
+
+        Returns:
+            int: Number of accounts recomputed
+        """
+        signatures = {account: self.storage.signature(account) for account in accounts}
+        changed = [account for account in accounts
+                   if account not in self.cache or self.cache[account][0] != signatures[account]]
+        for account in set(self.cache) - set(accounts):
+            del self.cache[account]
+
+        if self.workers > 1 and len(changed) > 1:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_dashboard_worker,
+                                                    initargs=(self.storage_spec, self.windows, self.rollups_path))
+            chunksize = max(1, len(changed) // (self.workers * 4))
+            results = self.executor.map(_dashboard_growth, changed, chunksize=chunksize)
+        else:
+            _init_dashboard_worker(self.storage_spec, self.windows, self.rollups_path)
+            results = map(_dashboard_growth, changed)
+
+        for account, stats, error in results:
+            self.cache[account] = (signatures[account], stats, error)
+        return len(changed)
+
+    def ranked(self, accounts, sort_key):
+        """Return (account, stats, error) for accounts, highest follower gain over sort_key first."""
+        entries = [(account,) + self.cache[account][1:] for account in accounts if account in self.cache]
+        return sorted(entries, key=lambda entry: (entry[1] is None,
+                                                  -(entry[1][sort_key]['fol_diff'] if entry[1] else 0), entry[0]))
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+def display_dashboard(ranked, windows, sort_key, recomputed, seconds, limit=None):
+    sort_label = next(label for key, label, _ in windows if key == sort_key)
+    print(f"{Fore.BLUE}Timestamp: {Style.BRIGHT}{datetime.now():%Y-%m-%d %H:%M:%S}")
+    print(f"{Fore.GREEN}{len(ranked):,} accounts ranked by {sort_label} growth "
+          f"({recomputed:,} recomputed in {seconds:.2f}s)")
+    print()
+
+    table_data = [["#", "Account", "Followers"] + [label for _, label, _ in windows] + [f"GR day ({sort_label})"]]
+    for rank, (account, stats, error) in enumerate(ranked[:limit], 1):
+        if stats is None:
+            reason = error or "not enough data"
+            table_data.append([rank, account, f"{Fore.RED}{reason}{Fore.CYAN}"] + [""] * (len(windows) + 1))
+            continue
+        table_data.append([rank, account, f"{stats['current_fol']:,}"]
+                          + [f"{Fore.YELLOW}{stats[key]['fol_diff']:,}{Fore.CYAN}" for key, _, _ in windows]
+                          + [f"{Fore.YELLOW}{int(stats[sort_key]['fol_rate']):>10,}{Fore.CYAN}"])
 
     table = tabulate(table_data, headers="firstrow", tablefmt="fancy_grid")
     print(f"{Fore.CYAN}{table}")
 
+def run_dashboard(args):
+    windows = parse_windows(args.windows) if args.windows else DEFAULT_WINDOWS
+    if args.sort_by not in [key for key, _, _ in windows] + [label for _, label, _ in windows]:
+        raise ValueError(f"--sort-by must be one of the windows: {', '.join(label for _, label, _ in windows)}")
+    sort_key = next(key for key, label, _ in windows if args.sort_by in (key, label))
+
+    dashboard = GrowthDashboard(args.storage, windows, args.workers, args.rollups)
+    try:
+        while True:
+            accounts = dashboard_accounts(args.dashboard, dashboard.storage)
+            start = time.perf_counter()
+            recomputed = dashboard.refresh(accounts)
+            seconds = time.perf_counter() - start
+
+            # Clear the console (works for both Windows and Unix-like systems)
+            print("\033[H\033[J", end="")
+            display_dashboard(dashboard.ranked(accounts, sort_key), windows, sort_key, recomputed, seconds, args.top)
+
+            if args.refresh is None:
+                break
+            time.sleep(args.refresh)
+    finally:
+        dashboard.close()
+
 def parse_args():
     parser = argparse.ArgumentParser(description='Calculate and display follower growth statistics')
-    parser.add_argument('account_name', help='Name of the account to analyze')
+    parser.add_argument('account_name', nargs='?', help='Name of the account to analyze')
     parser.add_argument('--refresh', type=int, metavar='SECONDS', nargs='?', const=10,
                       help='Enable refresh mode with optional interval in seconds (default: 10)')
     parser.add_argument('--plot', action='store_true',
                       help='Enable plotting of daily gains')
+    parser.add_argument('--plot-period', choices=sorted(PERIODS), default='day',
+                      help='Gain period for --plot: hour (last 24), day (last 7, default) or week (last 8)')
     parser.add_argument('--posts', action='store_true',
                       help='Show post statistics')
-    return parser.parse_args()
+    parser.add_argument('--storage', type=str, default='csv',
+                      help='Where the stats are stored: csv (<account>_stats.csv, default), csv:DIR or sqlite:PATH')
+    parser.add_argument('--memory', action='store_true',
+                      help='Show the size of the in-memory history')
+    parser.add_argument('--rollups', type=str, default=None, metavar='DB',
+                      help='Rollup database (see stats_rollup.py) to answer windows and plots longer than 7 days from')
+    parser.add_argument('--windows', type=str, default=None,
+                      help='Comma-separated periods to report, e.g. 10m,1h,24h,30d (default: 10m,1h,6h,24h,7d)')
+    parser.add_argument('--dashboard', nargs='+', metavar='ACCOUNT',
+                      help="Rank many accounts in one table; accepts names and patterns such as '*_stats.csv'")
+    parser.add_argument('--sort-by', type=str, default='daily',
+                      help='Window to rank the dashboard by, by key or label (default: daily)')
+    parser.add_argument('--top', type=int, default=None,
+                      help='Only show the top N dashboard accounts')
+    parser.add_argument('--workers', type=int, default=None,
+                      help='Dashboard worker processes (default: number of CPUs)')
+    args = parser.parse_args()
+    if args.account_name is None and not args.dashboard:
+        parser.error('an account_name or --dashboard is required')
+    return args
 
 def main():
     args = parse_args()
     
     try:
+        if args.dashboard:
+            run_dashboard(args)
+            return
+
+        storage = open_storage(args.storage)
+        rollups = RollupStore(args.rollups) if args.rollups else None
+        windows = parse_windows(args.windows) if args.windows else None
+        # One load serves both the growth table and the gain plot
+        seconds = history_seconds(windows or DEFAULT_WINDOWS, args.plot_period if args.plot else None)
+        # In refresh mode keep the loaded history and only read rows appended since the last tick
+        tail = storage.tail(args.account_name) if args.refresh is not None else None
+        history = None
         while True:
-            stats = calculate_growth_stats(args.account_name)
+            if tail is None:
+                history = load_growth_history(args.account_name, storage, seconds, rollups)
+            else:
+                rows, reset = tail.update() if history is not None else ([], True)
+                if reset:
+                    # Follow from the current end first; rows written during the load come back once
+                    tail.skip_to_end()
+                    try:
+                        history = load_growth_history(args.account_name, storage, seconds, rollups)
+                    except FileNotFoundError:
+                        history = StatsHistory()  # Wait for the first rows to be written
+                else:
+                    last = history.times[-1] if len(history) else None
+                    history.extend(row for row in rows if last is None or history.to_seconds(row[0]) > last)
+                    history.trim(seconds)
+            stats = growth_stats_from_history(history, windows)
 
             if stats is None:
                 print(f"{Fore.RED}Not enough data to calculate growth statistics.")
@@ -153,7 +325,10 @@ def main():
                     display_post_stats(stats)
 
                 if args.plot:
-                    plot_daily_gains(args.account_name)
+                    plot_daily_gains(args.account_name, storage, history, args.plot_period)
+
+                if args.memory:
+                    print(f"{Fore.CYAN}History in memory: {history.describe()}")
 
             if args.refresh is None:
                 break
@@ -169,23 +344,16 @@ def main():
     except Exception as e:
         print(f"{Fore.RED}An unexpected error occurred: {str(e)}")
 
-def plot_daily_gains(account_name):
-    csv_file = f'{account_name}_stats.csv'
-    data = []
-    with open(csv_file, 'r') as file:
-        reader = csv.DictReader(file)
-        timestamp_key = next(key for key in reader.fieldnames if 'time' in key.lower())
-        fol_key = next(key for key in reader.fieldnames if 'follower' in key.lower())
-        for row in reader:
-            timestamp = datetime.fromisoformat(row[timestamp_key].replace('Z', '+00:00'))
-            fol = row[fol_key]
-            if fol != 'N/A':
-                data.append((timestamp, int(fol)))
-
-    daily_gains = calculate_daily_gains(data)
-
-    print(f"\n{Fore.CYAN}Daily Follower Gains for {account_name}:")
-    print(f"{Fore.CYAN}{'Date':<12} {'Gain':<8} {'Chart'}")
+def plot_daily_gains(account_name, storage=None, history=None, period='day', rollups=None):
+    if history is None:
+        history = load_growth_history(account_name, storage, history_seconds(DEFAULT_WINDOWS, period), rollups)
+
+    daily_gains = gain_series(history, period)
+    title, label_format, _ = PERIODS[period]
+    width = 17 if period == 'hour' else 12
+
+    print(f"\n{Fore.CYAN}{title} Follower Gains for {account_name}:")
+    print(f"{Fore.CYAN}{'Date':<{width}} {'Gain':<8} {'Chart'}")
     print(f"{Fore.CYAN}{'-'*40}")
 
     max_gain = max(gain for _, gain in daily_gains)
@@ -194,7 +362,7 @@ def plot_daily_gains(account_name):
     for date, gain in daily_gains:
         bar_length = int(gain * scale_factor)
         bar = '█' * bar_length
-        print(f"{Fore.YELLOW}{date.strftime('%Y-%m-%d'):<12} {Fore.GREEN}{gain:<8} {Fore.BLUE}{bar}")
+        print(f"{Fore.YELLOW}{date.strftime(label_format):<{width}} {Fore.GREEN}{gain:<8} {Fore.BLUE}{bar}")
 
     print()
 
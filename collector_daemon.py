@@ -0,0 +1,368 @@
+#!/usr/bin/env python
+
+import json
+import time
+import asyncio
+import hashlib
+import logging
+import argparse
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from colorama import init, Fore, Style
+from stats_storage import open_storage, stats_row, stats_row_values
+from stats_history import StatsHistory, load_history
+from growth_engine import PERIODS, window_stats, gain_series, period_start
+from calculate_follower_growth import DEFAULT_WINDOWS, history_seconds, parse_windows
+from get_profile_stats import BrowserSession, fetch_profile, create_http_session, DEFAULT_BLOCKLIST
+from stage_timing import StageTimer, write_timings
+from fetch_scheduler import FetchScheduler, read_account_intervals, thread_local_fetcher
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+class AccountState:
+    """
+    An account's in-memory history and a version that changes with every new sample.
+
+    status_version changes with every fetch, successful or not, since the fetch
+    time and error shown in /accounts change then too.
+    """
+
+    def __init__(self, history):
+        self.history = history
+        self.version = 0
+        self.status_version = 0
+        self.fetched = None
+        self.error = None
+
+class ProfileFetcher:
+    """
+    Fetch one account's profile stats with a persistent browser session (or HTTP).
+
+    One fetcher is used per scheduler thread; fetch options are those of
+    get_profile_stats.fetch_profile.
+    """
+
+    def __init__(self, no_headless=False, http_session=None, lean_load=False, blocklist=None, storage=None,
+                 **fetch_options):
+        self.session = BrowserSession(no_headless, lean_load=lean_load, blocklist=blocklist)
+        self.http_session = http_session
+        self.storage = storage  # Timings are written next to its stats
+        self.fetch_options = fetch_options
+
+    def __call__(self, account):
+        timer = StageTimer()
+        stats = fetch_profile(self.session, f"https://x.com/{account}", self.http_session,
+                              timer=timer, **self.fetch_options)
+        write_timings(account, timer, self.storage, ok=bool(stats))
+        return stats
+
+    def close(self):
+        self.session.close()
+
+class CollectorDaemon:
+    """
+    Fetch accounts on a schedule and keep their histories in memory for the HTTP API.
+
+    Every fetched row is appended to storage first (CSV files or SQLite, never
+    rewritten) and then to the account's StatsHistory, so restarting the daemon
+    rebuilds the same state from disk. Only the history the growth windows and
+    gain series need is kept; older samples are trimmed as new ones arrive.
+
+    Fetches are scheduled by a FetchScheduler on its own event loop thread, so
+    each account can have its own interval within one global rate budget.
+    """
+
+    def __init__(self, accounts, storage, interval=60, windows=None, workers=1, fetcher_factory=None,
+                 intervals=None, rate=None, burst=None, jitter=0.1):
+        """
+        Args:
+            accounts (list): Account names to collect
+            storage: Storage backend rows are appended to and loaded from
+            interval (float): Seconds between fetches of an account
+            windows (list): (key, label, timedelta) growth windows (default: DEFAULT_WINDOWS)
+            workers (int): Fetch threads, each with its own fetcher
+            fetcher_factory (callable): Returns a fetcher, a callable account -> stats
+                dict or None with an optional close(); default: ProfileFetcher
+            intervals (dict): Per-account intervals overriding interval
+            rate (float): Global budget in fetches per second (default: no limit besides workers)
+            burst (float): Fetches the budget can save up
+            jitter (float): Random spread of each interval, as a fraction of it
+        """
+        self.accounts = list(dict.fromkeys(list(accounts) + list(intervals or {})))
+        self.storage = storage
+        self.interval = interval
+        self.intervals = {account: (intervals or {}).get(account, interval) for account in self.accounts}
+        self.windows = windows or DEFAULT_WINDOWS
+        self.workers = workers
+        self.fetcher_factory = fetcher_factory or ProfileFetcher
+        self.rate = rate
+        self.burst = burst
+        self.jitter = jitter
+        # Enough for the windows and the longest default gain series
+        self.keep_seconds = max(history_seconds(self.windows, period) for period in PERIODS)
+        self.lock = threading.Lock()
+        self.states = {}
+        self.scheduler = None
+        self.thread = None
+        self.started = time.time()
+
+    def load(self):
+        """Rebuild every account's history from storage."""
+        for account in self.accounts:
+            try:
+                history = load_history(account, self.storage, self.keep_seconds)
+            except FileNotFoundError:
+                history = StatsHistory()
+            with self.lock:
+                self.states[account] = AccountState(history)
+            logger.info(f"Loaded {account}: {history.describe()}")
+
+    def record(self, account, stats):
+        """Append a fetched row to storage, then to the account's in-memory history."""
+        row = stats_row(stats)
+        self.storage.append(account, [row])
+        with self.lock:
+            state = self.states[account]
+            state.history.extend([stats_row_values(row)])
+            state.history.trim(self.keep_seconds)
+            state.version += 1
+
+    def on_fetch(self, account, stats, error):
+        """Record a fetch result; called by the scheduler in its worker thread."""
+        if stats:
+            self.record(account, stats)
+        with self.lock:
+            state = self.states[account]
+            state.fetched = datetime.now()
+            state.error = error
+            state.status_version += 1
+        logger.info(f"{account}: {'ok' if stats else error}")
+
+    def start(self):
+        """Start the scheduler thread; every account's first fetch is spread over its interval."""
+        fetch = thread_local_fetcher(self.fetcher_factory)
+        self.scheduler = FetchScheduler(fetch, self.intervals, self.rate, self.burst, self.jitter,
+                                        self.workers, on_result=self.on_fetch)
+
+        def run():
+            try:
+                asyncio.run(self.scheduler.run())
+            finally:
+                fetch.close()
+
+        self.thread = threading.Thread(target=run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Stop scheduling and wait for the fetches in flight."""
+        if self.thread is not None:
+            self.scheduler.stop()
+            self.thread.join()
+            self.thread = None
+
+    def version(self, account):
+        with self.lock:
+            return self.states[account].version
+
+    def summary_version(self):
+        """Return a value that changes whenever summary() does: every account's sample and status versions."""
+        with self.lock:
+            return tuple((state.version, state.status_version) for state in self.states.values())
+
+    def growth(self, account):
+        """Return the account's growth stats (see window_stats) as JSON-ready data, or None."""
+        with self.lock:
+            stats = window_stats(self.states[account].history, self.windows)
+        if stats is None:
+            return None
+        result = {
+            'current_time': stats['current_time'].isoformat(),
+            'current_fol': stats['current_fol'],
+            'current_posts': stats['current_posts'],
+            'windows': [],
+        }
+        for key, label in stats['windows']:
+            result['windows'].append(dict(stats[key], key=key, label=label))
+        return result
+
+    def gains(self, account, period='day', count=None):
+        """Return the account's follower gains per period (see gain_series) as JSON-ready data."""
+        with self.lock:
+            series = gain_series(self.states[account].history, period, count)
+        return [{'start': start.isoformat(), 'gain': gain} for start, gain in series]
+
+    def summary(self):
+        """Return one entry per account: latest sample, fetch status and version."""
+        accounts = []
+        with self.lock:
+            for account, state in self.states.items():
+                history = state.history
+                latest = len(history) - 1
+                accounts.append({
+                    'account': account,
+                    'samples': len(history),
+                    'latest_time': history.datetime_at(latest).isoformat() if len(history) else None,
+                    'followers': history.followers[latest] if len(history) else None,
+                    'posts': history.posts[latest] if len(history) else None,
+                    'last_fetch': state.fetched.isoformat() if state.fetched else None,
+                    'error': state.error,
+                    'version': state.version,
+                })
+        return accounts
+
+class StatsRequestHandler(BaseHTTPRequestHandler):
+    """
+    JSON API over a CollectorDaemon.
+
+    GET /accounts                              -> summary of every account
+    GET /accounts/<name>/growth                -> growth stats per window
+    GET /accounts/<name>/gains?period=day&count=7 -> follower gains per hour, day or week
+
+    Responses carry an ETag built from the account's version (and the current
+    period for gains) and are cached until it changes; a matching If-None-Match
+    gets 304 Not Modified without a body.
+    """
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        parts = [part for part in url.path.split('/') if part]
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        daemon = self.server.daemon
+        try:
+            if parts == ['accounts']:
+                self.respond(('accounts',), daemon.summary_version(), daemon.summary)
+            elif len(parts) == 3 and parts[0] == 'accounts' and parts[1] in daemon.states:
+                account = parts[1]
+                if parts[2] == 'growth':
+                    self.respond(('growth', account), daemon.version(account), lambda: daemon.growth(account))
+                elif parts[2] == 'gains':
+                    period = query.get('period', 'day')
+                    if period not in PERIODS:
+                        raise ValueError(f"period must be one of {', '.join(PERIODS)}")
+                    count = int(query['count']) if 'count' in query else None
+                    # Gains also change when a new period starts
+                    current = period_start(datetime.now(), period).isoformat()
+                    self.respond(('gains', account, period, count), (current, daemon.version(account)),
+                                 lambda: daemon.gains(account, period, count))
+                else:
+                    self.send_json(404, {'error': 'not found'})
+            elif parts == ['health']:
+                health = {'status': 'ok', 'accounts': len(daemon.states),
+                          'uptime': round(time.time() - daemon.started, 1)}
+                if daemon.scheduler is not None:
+                    health['schedule'] = daemon.scheduler.report()
+                self.send_json(200, health)
+            else:
+                self.send_json(404, {'error': 'not found'})
+        except ValueError as e:
+            self.send_json(400, {'error': str(e)})
+
+    def respond(self, key, version, compute):
+        """
+        Send the response for key at version, computing it only if the cached one is older.
+
+        Clients sending the current ETag in If-None-Match get 304. The daemon's start
+        time is part of the ETag, so versions restarting from 0 never match old ones.
+        """
+        tag = repr((self.server.daemon.started, key, version)).encode('utf-8')
+        etag = f'"{hashlib.sha1(tag).hexdigest()[:20]}"'
+        if etag in [value.strip() for value in self.headers.get('If-None-Match', '').split(',')]:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        cache = self.server.response_cache
+        cached = cache.get(key)
+        if cached is None or cached[0] != etag:
+            cached = (etag, json.dumps(compute()).encode('utf-8'))
+            cache[key] = cached
+        self.send_body(200, cached[1], etag)
+
+    def send_json(self, status, data):
+        self.send_body(status, json.dumps(data).encode('utf-8'))
+
+    def send_body(self, status, body, etag=None):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if etag:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+def create_server(daemon, host='127.0.0.1', port=8765):
+    """Create the HTTP server for a daemon; call serve_forever() on it."""
+    server = ThreadingHTTPServer((host, port), StatsRequestHandler)
+    server.daemon = daemon
+    server.response_cache = {}
+    return server
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Collect profile stats on a schedule and serve growth analytics over HTTP')
+    parser.add_argument('accounts', nargs='*', help='Account names to collect')
+    parser.add_argument('--accounts-file', type=str, default=None,
+                        help="File with one account per line and an optional interval, e.g. 'elonmusk 1m'")
+    parser.add_argument('-i', '--interval', type=float, default=60,
+                        help='Seconds between fetches of accounts without their own interval (default: 60)')
+    parser.add_argument('-w', '--workers', type=int, default=1, help='Concurrent fetch workers (default: 1)')
+    parser.add_argument('--rate', type=float, default=None,
+                        help='Global fetch budget in fetches per second (default: no limit besides --workers)')
+    parser.add_argument('--burst', type=float, default=None,
+                        help="Fetches the --rate budget can save up (default: one second's worth, at least 1)")
+    parser.add_argument('--jitter', type=float, default=0.1,
+                        help='Random spread of each interval, as a fraction of it (default: 0.1)')
+    parser.add_argument('--storage', type=str, default='csv',
+                        help='Where rows are appended: csv (<account>_stats.csv, default), csv:DIR or sqlite:PATH')
+    parser.add_argument('--windows', type=str, default=None,
+                        help='Comma-separated growth periods, e.g. 10m,1h,24h,30d (default: 10m,1h,6h,24h,7d)')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='Address to serve on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='Port to serve on (default: 8765)')
+    parser.add_argument('--backend', choices=['selenium', 'http'], default='selenium',
+                        help='Fetch with headless Chrome, or with plain HTTP requests that fall back to Chrome (default: selenium)')
+    parser.add_argument('--no-headless', action='store_true', help='Show the browser windows')
+    parser.add_argument('--lean-load', action='store_true',
+                        help='Block images, media, fonts and tracking domains while loading profiles')
+    args = parser.parse_args()
+    if not args.accounts and not args.accounts_file:
+        parser.error('provide at least one account or --accounts-file')
+    return args
+
+def main():
+    init(autoreset=True)  # Initialize colorama
+    args = parse_args()
+
+    intervals = read_account_intervals(args.accounts_file, args.interval) if args.accounts_file else {}
+    http_session = create_http_session(pool_size=args.workers) if args.backend == 'http' else None
+    windows = parse_windows(args.windows) if args.windows else None
+
+    storage = open_storage(args.storage)
+
+    def fetcher_factory():
+        return ProfileFetcher(args.no_headless, http_session, lean_load=args.lean_load,
+                              blocklist=list(DEFAULT_BLOCKLIST), storage=storage, save_html=False)
+
+    daemon = CollectorDaemon(args.accounts, storage, args.interval, windows,
+                             args.workers, fetcher_factory, intervals, args.rate, args.burst, args.jitter)
+    daemon.load()
+    server = create_server(daemon, args.host, args.port)
+    daemon.start()
+    budget = f" within {args.rate:g} fetches/s" if args.rate else ""
+    print(f"{Fore.GREEN}Collecting {Style.BRIGHT}{len(daemon.accounts)}{Style.NORMAL} accounts{budget}; "
+          f"serving on http://{args.host}:{args.port}/accounts")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n{Fore.YELLOW}Collector stopped.")
+    finally:
+        server.server_close()
+        daemon.stop()
+
+if __name__ == "__main__":
+    main()
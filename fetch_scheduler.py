@@ -0,0 +1,297 @@
+#!/usr/bin/env python
+
+import time
+import heapq
+import random
+import asyncio
+import logging
+import argparse
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from colorama import init, Fore, Style
+from stage_timing import percentile
+
+logger = logging.getLogger(__name__)
+
+INTERVAL_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+# Seconds between fetches of an account when no interval is given
+DEFAULT_INTERVAL = 3600
+
+# Schedule lags kept for the percentiles in FetchScheduler.report
+LAG_SAMPLES = 10000
+
+def parse_interval(text):
+    """Parse an interval such as '90', '90s', '5m', '1h' or '1d' into seconds."""
+    text = text.strip().lower()
+    scale = INTERVAL_UNITS.get(text[-1:], None)
+    try:
+        seconds = float(text[:-1] if scale else text) * (scale or 1)
+    except ValueError:
+        seconds = 0
+    if seconds <= 0:
+        raise ValueError(f"Invalid interval '{text}' (use seconds or e.g. 30s, 5m, 1h)")
+    return seconds
+
+def read_account_intervals(path, default_interval):
+    """
+    Read accounts and their polling intervals from a file.
+
+    Each line holds an account name and optionally an interval ('elonmusk 1m',
+    'smallaccount 1h'); blank lines and # comments are ignored.
+
+    Returns:
+        dict: account -> interval in seconds (default_interval where none is given)
+    """
+    intervals = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            fields = line.split('#', 1)[0].split()
+            if fields:
+                interval = parse_interval(fields[1]) if len(fields) > 1 else default_interval
+                intervals[fields[0].lstrip('@')] = interval
+    return intervals
+
+class TokenBucket:
+    """
+    Global request budget: rate tokens per second, up to burst saved for later.
+
+    Only the scheduler's dispatch loop takes tokens, so no locking is needed.
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        self._refill()
+        while self.tokens < 1:
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+            self._refill()
+        self.tokens -= 1
+
+class FetchScheduler:
+    """
+    Poll many accounts at their own intervals within one global request budget.
+
+    Next-due times are kept in a heap, so the dispatch loop sleeps until exactly
+    the next due account; an idle scheduler with thousands of accounts costs one
+    timer. Due accounts take a token from the TokenBucket and are fetched by the
+    blocking fetch function in a thread pool, at most workers at a time. An
+    account is rescheduled one interval (+/- jitter) after its due time once its
+    fetch has finished, so it is never fetched twice at once.
+
+    Schedule lag, how long after its due time each fetch started, is recorded
+    and logged every report_interval seconds.
+    """
+
+    def __init__(self, fetch, intervals, rate=None, burst=None, jitter=0.1, workers=4, report_interval=60,
+                 on_result=None):
+        """
+        Args:
+            fetch (callable): Blocking function account -> result, run in worker threads
+            intervals (dict): account -> seconds between fetches
+            rate (float): Global budget in fetches per second (default: no limit besides workers)
+            burst (float): Fetches the budget can save up (default: one second's worth, at least 1)
+            jitter (float): Random spread of each interval, as a fraction of it
+            workers (int): Concurrent fetch threads
+            report_interval (float): Seconds between lag reports in the log, 0 to disable
+            on_result (callable): Called in the worker thread as on_result(account, result, error)
+                after every fetch; error is None on success
+        """
+        self.fetch = fetch
+        self.intervals = dict(intervals)
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.jitter = jitter
+        self.workers = workers
+        self.report_interval = report_interval
+        self.heap = []
+        self.lags = deque(maxlen=LAG_SAMPLES)
+        self.counts = {'dispatched': 0, 'completed': 0, 'failed': 0}
+        self.in_flight = 0
+        self.loop = None
+        self.wakeup = None
+        self.stopping = False
+        self.on_result = on_result
+
+    def _jittered(self, interval):
+        return interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def _push(self, due, account):
+        heapq.heappush(self.heap, (due, account))
+        self.wakeup.set()
+
+    def stop(self):
+        """Ask run() to return after the fetches in flight; safe to call from other threads."""
+        self.stopping = True
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.wakeup.set)
+
+    async def run(self, duration=None):
+        """
+        Dispatch fetches until stop() is called or duration seconds have passed.
+
+        Each account's first fetch is spread at random over its first interval.
+        """
+        self.loop = asyncio.get_running_loop()
+        self.wakeup = asyncio.Event()
+        now = time.time()
+        self.heap = [(now + random.uniform(0, interval), account) for account, interval in self.intervals.items()]
+        heapq.heapify(self.heap)
+        end = time.time() + duration if duration is not None else None
+        slots = asyncio.Semaphore(self.workers)
+        tasks = set()
+        reporter = asyncio.create_task(self._report_loop()) if self.report_interval else None
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            try:
+                while not self.stopping and (end is None or time.time() < end):
+                    wait = self.heap[0][0] - time.time() if self.heap else None
+                    if end is not None:
+                        wait = min(wait, end - time.time()) if wait is not None else end - time.time()
+                    if wait is None or wait > 0:
+                        self.wakeup.clear()
+                        try:
+                            await asyncio.wait_for(self.wakeup.wait(), wait)
+                        except asyncio.TimeoutError:
+                            pass
+                        continue
+                    await slots.acquire()
+                    if self.bucket is not None:
+                        await self.bucket.acquire()
+                    # stop() may have been called while waiting for a slot or a token
+                    if self.stopping or (end is not None and time.time() >= end):
+                        slots.release()
+                        break
+                    due, account = heapq.heappop(self.heap)
+                    self.lags.append(time.time() - due)
+                    self.counts['dispatched'] += 1
+                    self.in_flight += 1
+                    task = asyncio.create_task(self._fetch(executor, slots, account, due))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                if tasks:
+                    await asyncio.gather(*tasks)
+            finally:
+                if reporter is not None:
+                    reporter.cancel()
+        self.loop = None
+
+    async def _fetch(self, executor, slots, account, due):
+        try:
+            result = await self.loop.run_in_executor(executor, self._call, account)
+            self.counts['completed' if result is not None else 'failed'] += 1
+        finally:
+            self.in_flight -= 1
+            slots.release()
+        if account in self.intervals and not self.stopping:
+            self._push(max(due + self._jittered(self.intervals[account]), time.time()), account)
+
+    def _call(self, account):
+        """Run the fetch in a worker thread; returns its result, or None if it failed."""
+        try:
+            result = self.fetch(account)
+            error = None if result else "no result"
+        except Exception as e:
+            result, error = None, str(e) or type(e).__name__
+            logger.error(f"Error fetching {account}: {error}")
+        if self.on_result is not None:
+            try:
+                self.on_result(account, result, error)
+            except Exception as e:
+                logger.error(f"Error handling the result for {account}: {e}")
+                result = None
+        return result or None
+
+    async def _report_loop(self):
+        while True:
+            await asyncio.sleep(self.report_interval)
+            logger.info(self.format_report())
+
+    def report(self):
+        """
+        Return schedule statistics.
+
+        Returns:
+            dict: accounts, dispatched, completed, failed, in_flight, overdue (accounts
+            past their due time) and lag p50/p95/p99/max in seconds
+        """
+        now = time.time()
+        lags = list(self.lags)
+        report = dict(self.counts, accounts=len(self.intervals), in_flight=self.in_flight,
+                      overdue=sum(1 for due, _ in self.heap if due <= now))
+        for p in (50, 95, 99):
+            report[f'lag_p{p}'] = percentile(lags, p) or 0.0
+        report['lag_max'] = max(lags, default=0.0)
+        return report
+
+    def format_report(self):
+        report = self.report()
+        return (f"Schedule: {report['accounts']} accounts, {report['dispatched']} fetches "
+                f"({report['failed']} failed), {report['in_flight']} in flight, {report['overdue']} overdue, "
+                f"lag p50 {report['lag_p50']:.3f}s p95 {report['lag_p95']:.3f}s "
+                f"p99 {report['lag_p99']:.3f}s max {report['lag_max']:.3f}s")
+
+def thread_local_fetcher(factory):
+    """
+    Wrap a fetcher factory so each worker thread gets its own fetcher.
+
+    Browser sessions can't be shared between threads; the returned function
+    creates one per thread on first use. close() closes all of them.
+    """
+    local = threading.local()
+    fetchers = []
+    lock = threading.Lock()
+
+    def fetch(account):
+        fetcher = getattr(local, 'fetcher', None)
+        if fetcher is None:
+            fetcher = local.fetcher = factory()
+            with lock:
+                fetchers.append(fetcher)
+        return fetcher(account)
+
+    def close():
+        with lock:
+            for fetcher in fetchers:
+                if hasattr(fetcher, 'close'):
+                    fetcher.close()
+            fetchers.clear()
+
+    fetch.close = close
+    return fetch
+
+if __name__ == "__main__":
+    init(autoreset=True)  # Initialize colorama
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description='Simulate the fetch scheduler with many accounts and a dummy fetch')
+    parser.add_argument('--accounts', type=int, default=5000, help='Number of simulated accounts (default: 5000)')
+    parser.add_argument('--fast', type=float, default=0.02,
+                        help='Fraction of accounts polled at --fast-interval, the rest at --slow-interval (default: 0.02)')
+    parser.add_argument('--fast-interval', type=str, default='1m', help='Interval of the high-value accounts (default: 1m)')
+    parser.add_argument('--slow-interval', type=str, default='1h', help='Interval of the long-tail accounts (default: 1h)')
+    parser.add_argument('--rate', type=float, default=10, help='Global fetch budget per second (default: 10)')
+    parser.add_argument('--fetch-seconds', type=float, default=0.05, help='Duration of each dummy fetch (default: 0.05)')
+    parser.add_argument('-w', '--workers', type=int, default=4, help='Fetch threads (default: 4)')
+    parser.add_argument('--duration', type=float, default=30, help='Seconds to run (default: 30)')
+    args = parser.parse_args()
+
+    fast_count = int(args.accounts * args.fast)
+    intervals = {f"account{i}": parse_interval(args.fast_interval if i < fast_count else args.slow_interval)
+                 for i in range(args.accounts)}
+    scheduler = FetchScheduler(lambda account: time.sleep(args.fetch_seconds) or True, intervals,
+                               rate=args.rate, workers=args.workers, report_interval=0)
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    asyncio.run(scheduler.run(args.duration))
+    cpu, wall = time.process_time() - cpu_start, time.perf_counter() - wall_start
+    print(f"{Fore.CYAN}{scheduler.format_report()}")
+    print(f"{Fore.GREEN}{Style.BRIGHT}{scheduler.counts['dispatched'] / wall:.1f}{Style.NORMAL} fetches/s, "
+          f"CPU {cpu:.2f}s over {wall:.1f}s ({cpu / wall:.1%})")
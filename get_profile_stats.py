@@ -2,22 +2,35 @@ from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.common.action_chains import ActionChains
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
-from html_sources.extract_interaction import extract_interaction
-from html_sources.extract_post_count import extract_post_count
+from html_sources.profile_extractor import extract_profile_fields
+from stage_timing import StageTimer, write_timings, print_timing_summary, percentile
+from stats_storage import CsvStorage, open_storage, stats_row
+from stats_rollup import RollupStore, RollupStorage
+from fetch_scheduler import FetchScheduler, DEFAULT_INTERVAL, read_account_intervals, thread_local_fetcher
 import logging
 import traceback
 import time
 import re
-import csv
-from datetime import datetime
+import json
 import os
 import argparse
+import asyncio
 import shutil
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from colorama import init, Fore, Style
+import requests
+from requests.adapters import HTTPAdapter
 # traceback
 
+try:
+    import psutil
+except ImportError:  # Memory-based recycling is disabled without psutil
+    psutil = None
+
 
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -29,30 +42,46 @@ def log_with_limit(message, limit=1000):
         message = message[:limit] + "... (truncated)"
     logger.info(message)
 
+def write_stats(username, stats, storage=None):
+    """Append one fetched row to the storage backend (default: {username}_stats.csv)."""
+    storage = storage if storage is not None else CsvStorage()
+    storage.append(username, [stats_row(stats)])
+    log_with_limit(f"Data written to {storage.describe(username)}")
+
 def write_to_csv(username, stats):
-    filename = f"{username}_stats.csv"
-    current_time = datetime.now().isoformat()
-    
-    file_exists = os.path.isfile(filename)
-    
-    with open(filename, 'a', newline='') as csvfile:
-        fieldnames = ['datetime', 'posts', 'following', 'followers']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        
-        if not file_exists:
-            writer.writeheader()
-        
-        writer.writerow({
-            'datetime': current_time,
-            'posts': stats.get('posts', ''),
-            'following': stats.get('following', ''),
-            'followers': stats.get('followers', '')
-        })
-    
-    log_with_limit(f"Data written to {filename}")
+    write_stats(username, stats, CsvStorage())
+
+_chromedriver_path = None
+
+def get_chromedriver_path():
+    """Resolve the ChromeDriver binary once per process instead of once per browser start."""
+    global _chromedriver_path
+    if _chromedriver_path is None:
+        _chromedriver_path = ChromeDriverManager().install()
+    return _chromedriver_path
+
+# Resources the extractors never read: images, media, fonts and third-party trackers
+DEFAULT_BLOCKLIST = [
+    '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.avif', '*.ico',
+    '*.mp4', '*.m3u8', '*.m4s', '*.webm',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*pbs.twimg.com/*', '*video.twimg.com/*',
+    '*google-analytics.com/*', '*googletagmanager.com/*', '*doubleclick.net/*',
+    '*ads-twitter.com/*', '*ads-api.twitter.com/*', '*analytics.twitter.com/*',
+]
 
-def initialize_browser(no_headless=False):
-    """Initialize and return a Chrome WebDriver instance."""
+def read_blocklist_file(path):
+    """Read URL block patterns from a file, one per line. Blank lines and # comments are ignored."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.split('#', 1)[0].strip() for line in f if line.split('#', 1)[0].strip()]
+
+def initialize_browser(no_headless=False, lean_load=False, blocklist=None):
+    """
+    Initialize and return a Chrome WebDriver instance.
+
+    With lean_load, images are disabled and requests matching blocklist (default:
+    DEFAULT_BLOCKLIST) are blocked at the protocol level via the DevTools Network domain.
+    """
     options = webdriver.ChromeOptions()
     
     # Essential options for stability
@@ -64,10 +93,21 @@ def initialize_browser(no_headless=False):
     if not no_headless:
         options.add_argument('--headless=new')  # Use new headless mode
 
+    # Network events in the performance log give the bytes transferred per fetch
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    if lean_load:
+        options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+
     try:
         # Use WebDriverManager to handle driver installation
-        service = ChromeService(ChromeDriverManager().install())
+        service = ChromeService(get_chromedriver_path())
         driver = webdriver.Chrome(service=service, options=options)
+
+        if lean_load:
+            patterns = DEFAULT_BLOCKLIST if blocklist is None else blocklist
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+            log_with_limit(f"Lean load enabled, blocking {len(patterns)} URL patterns")
         
         # Quick test to verify connection
         driver.get('about:blank')
@@ -80,48 +120,237 @@ def initialize_browser(no_headless=False):
         logger.error(traceback.format_exc())
         return None
 
-def get_profile_stats(driver, url):
-    """Fetch profile stats from X/Twitter profile."""
+def read_transfer_stats(driver):
+    """
+    Summarize network activity from the Chrome performance log since the last call.
+
+    Returns:
+        dict: bytes (encoded bytes received), requests (finished) and blocked
+        (requests refused by the blocklist), or None if the log is unavailable
+    """
+    try:
+        entries = driver.get_log('performance')
+    except Exception as e:
+        log_with_limit(f"Performance log unavailable: {e}")
+        return None
+
+    transfer = {'bytes': 0, 'requests': 0, 'blocked': 0}
+    for entry in entries:
+        message = json.loads(entry['message']).get('message', {})
+        method = message.get('method')
+        if method == 'Network.loadingFinished':
+            transfer['bytes'] += int(message['params'].get('encodedDataLength', 0))
+            transfer['requests'] += 1
+        elif method == 'Network.loadingFailed' and message['params'].get('blockedReason'):
+            transfer['blocked'] += 1
+    return transfer
+
+class BrowserSession:
+    """Keep one Chrome WebDriver alive across fetches, recycling it when needed."""
+
+    def __init__(self, no_headless=False, max_fetches=50, max_memory_mb=None, lean_load=False, blocklist=None):
+        self.no_headless = no_headless
+        self.max_fetches = max_fetches
+        self.max_memory_mb = max_memory_mb
+        self.lean_load = lean_load
+        self.blocklist = blocklist
+        self.driver = None
+        self.fetch_count = 0
+
+    def get_driver(self):
+        """Return a healthy driver, starting or recycling Chrome as needed."""
+        if self.driver is not None:
+            reason = self.recycle_reason()
+            if reason:
+                log_with_limit(f"Recycling WebDriver: {reason}")
+                self.close()
+        if self.driver is None:
+            self.driver = initialize_browser(self.no_headless, self.lean_load, self.blocklist)
+            self.fetch_count = 0
+        return self.driver
+
+    def recycle_reason(self):
+        """Return why the current driver should be replaced, or None if it can be reused."""
+        if self.max_fetches and self.fetch_count >= self.max_fetches:
+            return f"reached {self.fetch_count} fetches"
+        if not self.is_healthy():
+            return "driver is not responding"
+        if self.max_memory_mb:
+            memory_mb = self.memory_usage_mb()
+            if memory_mb is not None and memory_mb > self.max_memory_mb:
+                return f"memory usage {memory_mb:.0f} MB above {self.max_memory_mb} MB"
+        return None
+
+    def is_healthy(self):
+        """Check that the browser still answers WebDriver commands."""
+        if self.driver is None:
+            return False
+        try:
+            self.driver.execute_script('return 1')
+            return True
+        except Exception:
+            return False
+
+    def memory_usage_mb(self):
+        """Return the resident memory of chromedriver and its Chrome processes in MB."""
+        if psutil is None or self.driver is None:
+            return None
+        try:
+            process = psutil.Process(self.driver.service.process.pid)
+            processes = [process] + process.children(recursive=True)
+            return sum(p.memory_info().rss for p in processes) / (1024 * 1024)
+        except (AttributeError, psutil.Error):
+            return None
+
+    def close(self):
+        """Quit the current driver, if any."""
+        if self.driver is None:
+            return
+        try:
+            self.driver.quit()
+        except Exception as e:
+            log_with_limit(f"Error closing WebDriver: {e}")
+        self.driver = None
+        log_with_limit("WebDriver closed")
+
+def fetch_with_session(session, url, timer=None, **fetch_options):
+    """
+    Fetch profile stats through a BrowserSession, restarting Chrome once if it crashed.
+    Browser startup and the fetch stages are recorded on timer. Extra keyword
+    arguments are passed on to get_profile_stats.
+    """
+    timer = timer if timer is not None else StageTimer()
+    profile_stats = None
+    for attempt in range(2):
+        with timer.stage('browser_startup'):
+            driver = session.get_driver()
+        if not driver:
+            break
+
+        profile_stats = get_profile_stats(driver, url, timer=timer, **fetch_options)
+        session.fetch_count += 1
+
+        if profile_stats is not None or session.is_healthy():
+            break
+        log_with_limit("WebDriver crashed during fetch, restarting browser")
+        session.close()
+    return profile_stats
+
+# Returns the first stats marker present in the DOM, or null while the profile is still loading
+PROFILE_READY_SCRIPT = """
+    if (document.readyState !== 'complete') {
+        return null;
+    }
+    var scripts = document.querySelectorAll('script[type="application/ld+json"]');
+    for (var i = 0; i < scripts.length; i++) {
+        if (scripts[i].textContent.indexOf('userInteractionCount') !== -1) {
+            return 'json-ld';
+        }
+    }
+    if (document.querySelector('a[href$="/followers"] span, a[href$="/verified_followers"] span')) {
+        return 'followers-link';
+    }
+    var text = document.body ? document.body.textContent : '';
+    if (text.indexOf("This account doesn't exist") !== -1 || text.indexOf('These tweets are protected') !== -1) {
+        return 'unavailable';
+    }
+    return null;
+"""
+
+def wait_for_profile_ready(driver, timeout=10, poll_frequency=0.1):
+    """
+    Wait until the profile stats markers are in the DOM, up to timeout seconds.
+
+    Returns:
+        tuple: (marker, seconds) where marker is 'json-ld', 'followers-link',
+        'unavailable' or None if the timeout expired
+    """
+    start = time.perf_counter()
     try:
-        driver.get(url)
-        WebDriverWait(driver, 10).until(
-            lambda d: d.execute_script('return document.readyState') == 'complete'
+        marker = WebDriverWait(driver, timeout, poll_frequency=poll_frequency).until(
+            lambda d: d.execute_script(PROFILE_READY_SCRIPT)
         )
-        time.sleep(2)  # Wait for dynamic content
+    except TimeoutException:
+        marker = None
+    return marker, time.perf_counter() - start
+
+def get_profile_stats(driver, url, save_html=True, ready_timeout=10, timer=None):
+    """
+    Fetch profile stats from X/Twitter profile.
+
+    Waits only until the stats markers appear (at most ready_timeout seconds). The page
+    source is read from the browser once and handed to the extractors in memory. With
+    save_html the snapshot is written to html_sources/ in the background. Each stage
+    is recorded on timer when one is given.
+    """
+    timer = timer if timer is not None else StageTimer()
+    try:
+        read_transfer_stats(driver)  # Discard network events from earlier pages
+        with timer.stage('navigate'):
+            driver.get(url)
+        load_seconds = timer.get('navigate')
+        marker, ready_seconds = wait_for_profile_ready(driver, ready_timeout)
+        timer.add('ready_wait', ready_seconds)
+        if marker:
+            log_with_limit(f"Profile ready after {ready_seconds:.2f}s (marker: {marker})")
+        else:
+            log_with_limit(f"Profile markers not found within {ready_timeout}s, extracting what is loaded")
+
+        # Get the complete page source including dynamic content
+        with timer.stage('page_source'):
+            page_source = driver.execute_script("return document.documentElement.outerHTML;")
 
-        if "This account doesn't exist" in driver.page_source:
+        if "This account doesn't exist" in page_source:
             logger.error("Profile not accessible: Account doesn't exist")
             return None
 
-        if "These tweets are protected" in driver.page_source:
+        if "These tweets are protected" in page_source:
             logger.error("Profile not accessible: Protected tweets")
             return None
 
-        # Save profile HTML first to get accurate counts
-        html_file = save_profile_html(driver, driver.current_url.split('/')[-1])
+        if save_html:
+            snapshot_profile_html(driver.current_url.split('/')[-1], page_source)
         
-        # Get post count first using extract_post_count
-        posts_count = extract_post_count(html_file, debug=True)
-        if posts_count:
-            stats = {'posts': posts_count}
+        # One pass over the page finds the post count and userInteractionCount together
+        with timer.stage('extract'):
+            fields = extract_profile_fields(page_source)
+        log_with_limit(f"Fields found in page source: {fields}")
+        sources = {}
+        if fields.get('posts'):
+            stats = {'posts': fields['posts']}
+            sources['posts'] = 'json-ld'
         else:
             stats = {}
             
-        # Get additional stats from visible elements
-        xpath_stats = find_stats_by_xpath(driver)
-        if xpath_stats:
-            # Only use xpath stats for values we don't already have
-            for key, value in xpath_stats.items():
-                if key not in stats or not stats[key]:
-                    stats[key] = value
+        # Get additional stats from visible elements in a single in-page query
+        with timer.stage('dom_query'):
+            page_stats, page_sources = find_stats_in_page(driver)
+        # Only use in-page stats for values we don't already have
+        for key, value in page_stats.items():
+            if key not in stats or not stats[key]:
+                stats[key] = value
+                if key in page_sources:
+                    sources[key] = page_sources[key]
         
         # Update followers count if we can get it from userInteractionCount
-        followers_count = extract_interaction(html_file)
+        followers_count = fields.get('followers')
         if followers_count:
             stats['followers'] = followers_count
+            sources['followers'] = 'json-ld'
             log_with_limit(f"Updated followers count from userInteractionCount: {followers_count}")
 
         if stats and ('followers' in stats):  # As long as we have followers, return what we found
+            stats['html_source'] = page_source
+            stats['sources'] = sources
+            log_with_limit(f"Stat sources: {sources}")
+            stats['ready_seconds'] = ready_seconds
+            stats['ready_marker'] = marker
+            stats['load_seconds'] = load_seconds
+            transfer = read_transfer_stats(driver)
+            if transfer:
+                stats['transfer_bytes'] = transfer['bytes']
+                log_with_limit(f"Page load {load_seconds:.2f}s, {transfer['bytes']:,} bytes in "
+                               f"{transfer['requests']} requests, {transfer['blocked']} blocked")
             return stats
 
         return None
@@ -129,66 +358,176 @@ def get_profile_stats(driver, url):
         logger.error(f"Error fetching profile stats: {e}")
         return None
 
-def get_hover_text(driver, element):
-    """Get the title attribute or hover text from an element."""
+HTTP_HEADERS = {
+    'User-Agent': ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                   '(KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36'),
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+
+def create_http_session(pool_size=4):
+    """
+    Create a requests session with a keep-alive connection pool for browserless fetches.
+
+    One session is shared by all fetch_batch workers, so pool_size should match the
+    worker count. Sharing is safe here: the workers only issue GETs, urllib3's pool
+    hands each thread its own connection, and no per-request state (headers, auth)
+    is changed on the session after it is created.
+    """
+    http_session = requests.Session()
+    http_session.headers.update(HTTP_HEADERS)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    http_session.mount('https://', adapter)
+    http_session.mount('http://', adapter)
+    return http_session
+
+def get_profile_stats_http(http_session, url, save_html=True, timeout=10, timer=None):
+    """
+    Fetch profile stats with a plain HTTP request, without starting a browser.
+
+    Returns:
+        dict: Stats with at least 'followers', or None if the request failed or the
+        response does not contain the stats markers (including bodies without any
+        markup, such as plain-text rate-limit messages or JSON errors)
+    """
+    timer = timer if timer is not None else StageTimer()
     try:
-        # First try getting the title attribute
-        title = element.get_attribute('title')
-        if title:
-            return title
-
-        # If no title, try hovering to get aria-label
-        actions = ActionChains(driver)
-        actions.move_to_element(element).perform()
-        time.sleep(0.5)  # Small delay to let hover text appear
-        aria_label = element.get_attribute('aria-label')
-        if aria_label:
-            return aria_label
-    except Exception as e:
-        log_with_limit(f"Error getting hover text: {e}")
-    return None
+        with timer.stage('http_fetch'):
+            response = http_session.get(url, timeout=timeout)
+        if response.status_code != 200:
+            log_with_limit(f"HTTP fetch of {url} returned status {response.status_code}")
+            return None
+        body = response.content
+    except requests.RequestException as e:
+        log_with_limit(f"HTTP fetch of {url} failed: {e}")
+        return None
+    if b'<' not in body:
+        log_with_limit(f"HTTP response for {url} has no markup ({len(body)} bytes)")
+        return None
 
-def find_stats_by_xpath(driver):
-    """Find stats using specific XPaths and search for posts, following, and followers."""
-    stats = {}
-    xpaths = {
-        'following': '//*[@id="react-root"]/div/div/div[2]/main/div/div/div/div/div/div[3]/div/div/div/div/div[5]/div[1]/a/span[1]/span',
-        'followers': '//*[@id="react-root"]/div/div/div[2]/main/div/div/div/div/div/div[3]/div/div/div/div/div[5]/div[2]/a/span[1]/span'
+    # Bytes are always read as page source; a str without markup would be taken for a file path
+    with timer.stage('extract'):
+        fields = extract_profile_fields(body)
+    log_with_limit(f"Fields found in HTTP response: {fields}")
+    if 'followers' not in fields:
+        return None
+
+    page_source = response.text
+    if save_html:
+        snapshot_profile_html(url.rstrip('/').split('/')[-1], page_source)
+
+    stats = {'followers': fields['followers'], 'html_source': page_source}
+    for key in ('posts', 'following'):
+        if key in fields:
+            stats[key] = fields[key]
+    return stats
+
+def fetch_profile(session, url, http_session=None, timer=None, **fetch_options):
+    """
+    Fetch profile stats over HTTP when http_session is given, falling back to the
+    browser session only when the response lacks the stats markers. Stage timings
+    are recorded on timer.
+    """
+    if http_session is None:
+        return fetch_with_session(session, url, timer=timer, **fetch_options)
+
+    profile_stats = get_profile_stats_http(http_session, url, save_html=fetch_options.get('save_html', True),
+                                           timer=timer)
+    if profile_stats:
+        return profile_stats
+
+    log_with_limit(f"Stats markers missing from HTTP response for {url}, falling back to Selenium")
+    return fetch_with_session(session, url, timer=timer, **fetch_options)
+
+STAT_XPATHS = {
+    'following': '//*[@id="react-root"]/div/div/div[2]/main/div/div/div/div/div/div[3]/div/div/div/div/div[5]/div[1]/a/span[1]/span',
+    'followers': '//*[@id="react-root"]/div/div/div[2]/main/div/div/div/div/div/div[3]/div/div/div/div/div[5]/div[2]/a/span[1]/span'
+}
+
+# Runs the XPath, aria-label, href and span-text strategies inside the page and returns
+# the raw text each one found, so a single WebDriver round trip covers the whole chain
+IN_PAGE_STATS_SCRIPT = """
+    var xpaths = arguments[0];
+    var result = {xpath: {}, aria_label: {}, js: {}, href: {}};
+
+    for (var name in xpaths) {
+        var node = document.evaluate(xpaths[name], document, null,
+                                     XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        if (!node) {
+            continue;
+        }
+        var text = name === 'followers' ? (node.getAttribute('title') || node.getAttribute('aria-label')) : null;
+        text = text || node.textContent.trim();
+        if (text) {
+            result.xpath[name] = text;
+        }
     }
-    
-    for stat_name, xpath in xpaths.items():
-        try:
-            elements = driver.find_elements(By.XPATH, xpath)
-            log_with_limit(f"Found {len(elements)} elements for {stat_name}")
-            if elements:
-                for element in elements:
-                    # Try getting hover text first for followers
-                    if stat_name == 'followers':
-                        hover_text = get_hover_text(driver, element)
-                        if hover_text:
-                            log_with_limit(f"Hover text found for {stat_name}: '{hover_text}'")
-                            stats[stat_name] = parse_count(hover_text)
-                            log_with_limit(f"{stat_name.capitalize()} found by hover: {stats[stat_name]}")
-                            break
-
-                    # Fall back to visible text if no hover text or for other stats
-                    text = element.text.strip()
-                    log_with_limit(f"Text found for {stat_name}: '{text}'")
-                    if text:
-                        stats[stat_name] = parse_count(text)
-                        log_with_limit(f"{stat_name.capitalize()} found by XPath: {stats[stat_name]}")
-                        break
-                else:
-                    log_with_limit(f"No valid text found for {stat_name}")
-                    stats[stat_name] = 'N/A'
-            else:
-                log_with_limit(f"No element found for {stat_name}")
-                stats[stat_name] = 'N/A'
-        except Exception as e:
-            log_with_limit(f"Failed to find {stat_name} by XPath: {str(e)}")
+
+    var links = document.querySelectorAll('a[href*="/following"], a[href*="/followers"]');
+    for (var i = 0; i < links.length; i++) {
+        var link = links[i];
+        var stat = (link.getAttribute('href') || '').indexOf('/following') !== -1 ? 'following' : 'followers';
+
+        var label = link.getAttribute('aria-label');
+        if (label && !(stat in result.aria_label)) {
+            var labelMatch = label.match(stat === 'following' ? /(\\d+(?:,\\d+)*) Following/ : /(\\d+(?:,\\d+)*) Followers/);
+            if (labelMatch) {
+                result.aria_label[stat] = labelMatch[1];
+            }
+        }
+
+        if (!(stat in result.js) && link.href.endsWith('/' + stat)) {
+            var spans = link.querySelectorAll('span');
+            for (var j = 0; j < spans.length; j++) {
+                var spanText = spans[j].textContent.trim();
+                if (/^[0-9,.]+[KMB]?$/.test(spanText)) {
+                    result.js[stat] = spanText;
+                    break;
+                }
+            }
+        }
+
+        if (!(stat in result.href)) {
+            var hrefMatch = link.textContent.match(/(\\d+(?:,\\d+)*(?:\\.\\d+)?[KMB]?)/i);
+            if (hrefMatch) {
+                result.href[stat] = hrefMatch[1];
+            }
+        }
+    }
+    return result;
+"""
+
+# Order in which in-page strategies are trusted when several find a value
+IN_PAGE_STRATEGIES = ('xpath', 'aria_label', 'js', 'href')
+
+def find_stats_in_page(driver):
+    """
+    Evaluate the XPath, aria-label, span-text and href strategies in one execute_script call.
+
+    Returns:
+        tuple: (stats, sources) where stats maps 'following'/'followers' to a count
+        ('N/A' when no strategy found one) and sources maps each found stat to the
+        strategy that produced it
+    """
+    stats = {}
+    sources = {}
+    try:
+        candidates = driver.execute_script(IN_PAGE_STATS_SCRIPT, STAT_XPATHS) or {}
+        log_with_limit(f"In-page strategy results: {candidates}")
+    except Exception as e:
+        log_with_limit(f"Failed to run in-page stats query: {str(e)}")
+        candidates = {}
+
+    for stat_name in STAT_XPATHS:
+        for strategy in IN_PAGE_STRATEGIES:
+            value = parse_count(candidates.get(strategy, {}).get(stat_name))
+            if value is not None:
+                stats[stat_name] = value
+                sources[stat_name] = strategy
+                break
+        else:
             stats[stat_name] = 'N/A'
-    
-    return stats
+    return stats, sources
 
 def find_stats_by_aria_label(driver):
     """Find stats using aria-label attributes."""
@@ -210,17 +549,20 @@ def find_stats_by_aria_label(driver):
         log_with_limit(f"Failed to find stats by aria-label: {str(e)}")
     return stats if all(stats.values()) else None
 
+HREF_STAT_PATTERNS = {
+    'following': re.compile(r'href="[^"]*?/following[^"]*?"[^>]*>.*?(\d+(?:,\d+)*(?:\.\d+)?[KMB]?).*?</a>',
+                            re.IGNORECASE | re.DOTALL),
+    'followers': re.compile(r'href="[^"]*?/followers[^"]*?"[^>]*>.*?(\d+(?:,\d+)*(?:\.\d+)?[KMB]?).*?</a>',
+                            re.IGNORECASE | re.DOTALL)
+}
+
 def find_stats_by_href(driver):
     """Find stats by searching for text content near hrefs."""
     stats = {}
     try:
         page_source = driver.page_source
-        patterns = {
-            'following': r'href="[^"]*?/following[^"]*?"[^>]*>.*?(\d+(?:,\d+)*(?:\.\d+)?[KMB]?).*?</a>',
-            'followers': r'href="[^"]*?/followers[^"]*?"[^>]*>.*?(\d+(?:,\d+)*(?:\.\d+)?[KMB]?).*?</a>'
-        }
-        for stat_name, pattern in patterns.items():
-            match = re.search(pattern, page_source, re.IGNORECASE | re.DOTALL)
+        for stat_name, pattern in HREF_STAT_PATTERNS.items():
+            match = pattern.search(page_source)
             if match:
                 stats[stat_name] = parse_count(match.group(1))
                 log_with_limit(f"{stat_name.capitalize()} found by href: {stats[stat_name]}")
@@ -263,6 +605,9 @@ def find_stats_by_js(driver):
             
         log_with_limit("\n=== Starting page source parsing ===")
         log_with_limit(f"Page source length: {len(page_source)} characters")
+
+        # Scan the page once for every count field
+        fields = extract_profile_fields(page_source)
         
         # Look for userInteractionCount in the page source and display 10 chars after it
         if 'userInteractionCount' in page_source:
@@ -272,11 +617,10 @@ def find_stats_by_js(driver):
             print(f"\n{Fore.YELLOW}10 chars after userInteractionCount:{Style.RESET_ALL} {next_ten_chars}")
             stats['interaction_context'] = next_ten_chars
             
-        # Get posts count using extract_interaction with debug enabled for both attempts
+        # Get posts count from statuses_count, falling back to tweet_count
         print(f'\n{Fore.CYAN}=== Attempting Posts Count Extraction ==={Style.RESET_ALL}')
         print(f'{Fore.YELLOW}Method 1: Trying statuses_count...{Style.RESET_ALL}')
-        print(f"{Fore.CYAN}Searching HTML file for 'statuses_count' pattern...{Style.RESET_ALL}")
-        posts_count = extract_interaction(html_file, "statuses_count", debug=True)
+        posts_count = fields.get('statuses_count')
         print(f'{Fore.YELLOW}statuses_count result: {posts_count}{Style.RESET_ALL}')
         
         if posts_count:
@@ -285,8 +629,7 @@ def find_stats_by_js(driver):
             print(f"\n{Fore.GREEN}Posts found from statuses_count:{Style.RESET_ALL} {stats['posts']:,}")
         else:
             print(f'{Fore.YELLOW}statuses_count not found, trying tweet_count...{Style.RESET_ALL}')
-            print(f"{Fore.CYAN}Searching HTML file for 'tweet_count' pattern...{Style.RESET_ALL}")
-            posts_count = extract_interaction(html_file, "tweet_count", debug=True)  # Added debug=True here
+            posts_count = fields.get('tweet_count')
             print(f'{Fore.YELLOW}tweet_count result: {posts_count}{Style.RESET_ALL}')
             
             if posts_count:
@@ -297,9 +640,8 @@ def find_stats_by_js(driver):
                 print(f'{Fore.RED}Failed to find posts count using both methods{Style.RESET_ALL}')
 
         # Look for following count
-        following_match = re.search(r'"friends_count":(\d+)', page_source)
-        if following_match:
-            stats['following'] = int(following_match.group(1))
+        if fields.get('following') is not None:
+            stats['following'] = fields['following']
             log_with_limit(f"Found following count: {stats['following']}")
             print(f"\n{Fore.GREEN}Following found in JSON:{Style.RESET_ALL} {stats['following']:,}")
 
@@ -330,15 +672,8 @@ def find_stats_by_js(driver):
             if all(stats.values()):
                 return stats
 
-        # Read the saved page source
-        with open(html_file, 'r', encoding='utf-8') as f:
-            page_source = f.read()
-            
-        log_with_limit("\n=== Starting page source parsing ===")
-        log_with_limit(f"Page source length: {len(page_source)} characters")
-        
-        # Use extract_interaction to get followers count
-        followers_count = extract_interaction(html_file)
+        # Use userInteractionCount to get followers count
+        followers_count = fields.get('followers')
         if followers_count:
             stats['followers'] = int(followers_count)
             log_with_limit(f"Found followers count from interaction: {stats['followers']}")
@@ -348,9 +683,8 @@ def find_stats_by_js(driver):
         else:
             log_with_limit("No userInteractionCount found in HTML")
                     
-        following_match = re.search(r'"friends_count":(\d+)', page_source)
-        if following_match:
-            stats['following'] = int(following_match.group(1))
+        if fields.get('following') is not None:
+            stats['following'] = fields['following']
             
         if stats:
             log_with_limit(f"Stats found in page source JSON: {stats}")
@@ -445,78 +779,347 @@ def create_test_html():
         f.write(test_content)
     log_with_limit(f"Created test HTML file at {filepath}")
 
-def save_profile_html(driver, account):
-    """Save the complete page source including dynamic content."""
+def write_profile_html(account, html):
+    """Write a profile page snapshot to html_sources/{account}_profile.html."""
     html_dir = "html_sources"
     os.makedirs(html_dir, exist_ok=True)
     
+    filename = os.path.join(html_dir, f"{account}_profile.html")
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write(html)
+    log_with_limit(f"Saved complete HTML source to {filename} ({len(html)} characters)")
+    return filename
+
+_snapshot_executor = None
+_snapshot_lock = threading.Lock()
+
+def snapshot_profile_html(account, html):
+    """Write a profile page snapshot in a background thread, off the fetch latency path."""
+    global _snapshot_executor
+    with _snapshot_lock:
+        if _snapshot_executor is None:
+            _snapshot_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='html-snapshot')
+    return _snapshot_executor.submit(write_profile_html, account, html)
+
+def save_profile_html(driver, account):
+    """Save the complete page source including dynamic content."""
     # Wait for dynamic content to load
-    time.sleep(2)
+    wait_for_profile_ready(driver, timeout=2)
     
     # Get the complete page source including dynamic content
     complete_html = driver.execute_script("return document.documentElement.outerHTML;")
-    
-    filename = os.path.join(html_dir, f"{account}_profile.html")
-    with open(filename, 'w', encoding='utf-8') as f:
-        f.write(complete_html)
-    log_with_limit(f"Saved complete HTML source to {filename} ({len(complete_html)} characters)")
-    return filename
+    return write_profile_html(account, complete_html)
+
+def print_transfer_summary(stats_list, lean_load):
+    """Print average page load time and bytes transferred over browser fetches."""
+    loads = [stats['load_seconds'] for stats in stats_list if 'load_seconds' in stats]
+    transfers = [stats['transfer_bytes'] for stats in stats_list if 'transfer_bytes' in stats]
+    if not loads:
+        return
+    mode = "on" if lean_load else "off"
+    transfer_text = f", {sum(transfers) / len(transfers) / 1e6:.2f} MB transferred" if transfers else ""
+    print(f"{Fore.GREEN}Page load (lean load {mode}):{Style.RESET_ALL} avg {sum(loads) / len(loads):.2f}s"
+          f"{transfer_text}")
+
+def read_accounts_file(path):
+    """
+    Read account names from a file, one per line. Blank lines and # comments are ignored.
+
+    Anything after the name (the per-account interval used by --schedule) is ignored.
+    """
+    accounts = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            fields = line.split('#', 1)[0].split()
+            if fields:
+                accounts.append(fields[0].lstrip('@'))
+    return accounts
+
+def fetch_batch(accounts, workers=4, queue_depth=2, no_headless=False, max_fetches=50, max_memory_mb=None,
+                lean_load=False, blocklist=None, http_session=None, storage=None, **fetch_options):
+    """
+    Fetch stats for many accounts over a pool of WebDriver workers.
+
+    Each worker owns a persistent BrowserSession and pulls accounts from a shared
+    queue bounded to workers * queue_depth entries. Every account's row is written
+    to storage (default: its own {username}_stats.csv). With http_session, accounts
+    are fetched over HTTP and a worker only starts Chrome for accounts that need the
+    fallback; the one http_session is shared by all workers (see create_http_session).
+    Extra keyword arguments are passed on to get_profile_stats.
+
+    Returns:
+        dict: account -> profile stats without the page source (None for failed fetches)
+    """
+    account_queue = queue.Queue(maxsize=max(1, workers * queue_depth))
+    results = {}
+    latencies = []
+    lock = threading.Lock()
+
+    def worker(worker_id):
+        session = BrowserSession(no_headless, max_fetches=max_fetches, max_memory_mb=max_memory_mb,
+                                 lean_load=lean_load, blocklist=blocklist)
+        try:
+            while True:
+                account = account_queue.get()
+                try:
+                    if account is None:
+                        return
+                    timer = StageTimer()
+                    profile_stats = fetch_profile(session, f"https://x.com/{account}", http_session,
+                                                  timer=timer, **fetch_options)
+                    if profile_stats:
+                        with timer.stage('write_stats'):
+                            write_stats(account, profile_stats, storage)
+                    write_timings(account, timer, storage, ok=bool(profile_stats), worker=worker_id)
+                    latency = timer.total()
+                    log_with_limit(f"[worker {worker_id}] {account}: "
+                                   f"{'ok' if profile_stats else 'failed'} in {latency:.2f}s")
+                    if profile_stats:
+                        # Keep only the counts; the page source can be several MB per account
+                        profile_stats.pop('html_source', None)
+                    with lock:
+                        results[account] = profile_stats
+                        latencies.append(latency)
+                except Exception as e:
+                    logger.error(f"[worker {worker_id}] Error fetching {account}: {e}")
+                    with lock:
+                        results[account] = None
+                finally:
+                    account_queue.task_done()
+        finally:
+            session.close()
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    for account in accounts:
+        account_queue.put(account)
+    for _ in threads:
+        account_queue.put(None)
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    succeeded = sum(1 for stats in results.values() if stats)
+    rate = len(results) / elapsed * 60 if elapsed > 0 else 0.0
+    print(f"\n{Fore.CYAN}=== Batch Summary ==={Style.RESET_ALL}")
+    print(f"{Fore.GREEN}Accounts:{Style.RESET_ALL} {succeeded}/{len(results)} fetched in {elapsed:.1f}s "
+          f"with {workers} workers")
+    print(f"{Fore.GREEN}Throughput:{Style.RESET_ALL} {rate:.1f} accounts/minute")
+    if latencies:
+        print(f"{Fore.GREEN}Latency:{Style.RESET_ALL} "
+              + ", ".join(f"p{p} {percentile(latencies, p):.2f}s" for p in (50, 90, 99)))
+    print_transfer_summary([stats for stats in results.values() if stats], lean_load)
+    return results
+
+def schedule_fetches(intervals, rate=None, burst=None, jitter=0.1, workers=4, no_headless=False, max_fetches=50,
+                     max_memory_mb=None, lean_load=False, blocklist=None, http_session=None, storage=None,
+                     report_interval=60, **fetch_options):
+    """
+    Poll many accounts, each at its own interval, within one global request budget.
+
+    Runs a FetchScheduler until interrupted. Each scheduler thread owns a persistent
+    BrowserSession; rows and stage timings are written as in fetch_batch, and the
+    schedule lag is logged every report_interval seconds.
+
+    Args:
+        intervals (dict): account -> seconds between fetches
+        rate (float): Global budget in fetches per second (default: no limit besides workers)
+        burst (float): Fetches the budget can save up
+        jitter (float): Random spread of each interval, as a fraction of it
+
+    Returns:
+        dict: The final schedule report (see FetchScheduler.report)
+    """
+    def new_fetcher():
+        session = BrowserSession(no_headless, max_fetches=max_fetches, max_memory_mb=max_memory_mb,
+                                 lean_load=lean_load, blocklist=blocklist)
+
+        def fetch(account):
+            timer = StageTimer()
+            profile_stats = fetch_profile(session, f"https://x.com/{account}", http_session,
+                                          timer=timer, **fetch_options)
+            if profile_stats:
+                with timer.stage('write_stats'):
+                    write_stats(account, profile_stats, storage)
+            write_timings(account, timer, storage, ok=bool(profile_stats), fetches_on_driver=session.fetch_count)
+            log_with_limit(f"{account}: {'ok' if profile_stats else 'failed'} in {timer.total():.2f}s")
+            return profile_stats
+
+        fetch.close = session.close
+        return fetch
 
-def main(account, interval, no_headless):
+    fetch = thread_local_fetcher(new_fetcher)
+    scheduler = FetchScheduler(fetch, intervals, rate, burst, jitter, workers, report_interval)
+    print(f"{Fore.GREEN}Scheduling {len(intervals)} accounts"
+          + (f" within {rate:g} fetches/s" if rate else "") + f"; press Ctrl+C to stop{Style.RESET_ALL}")
+    try:
+        asyncio.run(scheduler.run())
+    except KeyboardInterrupt:
+        print(f"\n{Fore.YELLOW}Scheduler stopped.{Style.RESET_ALL}")
+    finally:
+        fetch.close()
+    print(f"{Fore.CYAN}{scheduler.format_report()}{Style.RESET_ALL}")
+    return scheduler.report()
+
+def main(account, interval, no_headless, persistent=False, max_fetches=50, max_memory_mb=None,
+         lean_load=False, blocklist=None, http_session=None, storage=None, **fetch_options):
     profile_stats = None
     init()  # Initialize colorama
     url = f"https://x.com/{account}"
-    while True:
-        driver = initialize_browser(no_headless)
-        if driver:
+    storage = storage if storage is not None else CsvStorage()
+    # Without --persistent every cycle gets a fresh browser, as before
+    session = BrowserSession(no_headless, max_fetches=max_fetches if persistent else 1,
+                             max_memory_mb=max_memory_mb, lean_load=lean_load, blocklist=blocklist)
+    try:
+        while True:
+            print(f"\n{Fore.YELLOW}Fetching profile stats for {account}...{Style.RESET_ALL}")
+            timer = StageTimer()
+            try:
+                profile_stats = fetch_profile(session, url, http_session, timer=timer, **fetch_options)
+            except Exception as e:
+                logger.error(f"Error fetching {account}: {e}")
+                logger.error(traceback.format_exc())
+                profile_stats = None
+            driver = session.driver
             try:
-                print(f"\n{Fore.YELLOW}Fetching profile stats for {account}...{Style.RESET_ALL}")
-                profile_stats = get_profile_stats(driver, url)
-                
-                # Save the profile page HTML after loading and add to stats
-                html_file = save_profile_html(driver, account)
-                with open(html_file, 'r', encoding='utf-8') as f:
-                    profile_stats['html_source'] = f.read()
                 if profile_stats:
                     print_pretty_stats(profile_stats)
                     
-                    # Write stats to CSV
-                    write_to_csv(account, profile_stats)
-                    print(f"\n{Fore.CYAN}Stats written to {account}_stats.csv{Style.RESET_ALL}")
+                    # Write stats to CSV (or the configured storage)
+                    with timer.stage('write_stats'):
+                        write_stats(account, profile_stats, storage)
+                    print(f"\n{Fore.CYAN}Stats written to {storage.describe(account)}{Style.RESET_ALL}")
+                elif driver is None and http_session is None:
+                    print(f"{Fore.RED}Failed to initialize the browser.{Style.RESET_ALL}")
                 else:
                     print(f"{Fore.RED}Could not fetch the profile stats.{Style.RESET_ALL}")
                 
-                print(f"\n{Fore.MAGENTA}Page Title:{Style.RESET_ALL} {driver.title}")
-                print(f"\n{Fore.MAGENTA}Current URL:{Style.RESET_ALL} {driver.current_url}")
-                
-                # Get text from the specified XPath
-                xpath = '//*[@id="react-root"]/div/div/div[2]/main/div/div/div/div/div/div[1]/div[1]/div/div/div/div/div/div[2]/div/div'
-                text_at_xpath = get_text_by_xpath(driver, xpath)
-                print(f"\n{Fore.BLUE}Text found at specified XPath:{Style.RESET_ALL} {text_at_xpath}")
+                if driver:
+                    print(f"\n{Fore.MAGENTA}Page Title:{Style.RESET_ALL} {driver.title}")
+                    print(f"\n{Fore.MAGENTA}Current URL:{Style.RESET_ALL} {driver.current_url}")
+                    
+                    # Get text from the specified XPath
+                    xpath = '//*[@id="react-root"]/div/div/div[2]/main/div/div/div/div/div/div[1]/div[1]/div/div/div/div/div/div[2]/div/div'
+                    text_at_xpath = get_text_by_xpath(driver, xpath)
+                    print(f"\n{Fore.BLUE}Text found at specified XPath:{Style.RESET_ALL} {text_at_xpath}")
             except Exception as e:
                 print(f"{Fore.RED}An error occurred: {str(e)}{Style.RESET_ALL}")
                 logger.error(f"An error occurred: {str(e)}")
                 logger.error(traceback.format_exc())
             finally:
-                driver.quit()
-                log_with_limit("WebDriver closed")
-        else:
-            print(f"{Fore.RED}Failed to initialize the browser.{Style.RESET_ALL}")
-        
-        if interval <= 0:
-            return profile_stats
-        
-        print(f"\n{Fore.YELLOW}Waiting for {interval} seconds before next fetch...{Style.RESET_ALL}")
-        time.sleep(interval)
+                if not persistent:
+                    session.close()
+
+            write_timings(account, timer, storage, ok=bool(profile_stats), fetches_on_driver=session.fetch_count)
+            print(f"\n{Fore.CYAN}Cycle timing:{Style.RESET_ALL} "
+                  + ", ".join(f"{name} {seconds:.2f}s" for name, seconds in timer.stages.items())
+                  + f" (total {timer.total():.2f}s)")
+            log_with_limit(f"Cycle timing: {timer.format()} fetches_on_driver={session.fetch_count}")
+            if profile_stats:
+                print_transfer_summary([profile_stats], lean_load)
+            
+            if interval <= 0:
+                return profile_stats
+            
+            print(f"\n{Fore.YELLOW}Waiting for {interval} seconds before next fetch...{Style.RESET_ALL}")
+            time.sleep(interval)
+    finally:
+        session.close()
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Fetch X (Twitter) profile stats at specified intervals.")
-    parser.add_argument("account", type=str, help="X (Twitter) account name (without @)")
+    parser.add_argument("accounts", type=str, nargs="*", help="X (Twitter) account name(s) (without @)")
+    parser.add_argument("--accounts-file", type=str, default=None,
+                        help="File with one account name per line; fetches all of them in batch mode")
     parser.add_argument("-i", "--interval", type=int, default=0,
-                        help="Interval in seconds between fetches. Use 0 for a single fetch.")
+                        help="Interval in seconds between fetches of a single account. Use 0 for a single fetch "
+                             "(with --schedule: the default interval, 0 = one hour).")
     parser.add_argument("--no-headless", action="store_true", help="Run Chrome in non-headless mode")
+    parser.add_argument("--persistent", action="store_true",
+                        help="Reuse one Chrome session across fetches instead of restarting it every cycle")
+    parser.add_argument("--recycle-after", type=int, default=50, metavar="FETCHES",
+                        help="Restart the persistent browser after this many fetches (default: 50, 0 = never)")
+    parser.add_argument("--max-memory-mb", type=float, default=None, metavar="MB",
+                        help="Restart the persistent browser when Chrome uses more than this much memory (requires psutil)")
+    parser.add_argument("-w", "--workers", type=int, default=4,
+                        help="Number of concurrent browser workers in batch mode (default: 4)")
+    parser.add_argument("--queue-depth", type=int, default=2,
+                        help="Accounts queued ahead per worker in batch mode (default: 2)")
+    parser.add_argument("--no-save-html", action="store_true",
+                        help="Don't write profile page snapshots to html_sources/")
+    parser.add_argument("--ready-timeout", type=float, default=10, metavar="SECONDS",
+                        help="Maximum time to wait for the profile stats to appear (default: 10)")
+    parser.add_argument("--lean-load", action="store_true",
+                        help="Block images, media, fonts and tracking domains while loading profiles")
+    parser.add_argument("--block", action="append", default=[], metavar="PATTERN",
+                        help="Extra URL pattern to block in lean-load mode (repeatable, '*' wildcards)")
+    parser.add_argument("--blocklist-file", type=str, default=None,
+                        help="File of URL patterns to block in lean-load mode, replacing the default list")
+    parser.add_argument("--timing-summary", type=int, nargs="?", const=100, default=None, metavar="N",
+                        help="Print p50/p95/p99 per fetch stage over the last N cycles (default: 100) and exit")
+    parser.add_argument("--storage", type=str, default="csv",
+                        help="Where to store rows: csv (<account>_stats.csv, default), csv:DIR or sqlite:PATH")
+    parser.add_argument("--rollups", type=str, default=None, metavar="DB",
+                        help="Also merge every fetched row into this minute/hour/day rollup database")
+    parser.add_argument("--backend", choices=["selenium", "http"], default="selenium",
+                        help="Fetch with headless Chrome, or with plain HTTP requests that fall back to "
+                             "Chrome only when the stats are missing (default: selenium)")
+    parser.add_argument("--schedule", action="store_true",
+                        help="Poll every account on its own interval (-i, or the second column of --accounts-file, "
+                             "e.g. 'elonmusk 1m') until interrupted")
+    parser.add_argument("--rate", type=float, default=None, metavar="FETCHES_PER_SECOND",
+                        help="Global fetch budget in --schedule mode (default: no limit besides --workers)")
+    parser.add_argument("--burst", type=float, default=None,
+                        help="Fetches the --rate budget can save up (default: one second's worth, at least 1)")
+    parser.add_argument("--jitter", type=float, default=0.1,
+                        help="Random spread of each interval in --schedule mode, as a fraction (default: 0.1)")
     args = parser.parse_args()
 
-    profile_stats = main(args.account, args.interval, args.no_headless)
-    if profile_stats:
-        print(f"\n{Fore.GREEN}Follower count:{Style.RESET_ALL} {profile_stats.get('followers', 'N/A')}")
+    accounts = list(args.accounts)
+    if args.accounts_file:
+        accounts.extend(read_accounts_file(args.accounts_file))
+    if not accounts:
+        parser.error("provide at least one account or --accounts-file")
+    # An account given twice (or on the command line and in the file) is fetched once
+    accounts = list(dict.fromkeys(accounts))
+    batch = len(accounts) > 1 or args.accounts_file
+    if batch and args.interval and not args.schedule and args.timing_summary is None:
+        parser.error("-i/--interval repeats a single account; use --schedule to poll several accounts")
+
+    http_session = create_http_session(pool_size=args.workers) if args.backend == "http" else None
+    blocklist = read_blocklist_file(args.blocklist_file) if args.blocklist_file else list(DEFAULT_BLOCKLIST)
+    blocklist.extend(args.block)
+    storage = open_storage(args.storage)
+    if args.rollups:
+        storage = RollupStorage(storage, RollupStore(args.rollups))
+
+    if args.timing_summary is not None:
+        init()  # Initialize colorama
+        for account in accounts:
+            print_timing_summary(account, args.timing_summary, storage)
+    elif args.schedule:
+        init()  # Initialize colorama
+        default_interval = args.interval if args.interval > 0 else DEFAULT_INTERVAL
+        intervals = {account: default_interval for account in args.accounts}
+        if args.accounts_file:
+            intervals.update(read_account_intervals(args.accounts_file, default_interval))
+        schedule_fetches(intervals, rate=args.rate, burst=args.burst, jitter=args.jitter, workers=args.workers,
+                         no_headless=args.no_headless, max_fetches=args.recycle_after,
+                         max_memory_mb=args.max_memory_mb, lean_load=args.lean_load, blocklist=blocklist,
+                         http_session=http_session, storage=storage, save_html=not args.no_save_html,
+                         ready_timeout=args.ready_timeout)
+    elif batch:
+        init()  # Initialize colorama
+        fetch_batch(accounts, workers=args.workers, queue_depth=args.queue_depth, no_headless=args.no_headless,
+                    max_fetches=args.recycle_after, max_memory_mb=args.max_memory_mb, lean_load=args.lean_load,
+                    blocklist=blocklist, http_session=http_session, storage=storage,
+                    save_html=not args.no_save_html, ready_timeout=args.ready_timeout)
+    else:
+        profile_stats = main(accounts[0], args.interval, args.no_headless, persistent=args.persistent,
+                             max_fetches=args.recycle_after, max_memory_mb=args.max_memory_mb,
+                             lean_load=args.lean_load, blocklist=blocklist, http_session=http_session,
+                             storage=storage, save_html=not args.no_save_html, ready_timeout=args.ready_timeout)
+        if profile_stats:
+            print(f"\n{Fore.GREEN}Follower count:{Style.RESET_ALL} {profile_stats.get('followers', 'N/A')}")
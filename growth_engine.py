@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+
+from bisect import bisect_left
+from datetime import datetime, timedelta
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Pure-Python lookups are used instead
+
+# Gain series periods: period -> (title, label format, default number of buckets)
+PERIODS = {
+    'hour': ('Hourly', '%Y-%m-%d %H:00', 24),
+    'day': ('Daily', '%Y-%m-%d', 7),
+    'week': ('Weekly', '%Y-%m-%d', 8),
+}
+
+# Below this many windows the per-window bisect is cheaper than NumPy's call overhead
+VECTORIZE_MIN_WINDOWS = 16
+
+def _columns(history):
+    """Zero-copy NumPy views of a StatsHistory's columns; drop them before extending the history."""
+    return (np.frombuffer(history.times, dtype=np.float64),
+            np.frombuffer(history.followers, dtype=np.int64),
+            np.frombuffer(history.posts, dtype=np.int64))
+
+def _nearest_indices(times, targets, hi):
+    """Vectorized StatsHistory.nearest: closest of times[:hi] to each target, later sample on a tie."""
+    i = np.searchsorted(times[:hi], targets, side='left')
+    after = np.minimum(i, hi - 1)
+    before = np.maximum(i - 1, 0)
+    take_before = (i == hi) | ((i > 0) & (targets - times[before] < times[after] - targets))
+    return np.where(take_before, before, after)
+
+def window_stats(history, windows):
+    """
+    Compute follower and post diffs and daily rates for every window at once.
+
+    Args:
+        history (StatsHistory): Samples to analyze
+        windows (list): (key, label, timedelta) tuples
+
+    Returns:
+        dict: The structure display_follower_stats and display_post_stats consume:
+        current_time, current_fol, current_posts, windows ([(key, label)]) and
+        key -> {'fol_diff', 'fol_rate', 'post_diff', 'post_rate'} per window,
+        or None with fewer than two samples
+    """
+    if len(history) < 2:
+        return None
+
+    current = len(history) - 1
+    seconds = [window.total_seconds() for _, _, window in windows]
+    if np is not None and len(windows) >= VECTORIZE_MIN_WINDOWS:
+        times, followers, posts = _columns(history)
+        past = _nearest_indices(times, times[current] - np.array(seconds), current)
+        days = (times[current] - times[past]) / 86400
+        fol_diffs = followers[current] - followers[past]
+        post_diffs = posts[current] - posts[past]
+        fol_rates = (fol_diffs / days).tolist()
+        post_rates = (post_diffs / days).tolist()
+        fol_diffs, post_diffs = fol_diffs.tolist(), post_diffs.tolist()
+        del times, followers, posts  # Release the buffer views so the history can grow again
+    else:
+        past = [history.nearest(history.times[current] - s, current) for s in seconds]
+        days = [(history.times[current] - history.times[p]) / 86400 for p in past]
+        fol_diffs = [history.followers[current] - history.followers[p] for p in past]
+        post_diffs = [history.posts[current] - history.posts[p] for p in past]
+        fol_rates = [diff / d for diff, d in zip(fol_diffs, days)]
+        post_rates = [diff / d for diff, d in zip(post_diffs, days)]
+
+    stats = {
+        'current_time': history.datetime_at(current),
+        'current_fol': history.followers[current],
+        'current_posts': history.posts[current],
+        'windows': [(key, label) for key, label, _ in windows],
+    }
+    for n, (key, _, _) in enumerate(windows):
+        stats[key] = {
+            'fol_diff': int(fol_diffs[n]), 'fol_rate': fol_rates[n],
+            'post_diff': int(post_diffs[n]), 'post_rate': post_rates[n]
+        }
+    return stats
+
+def period_start(moment, period):
+    """Return the start of the hour, day or (Monday-based) week containing moment."""
+    if period == 'hour':
+        return moment.replace(minute=0, second=0, microsecond=0)
+    start = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    if period == 'week':
+        start -= timedelta(days=start.weekday())
+    return start
+
+def period_boundaries(end, period, count):
+    """
+    Return the starts of count + 2 consecutive periods, oldest first.
+
+    The last period is the one containing end. The extra periods are the one before
+    the first bucket (its baseline) and the start of the period after end.
+    Boundaries are computed in wall-clock time, so days stay days across DST changes.
+    """
+    step = {'hour': timedelta(hours=1), 'day': timedelta(days=1), 'week': timedelta(weeks=1)}[period]
+    last = period_start(end, period)
+    return [last - step * k for k in range(count, -2, -1)]
+
+def gain_series(history, period='day', count=None, end=None):
+    """
+    Follower gains per hour, day or week.
+
+    A bucket's gain is the follower count of its first sample minus that of the
+    previous bucket's first sample; buckets where either is missing gain 0. For
+    period='day' this is the same series calculate_daily_gains has always produced.
+
+    Args:
+        history (StatsHistory): Samples to analyze
+        period (str): 'hour', 'day' or 'week'
+        count (int): Number of buckets (default: 24 hours, 7 days or 8 weeks)
+        end (datetime): Time in the last bucket (default: now)
+
+    Returns:
+        list: (bucket start, gain) tuples, oldest first; bucket starts are dates
+        for days and weeks and datetimes for hours
+    """
+    count = PERIODS[period][2] if count is None else count
+    end = end if end is not None else datetime.now(history.tzinfo)
+    starts = period_boundaries(end, period, count)
+    edges = [history.to_seconds(start) for start in starts]
+
+    labels = starts[1:-1] if period == 'hour' else [start.date() for start in starts[1:-1]]
+    n = len(history)
+    if n == 0:
+        return [(label, 0) for label in labels]
+    if np is not None:
+        times, followers, _ = _columns(history)
+        edges = np.array(edges)
+        first = np.searchsorted(times, edges[:-1], side='left')
+        clipped = np.minimum(first, n - 1)
+        present = (first < n) & (times[clipped] < edges[1:])
+        counts = followers[clipped]
+        gains = np.where(present[1:] & present[:-1], counts[1:] - counts[:-1], 0).tolist()
+        del times, followers  # Release the buffer views so the history can grow again
+    else:
+        first = [bisect_left(history.times, edge) for edge in edges[:-1]]
+        present = [i < n and history.times[i] < edge for i, edge in zip(first, edges[1:])]
+        gains = [history.followers[first[k]] - history.followers[first[k - 1]]
+                 if present[k] and present[k - 1] else 0 for k in range(1, len(first))]
+
+    return list(zip(labels, gains))
@@ -2,16 +2,25 @@
 
 import re
 import os
+from pathlib import Path
 from colorama import Fore, Style, init
 
+try:
+    from html_sources.html_input import read_html, describe_html
+    from html_sources.profile_extractor import COUNT_KEYS, scan_counts
+except ImportError:  # Running as a script from inside html_sources/
+    from html_input import read_html, describe_html
+    from profile_extractor import COUNT_KEYS, scan_counts
+
 init()  # Initialize colorama
 
 def extract_interaction(html_file, interaction_type="userInteractionCount", debug=False):
     """
-    Extract interaction count from an HTML file.
+    Extract interaction count from an HTML file or in-memory page source.
     
     Args:
-        html_file (str): Path to the HTML file to process
+        html_file (os.PathLike | str | bytes | memoryview): Path to the HTML file to process
+            (e.g. pathlib.Path), or the HTML itself
         interaction_type (str): Type of interaction to extract (userInteractionCount or statuses_count)
         
     Returns:
@@ -21,16 +30,19 @@ def extract_interaction(html_file, interaction_type="userInteractionCount", debu
         if debug:
             print(f"\n{Fore.CYAN}=== Debug: extract_interaction() ==={Style.RESET_ALL}")
             print(f"{Fore.YELLOW}Input parameters:{Style.RESET_ALL}")
-            print(f"- html_file: {html_file}")
+            print(f"- html_file: {describe_html(html_file)}")
             print(f"- interaction_type: {interaction_type}")
             print(f"- debug: {debug}")
             
         if debug:
-            print(f"\n{Fore.CYAN}Step 1: Opening file{Style.RESET_ALL}")
-        with open(html_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+            print(f"\n{Fore.CYAN}Step 1: Reading HTML{Style.RESET_ALL}")
+        content = read_html(html_file)
         if debug:
             print(f"{Fore.GREEN}Success: Read {len(content):,} characters{Style.RESET_ALL}")
+
+        # Known keys go through the single-pass scanner; debug mode keeps the step-by-step search
+        if interaction_type in COUNT_KEYS and not debug:
+            return scan_counts(content).get(interaction_type)
             
         # First look for the raw string without quotes
         index = content.find(interaction_type)
@@ -78,7 +90,7 @@ def extract_interaction(html_file, interaction_type="userInteractionCount", debu
             print("Returning None")
         return None
     except Exception as e:
-        print(f"Error processing {html_file}: {str(e)}")
+        print(f"Error processing {describe_html(html_file)}: {str(e)}")
         return None
 
 def get_latest_profile_html(directory="html_sources"):
@@ -105,7 +117,7 @@ def get_latest_profile_html(directory="html_sources"):
 if __name__ == "__main__":
     latest_file = get_latest_profile_html()
     if latest_file:
-        result = extract_interaction(latest_file)
+        result = extract_interaction(Path(latest_file))
         if result:
             print(result)
         else:
@@ -2,6 +2,7 @@
 
 import re
 import os
+from pathlib import Path
 import argparse
 from colorama import Fore, Style, init
 from selenium import webdriver
@@ -9,14 +10,22 @@ from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.support.ui import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
 
+try:
+    from html_sources.html_input import is_html_path, read_html, describe_html
+    from html_sources.profile_extractor import scan_counts
+except ImportError:  # Running as a script from inside html_sources/
+    from html_input import is_html_path, read_html, describe_html
+    from profile_extractor import scan_counts
+
 init()  # Initialize colorama
 
 def extract_post_count(html_file, debug=False):
     """
-    Extract post count from HTML file using statuses_count
+    Extract post count from an HTML file or in-memory page source using statuses_count
     
     Args:
-        html_file (str): Path to the HTML file
+        html_file (os.PathLike | str | bytes | memoryview): Path to the HTML file (e.g. pathlib.Path),
+            or the HTML itself
         debug (bool): Enable debug output
         
     Returns:
@@ -25,17 +34,19 @@ def extract_post_count(html_file, debug=False):
     try:
         if debug:
             print(f"\n{Fore.CYAN}=== Debug: extract_post_count() ==={Style.RESET_ALL}")
-            print(f"{Fore.YELLOW}Input file:{Style.RESET_ALL} {html_file}")
+            print(f"{Fore.YELLOW}Input file:{Style.RESET_ALL} {describe_html(html_file)}")
 
-        if not os.path.exists(html_file):
+        if is_html_path(html_file) and not os.path.exists(html_file):
             if debug:
                 print(f"{Fore.RED}Error: File does not exist{Style.RESET_ALL}")
             return None
 
-        with open(html_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            if debug:
-                print(f"{Fore.GREEN}Successfully read {len(content):,} characters{Style.RESET_ALL}")
+        content = read_html(html_file)
+        if debug:
+            print(f"{Fore.GREEN}Successfully read {len(content):,} characters{Style.RESET_ALL}")
+        else:
+            # Single-pass scanner; debug mode keeps the step-by-step search below
+            return scan_counts(content).get('tweets_counter')
 
         # First check if strings exist at all
         search_terms = ['tweet_count', 'statuses_count']
@@ -157,7 +168,7 @@ if __name__ == "__main__":
         
     if html_file:
         print(f"\n{Fore.CYAN}Processing profile HTML:{Style.RESET_ALL} {html_file}")
-        count = extract_post_count(html_file, debug=True)
+        count = extract_post_count(Path(html_file), debug=True)
         if count is not None:
             print(f"\n{Fore.GREEN}Post count:{Style.RESET_ALL} {count:,}")
         else:
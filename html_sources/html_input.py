@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+
+import os
+
+def is_html_path(source):
+    """
+    Tell whether an extractor input refers to a file rather than holding the HTML itself.
+
+    Only os.PathLike inputs such as pathlib.Path are files; a str is always page
+    source, even one without markup (an empty body or a plain-text error page).
+
+    Args:
+        source (os.PathLike | str | bytes | memoryview): Extractor input
+
+    Returns:
+        bool: True if source should be opened as a file path
+    """
+    return isinstance(source, os.PathLike)
+
+def read_html(source):
+    """
+    Return the HTML text for an extractor input.
+
+    Args:
+        source (os.PathLike | str | bytes | bytearray | memoryview): Path to an HTML
+            file (os.PathLike), or the page source itself (str or UTF-8 encoded buffer)
+
+    Returns:
+        str: The HTML content
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return str(source, 'utf-8', 'replace')
+    if is_html_path(source):
+        with open(source, 'r', encoding='utf-8') as f:
+            return f.read()
+    return source
+
+def describe_html(source):
+    """Return a short label for an extractor input, for debug and error messages."""
+    if is_html_path(source):
+        return os.fspath(source)
+    return f"<in-memory HTML, {len(source):,} {'bytes' if not isinstance(source, str) else 'characters'}>"
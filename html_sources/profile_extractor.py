@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+import re
+import sys
+from pathlib import Path
+
+try:
+    from html_sources.html_input import read_html, describe_html
+except ImportError:  # Running as a script from inside html_sources/
+    from html_input import read_html, describe_html
+
+# Keys extract_interaction knows how to read, in "key":123 / key":123 / key=123 form
+COUNT_KEYS = ('userInteractionCount', 'statuses_count', 'tweet_count', 'friends_count')
+
+# Every key ends in "ount", so one literal-prefix pattern walks the page once and the
+# key is identified by looking back from the match. An alternation of the full key
+# names would defeat the regex engine's fast literal scan and run several times slower.
+_COUNT_PATTERN = re.compile(r'ount(":|=)(\d+)')
+_KEY_STEMS = tuple((key, key[:-len('ount')]) for key in COUNT_KEYS)
+
+# JSON-LD InteractionCounter holding the post count
+_TWEETS_COUNTER = '"name":"Tweets","'
+
+def scan_counts(content):
+    """
+    Find every count key extract_interaction and extract_post_count look for in one pass.
+
+    The precedence of the per-field regexes is kept: for each key a quoted "key":N match
+    wins over key":N, which wins over key=N; within a form the first occurrence wins.
+
+    Args:
+        content (str): HTML to scan
+
+    Returns:
+        dict: key -> count for each key found, plus 'tweets_counter' for the
+        "name":"Tweets" InteractionCounter and 'friends_count_json' for a quoted
+        "friends_count":N
+    """
+    quoted = {}
+    unquoted = {}
+    attribute = {}
+    tweets_counter = None
+
+    for match in _COUNT_PATTERN.finditer(content):
+        stem_end = match.start()
+        for key, stem in _KEY_STEMS:
+            if content.endswith(stem, 0, stem_end):
+                break
+        else:
+            continue
+        separator, value = match.groups()
+        start = stem_end - len(stem)
+        if separator == '=':
+            attribute.setdefault(key, value)
+            continue
+        if start > 0 and content[start - 1] == '"':
+            quoted.setdefault(key, value)
+            if (tweets_counter is None and key == 'userInteractionCount' and start >= len(_TWEETS_COUNTER)
+                    and content.startswith(_TWEETS_COUNTER, start - len(_TWEETS_COUNTER))):
+                tweets_counter = value
+        else:
+            unquoted.setdefault(key, value)
+        # Nothing later in the page can change the result once every key has its best form
+        if tweets_counter is not None and len(quoted) == len(COUNT_KEYS):
+            break
+
+    counts = {}
+    for key in COUNT_KEYS:
+        value = quoted.get(key) or unquoted.get(key) or attribute.get(key)
+        if value is not None:
+            counts[key] = int(value)
+    if tweets_counter is not None:
+        counts['tweets_counter'] = int(tweets_counter)
+    if 'friends_count' in quoted:
+        counts['friends_count_json'] = int(quoted['friends_count'])
+    return counts
+
+def extract_profile_fields(html_file):
+    """
+    Extract all profile counts from an HTML file or in-memory page source in a single pass.
+
+    Args:
+        html_file (os.PathLike | str | bytes | memoryview): Path to the HTML file (e.g. pathlib.Path),
+            or the HTML itself
+
+    Returns:
+        dict: Any of followers, following, posts, statuses_count, tweet_count and
+        friends_count that were found. followers and posts match extract_interaction
+        and extract_post_count; following comes from friends_count.
+    """
+    counts = scan_counts(read_html(html_file))
+
+    fields = {}
+    if 'userInteractionCount' in counts:
+        fields['followers'] = counts['userInteractionCount']
+    if 'tweets_counter' in counts:
+        fields['posts'] = counts['tweets_counter']
+    for key in ('statuses_count', 'tweet_count', 'friends_count'):
+        if key in counts:
+            fields[key] = counts[key]
+    # find_stats_by_js only trusts the quoted JSON form for following
+    if 'friends_count_json' in counts:
+        fields['following'] = counts['friends_count_json']
+    return fields
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: profile_extractor.py <html_file>")
+        sys.exit(1)
+    html_file = Path(sys.argv[1])
+    print(f"{describe_html(html_file)}: {extract_profile_fields(html_file)}")
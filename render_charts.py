@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+
+import os
+import json
+import time
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import matplotlib
+matplotlib.use('Agg')  # Render without a display, before pyplot is imported
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from colorama import init, Fore, Style
+from stats_storage import CsvStorage, open_storage
+from stats_rollup import RollupStore
+from visualization import load_stats_frame, draw_stats_frame, point_budget
+
+init(autoreset=True)  # Initialize colorama
+
+# Per-output cache records, kept in the output directory
+CACHE_FILENAME = '.chart_cache.json'
+
+def account_name(item):
+    """Account name of a stats file or account argument: the basename without _stats.csv."""
+    name = os.path.basename(item)
+    return name[:-len('_stats.csv')] if name.endswith('_stats.csv') else name
+
+def open_chart_storage(storage_spec):
+    """Open the --storage backend once per process; None for CSV, where each chart reads its own file."""
+    return None if storage_spec == 'csv' else open_storage(storage_spec)
+
+def chart_storage(item, storage=None):
+    """The storage a chart reads from: the CSV's own directory, or the shared --storage backend."""
+    return storage if storage is not None else CsvStorage(os.path.dirname(item) or '.')
+
+def chart_signature(item, storage=None):
+    """The item's storage signature: size and mtime of the CSV file itself, whatever its name, or None."""
+    if storage is not None:
+        return storage.signature(account_name(item))
+    try:
+        stat = os.stat(item)
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+def frame_digest(filtered_df, options):
+    """SHA-1 of the rows a chart draws and the options it is drawn with."""
+    digest = hashlib.sha1(json.dumps(options, sort_keys=True).encode())
+    digest.update(filtered_df['datetime'].to_numpy(dtype='datetime64[ns]').tobytes())
+    for name in ('followers', 'posts'):
+        digest.update(filtered_df[name].to_numpy(dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+# Storage, rollups and chart options of a render worker, set by _init_render_worker
+_worker_storage = None
+_worker_rollups = None
+_worker_options = None
+
+def _init_render_worker(storage_spec, rollups_path, options):
+    global _worker_storage, _worker_rollups, _worker_options
+    _worker_storage = open_chart_storage(storage_spec)
+    _worker_rollups = RollupStore(rollups_path) if rollups_path else None
+    _worker_options = options
+
+def _render_chart(job):
+    """
+    Render one chart in a worker unless its rows are unchanged.
+
+    Args:
+        job (tuple): (stats file or account, output path, digest of the last render or None)
+
+    Returns:
+        tuple: (item, digest, rendered, error)
+    """
+    item, output, known_digest = job
+    options = _worker_options
+    try:
+        storage = chart_storage(item, _worker_storage)
+        df = load_stats_frame(item, storage, options['history_days'], _worker_rollups)
+        if len(df) == 0:
+            return item, None, False, "no data"
+        cutoff_date = df['datetime'].max() - pd.Timedelta(days=options['history_days'])
+        filtered_df = df[df['datetime'] >= cutoff_date]
+        digest = frame_digest(filtered_df, options)
+        if digest == known_digest and os.path.exists(output):
+            return item, digest, False, None
+
+        fig, ax1 = plt.subplots(figsize=tuple(options['figsize']), dpi=options['dpi'])
+        try:
+            ax2 = ax1.twinx()
+            ax3 = None
+            if options['show_followers_per_post']:
+                ax3 = ax1.twinx()
+                ax3.spines['right'].set_position(('outward', 60))
+            draw_stats_frame(filtered_df, ax1, ax2, ax3, options['window_size'],
+                             point_budget(fig, options['max_points']))
+            ax1.set_title(account_name(item))
+            fig.savefig(output)
+        finally:
+            plt.close(fig)
+        return item, digest, True, None
+    except Exception as e:
+        return item, None, False, str(e) or type(e).__name__
+
+def load_cache(path):
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def save_cache(path, cache):
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w') as f:
+        json.dump(cache, f)
+    os.replace(temp_path, path)
+
+def render_charts(items, output_dir, options, storage_spec='csv', rollups_path=None, workers=None, force=False):
+    """
+    Render a chart per stats file (or account) into output_dir, in parallel.
+
+    A chart is skipped without reading its data when the storage signature (size
+    and mtime for CSV files) and the options match its last render. Otherwise the
+    worker loads the window and skips the render when the SHA-1 of its rows is
+    unchanged. The cache lives in output_dir/.chart_cache.json.
+
+    Repeated items are rendered once. Items whose chart name (see account_name)
+    is already taken by an earlier item, such as a/x_stats.csv and b/x_stats.csv,
+    are reported as errors instead of overwriting its chart.
+
+    Args:
+        items (list): Stats CSV paths, or account names with a non-CSV storage
+        output_dir (str): Directory for <account>.<format> charts
+        options (dict): history_days, window_size, show_followers_per_post,
+            max_points, figsize, dpi and format
+        storage_spec (str): See stats_storage.open_storage
+        rollups_path (str): Optional rollup database for long histories
+        workers (int): Worker processes (default: number of CPUs)
+        force (bool): Ignore the cache and render everything
+
+    Returns:
+        dict: charts, rendered, signature_hits, content_hits, errors ([(item, message)]) and seconds
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    cache_path = os.path.join(output_dir, CACHE_FILENAME)
+    cache = {} if force else load_cache(cache_path)
+    options_key = json.dumps(options, sort_keys=True)
+    start = time.perf_counter()
+
+    storage = open_chart_storage(storage_spec)
+    if storage is None:
+        items = [os.path.normpath(item) for item in items]
+    items = list(dict.fromkeys(items))
+    jobs, signatures, outputs = [], {}, {}
+    summary = {'charts': len(items), 'rendered': 0, 'signature_hits': 0, 'content_hits': 0, 'errors': []}
+    for item in items:
+        output = os.path.join(output_dir, f"{account_name(item)}.{options['format']}")
+        if output in outputs:
+            summary['errors'].append((item, f"chart {output} is already drawn for {outputs[output]}"))
+            continue
+        outputs[output] = item
+        signature = chart_signature(item, storage)
+        signatures[item] = list(signature) if isinstance(signature, tuple) else signature
+        entry = cache.get(output)
+        if (entry and entry['options'] == options_key and signature is not None
+                and entry['signature'] == signatures[item] and os.path.exists(output)):
+            summary['signature_hits'] += 1
+            continue
+        jobs.append((item, output, entry['digest'] if entry and entry['options'] == options_key else None))
+
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker,
+                                 initargs=(storage_spec, rollups_path, options)) as executor:
+            results = list(executor.map(_render_chart, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+    else:
+        _init_render_worker(storage_spec, rollups_path, options)
+        results = [_render_chart(job) for job in jobs]
+
+    for (item, output, _), (_, digest, rendered, error) in zip(jobs, results):
+        if error:
+            summary['errors'].append((item, error))
+            cache.pop(output, None)
+            continue
+        summary['rendered' if rendered else 'content_hits'] += 1
+        cache[output] = {'signature': signatures[item], 'digest': digest, 'options': options_key}
+    save_cache(cache_path, cache)
+    summary['seconds'] = time.perf_counter() - start
+    return summary
+
+def print_summary(summary):
+    charts, seconds = summary['charts'], summary['seconds']
+    hits = summary['signature_hits'] + summary['content_hits']
+    print(f"{Fore.GREEN}{Style.BRIGHT}{charts:,}{Style.NORMAL} charts in {seconds:.2f}s "
+          f"({charts / seconds if seconds else 0:,.1f} charts/s): {summary['rendered']:,} rendered, "
+          f"{hits:,} cached ({summary['signature_hits']:,} unchanged files, "
+          f"{summary['content_hits']:,} unchanged rows)")
+    print(f"{Fore.CYAN}Cache hit rate: {hits / charts if charts else 0:.1%}")
+    for item, error in summary['errors']:
+        print(f"{Fore.RED}{item}: {error}")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Render follower and post charts for many accounts without a display')
+    parser.add_argument('files', nargs='+', help='Stats CSV files (or account names with --storage sqlite:PATH)')
+    parser.add_argument('-o', '--output-dir', type=str, default='charts', help='Directory for the charts (default: charts)')
+    parser.add_argument('--format', choices=['png', 'svg'], default='png', help='Chart format (default: png)')
+    parser.add_argument('--history_days', type=float, default=7, help='Number of days of history to plot (default: 7)')
+    parser.add_argument('--window_size', type=int, default=7,
+                        help='Window size in days for computing followers gained per post (default: 7)')
+    parser.add_argument('--show-followers-per-post', action='store_true',
+                        help='Add the followers gained per post line')
+    parser.add_argument('--max-points', type=int, default=None,
+                        help='Points per line after min/max downsampling (default: twice the figure width in pixels, 0 = all)')
+    parser.add_argument('--dpi', type=int, default=100, help='Chart resolution (default: 100)')
+    parser.add_argument('--storage', type=str, default='csv',
+                        help='Where the stats are stored: csv (default) or sqlite:PATH, in which case files are account names')
+    parser.add_argument('--rollups', type=str, default=None, metavar='DB',
+                        help='Rollup database (see stats_rollup.py) to draw histories longer than 7 days from')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: number of CPUs)')
+    parser.add_argument('--force', action='store_true', help='Render every chart, ignoring the cache')
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    options = {
+        'history_days': args.history_days,
+        'window_size': args.window_size,
+        'show_followers_per_post': args.show_followers_per_post,
+        'max_points': args.max_points,
+        'figsize': [10, 5],
+        'dpi': args.dpi,
+        'format': args.format,
+    }
+    summary = render_charts(args.files, args.output_dir, options, args.storage, args.rollups, args.workers, args.force)
+    print_summary(summary)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+
+import os
+import json
+import math
+import time
+import argparse
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from colorama import init, Fore, Style
+from tabulate import tabulate
+from stats_storage import open_storage
+
+STAGE_PERCENTILES = (50, 95, 99)
+
+class StageTimer:
+    """Collect wall-clock durations for the named stages of one fetch cycle."""
+
+    def __init__(self):
+        self.stages = {}
+
+    @contextmanager
+    def stage(self, name):
+        """Time the enclosed block and add it to the named stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name, seconds):
+        """Add seconds to the named stage; repeated stages (e.g. retries) accumulate."""
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def get(self, name, default=None):
+        return self.stages.get(name, default)
+
+    def total(self):
+        return sum(self.stages.values())
+
+    def format(self):
+        """Return the stages as a compact 'name=0.123s' string for logs."""
+        return " ".join(f"{name}={seconds:.3f}s" for name, seconds in self.stages.items())
+
+def timings_filename(username, storage=None):
+    """
+    Per-account timing log, written next to the account's stats.
+
+    That is the CSV directory of a CsvStorage, or the directory of an SQLite
+    database; without a storage, the current directory like {username}_stats.csv.
+    """
+    if storage is None:
+        directory = '.'
+    elif hasattr(storage, 'directory'):
+        directory = storage.directory
+    else:
+        directory = os.path.dirname(storage.path) or '.'
+    return os.path.join(directory, f"{username}_timings.jsonl")
+
+def write_timings(username, timer, storage=None, **fields):
+    """Append one fetch cycle's stage timings to the account's JSON lines file (see timings_filename)."""
+    record = {
+        'datetime': datetime.now().isoformat(),
+        'account': username,
+        'stages': {name: round(seconds, 6) for name, seconds in timer.stages.items()},
+        'total': round(timer.total(), 6),
+    }
+    record.update(fields)
+    with open(timings_filename(username, storage), 'a') as f:
+        f.write(json.dumps(record) + '\n')
+
+def load_timings(path, last=None):
+    """Read timing records from a JSON lines file, keeping only the last N if given."""
+    records = deque(maxlen=last)
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                records.append(json.loads(line))
+    return list(records)
+
+def percentile(values, pct):
+    """Return the nearest-rank percentile of a list of numbers."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct * len(ordered) / 100))
+    return ordered[min(rank, len(ordered)) - 1]
+
+def summarize_timings(records):
+    """
+    Compute per-stage percentiles over timing records.
+
+    Returns:
+        dict: stage -> {'count': n, 'p50': s, 'p95': s, 'p99': s}, with 'total' last
+    """
+    samples = {}
+    for record in records:
+        for name, seconds in record.get('stages', {}).items():
+            samples.setdefault(name, []).append(seconds)
+        samples.setdefault('total', []).append(record.get('total', 0.0))
+    samples['total'] = samples.pop('total', [])
+
+    summary = {}
+    for name, values in samples.items():
+        if values:
+            summary[name] = {'count': len(values)}
+            summary[name].update({f"p{p}": percentile(values, p) for p in STAGE_PERCENTILES})
+    return summary
+
+def print_timing_summary(username, last=100, storage=None):
+    """Print p50/p95/p99 per stage over the account's last N fetch cycles."""
+    path = timings_filename(username, storage)
+    try:
+        records = load_timings(path, last)
+    except FileNotFoundError:
+        records = []
+    if not records:
+        print(f"{Fore.RED}No timing records in {path}")
+        return
+    summary = summarize_timings(records)
+    rows = [["Stage", "Count"] + [f"p{p} (s)" for p in STAGE_PERCENTILES]]
+    for name, stats in summary.items():
+        rows.append([name, stats['count']] + [f"{stats[f'p{p}']:.3f}" for p in STAGE_PERCENTILES])
+    print(f"{Fore.CYAN}Stage timings for {Style.BRIGHT}{username}{Style.NORMAL} over the last {len(records)} cycles:")
+    print(f"{Fore.CYAN}{tabulate(rows, headers='firstrow', tablefmt='fancy_grid')}")
+
+if __name__ == "__main__":
+    init(autoreset=True)  # Initialize colorama
+    parser = argparse.ArgumentParser(description='Summarize per-stage fetch timings')
+    parser.add_argument('accounts', nargs='+', help='Account name(s) whose <account>_timings.jsonl to summarize')
+    parser.add_argument('-n', '--last', type=int, default=100, help='Number of recent cycles to include (default: 100)')
+    parser.add_argument('--storage', type=str, default='csv',
+                        help='Storage the timings were written next to: csv (default), csv:DIR or sqlite:PATH')
+    args = parser.parse_args()
+    storage = open_storage(args.storage)
+    for account in args.accounts:
+        print_timing_summary(account, args.last, storage)
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+
+import argparse
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, time as dt_time
+from colorama import init, Fore, Style
+from stats_storage import CsvStorage, open_storage
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Histories are built row by row instead
+
+# Naive timestamps are stored as wall-clock seconds since this moment, so differences
+# match naive datetime subtraction; timezone-aware ones as real epoch seconds
+NAIVE_EPOCH = datetime(1970, 1, 1)
+
+class StatsHistory:
+    """
+    An account's samples as typed columns, sorted by time.
+
+    Timestamps are seconds in an array('d') (see NAIVE_EPOCH), followers and posts
+    are array('q'), which is 24 bytes per sample instead of a few hundred for a tuple of datetime and
+    ints. Rows without a follower count are skipped and a missing post count is
+    stored as 0, as the growth stats have always done.
+
+    Lookups bisect the timestamp column, so they are O(log n).
+    """
+
+    def __init__(self, rows=(), tzinfo=None):
+        self.times = array('d')
+        self.followers = array('q')
+        self.posts = array('q')
+        self.tzinfo = tzinfo
+        self.extend(rows)
+
+    def __len__(self):
+        return len(self.times)
+
+    def extend(self, rows):
+        """
+        Add storage rows, keeping the columns sorted; appending in time order is O(1) per row.
+
+        Args:
+            rows (iterable): (datetime, posts, following, followers) tuples as returned
+                by the storage backends
+        """
+        for timestamp, posts, _, fol in rows:
+            if fol is None:
+                continue
+            if self.tzinfo is None and not self.times:
+                self.tzinfo = timestamp.tzinfo
+            t = self.to_seconds(timestamp)
+            post_count = 0 if posts is None else posts
+            if not self.times or t >= self.times[-1]:
+                self.times.append(t)
+                self.followers.append(fol)
+                self.posts.append(post_count)
+            else:
+                i = bisect_right(self.times, t)
+                self.times.insert(i, t)
+                self.followers.insert(i, fol)
+                self.posts.insert(i, post_count)
+
+    @classmethod
+    def from_columns(cls, columns):
+        """Build a history from StatsColumns (see read_csv_columns) without per-row Python work."""
+        history = cls(tzinfo=columns.tzinfo)
+        followers = columns['followers']
+        keep = ~np.ma.getmaskarray(followers)
+        # datetime64[us] counts from 1970-01-01: wall-clock for naive data, UTC for aware
+        history.times.frombytes((columns.times[keep].astype(np.int64) / 1_000_000).tobytes())
+        history.followers.frombytes(followers.data[keep].astype(np.int64).tobytes())
+        history.posts.frombytes(columns['posts'].filled(0)[keep].astype(np.int64).tobytes())
+        return history
+
+    def to_seconds(self, moment):
+        """Convert a datetime to the history's time scale."""
+        if moment.tzinfo is None:
+            return (moment - NAIVE_EPOCH).total_seconds()
+        return moment.timestamp()
+
+    def datetime_at(self, i):
+        """Return sample i's timestamp as a datetime, naive unless the data was timezone-aware."""
+        if self.tzinfo is None:
+            return NAIVE_EPOCH + timedelta(seconds=self.times[i])
+        return datetime.fromtimestamp(self.times[i], self.tzinfo)
+
+    def nearest(self, target, hi=None):
+        """
+        Return the index of the sample closest to target (see to_seconds) among the first hi samples.
+
+        On a tie the later sample wins.
+        """
+        hi = len(self.times) if hi is None else hi
+        if hi <= 0:
+            return None
+        i = bisect_left(self.times, target, 0, hi)
+        if i == 0:
+            return 0
+        if i == hi:
+            return hi - 1
+        if target - self.times[i - 1] < self.times[i] - target:
+            return i - 1
+        return i
+
+    def first_on_day(self, day):
+        """Return the index of the first sample on the given date, or None."""
+        if not self.times:
+            return None
+        start = self.to_seconds(datetime.combine(day, dt_time.min, tzinfo=self.tzinfo))
+        i = bisect_left(self.times, start)
+        if i < len(self.times) and self.datetime_at(i).date() == day:
+            return i
+        return None
+
+    def trim(self, keep_seconds):
+        """
+        Drop samples older than keep_seconds before the latest one, once twice that many seconds are held.
+
+        The last sample before the cutoff is kept as the baseline of the longest window.
+        Trimming in batches keeps appends O(1) amortised.
+        """
+        if len(self.times) < 2 or self.times[-1] - self.times[0] <= 2 * keep_seconds:
+            return
+        i = max(0, bisect_left(self.times, self.times[-1] - keep_seconds) - 1)
+        self.times = self.times[i:]
+        self.followers = self.followers[i:]
+        self.posts = self.posts[i:]
+
+    def nbytes(self):
+        """Return the memory held by the columns, in bytes."""
+        return sum(column.buffer_info()[1] * column.itemsize
+                   for column in (self.times, self.followers, self.posts))
+
+    def describe(self):
+        size = self.nbytes()
+        per_sample = size / len(self) if len(self) else 0
+        return f"{len(self):,} samples, {size / 1024:,.1f} KB ({per_sample:.0f} bytes/sample)"
+
+def load_history(account, storage=None, seconds=None):
+    """
+    Load an account's history from storage in one pass.
+
+    Args:
+        account (str): Account name
+        storage: Storage backend (default: CsvStorage)
+        seconds (float): Only load samples within this many seconds of the latest
+            one with a followers count, back to the last earlier one with a count; None loads everything
+
+    Returns:
+        StatsHistory
+    """
+    storage = storage if storage is not None else CsvStorage()
+    if np is not None:
+        return StatsHistory.from_columns(storage.read_columns(account, ['posts', 'followers'], recent=seconds))
+    rows = storage.read(account) if seconds is None else storage.read_recent(account, seconds)
+    return StatsHistory(rows)
+
+if __name__ == "__main__":
+    init(autoreset=True)  # Initialize colorama
+    parser = argparse.ArgumentParser(description='Report the in-memory size of account histories')
+    parser.add_argument('accounts', nargs='+', help='Account name(s) to load')
+    parser.add_argument('--storage', type=str, default='csv',
+                        help='Where the stats are stored: csv (<account>_stats.csv, default), csv:DIR or sqlite:PATH')
+    args = parser.parse_args()
+
+    storage = open_storage(args.storage)
+    for account in args.accounts:
+        history = load_history(account, storage)
+        print(f"{Fore.CYAN}{Style.BRIGHT}{account}{Style.NORMAL}: {history.describe()}")
@@ -0,0 +1,382 @@
+#!/usr/bin/env python
+
+import sqlite3
+import argparse
+import threading
+from datetime import timedelta
+from colorama import init, Fore, Style
+from stats_storage import open_storage, parse_timestamp, stats_row_values, columns_from_rows
+from stats_history import StatsHistory, load_history
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # load_columns needs NumPy; everything else works without it
+
+# Rollup resolutions, finest first: name -> bucket length in seconds
+RESOLUTIONS = {'minute': 60, 'hour': 3600, 'day': 86400}
+
+# Spans up to this long are always read from the raw samples
+RAW_SECONDS = 7 * 86400
+
+# Default number of buckets a long-range query should get at least
+ROLLUP_POINTS = 720
+
+def bucket_start(moment, resolution):
+    """Return the start of the minute, hour or day containing moment (wall-clock, keeping its tzinfo)."""
+    if resolution == 'minute':
+        return moment.replace(second=0, microsecond=0)
+    if resolution == 'hour':
+        return moment.replace(minute=0, second=0, microsecond=0)
+    return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+
+def choose_resolution(seconds, points=ROLLUP_POINTS):
+    """
+    Pick the coarsest rollup that still has enough resolution for a span.
+
+    Args:
+        seconds (float): Length of the span to cover
+        points (int): Buckets the span should be split into at least
+
+    Returns:
+        str: 'day', 'hour' or 'minute'
+    """
+    for resolution in ('day', 'hour'):
+        if RESOLUTIONS[resolution] * points <= seconds:
+            return resolution
+    return 'minute'
+
+def _time_key(moment):
+    """Fixed-width ISO form, so stored times compare correctly as strings."""
+    return moment.isoformat(timespec='microseconds')
+
+class RollupStore:
+    """
+    Per-account minute, hour and day rollups in an SQLite database.
+
+    Each bucket keeps the first and last sample (time, followers, posts), the
+    minimum and maximum followers and posts, and the number of samples. Buckets
+    are merged with an upsert, so rows can be added one at a time as they are
+    fetched or in batches by a compaction pass. Rows without a follower count
+    are skipped, as the growth stats skip them.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.execute('''
+            CREATE TABLE IF NOT EXISTS rollups (
+                account TEXT NOT NULL,
+                resolution TEXT NOT NULL,
+                bucket TEXT NOT NULL,
+                first_time TEXT NOT NULL,
+                last_time TEXT NOT NULL,
+                first_followers INTEGER,
+                last_followers INTEGER,
+                min_followers INTEGER,
+                max_followers INTEGER,
+                first_posts INTEGER,
+                last_posts INTEGER,
+                min_posts INTEGER,
+                max_posts INTEGER,
+                samples INTEGER NOT NULL,
+                PRIMARY KEY (account, resolution, bucket)
+            ) WITHOUT ROWID
+        ''')
+        self.connection.execute('''
+            CREATE TABLE IF NOT EXISTS rollup_state (
+                account TEXT PRIMARY KEY,
+                last_time TEXT NOT NULL
+            )
+        ''')
+        self.connection.commit()
+
+    def add(self, account, rows):
+        """
+        Merge storage rows into the account's rollups in one transaction.
+
+        Args:
+            account (str): Account name
+            rows (iterable): (datetime, posts, following, followers) tuples as returned
+                by the storage backends
+
+        Returns:
+            int: Number of rows merged
+        """
+        buckets = {}
+        latest = None
+        count = 0
+        for timestamp, posts, _, followers in rows:
+            if followers is None:
+                continue
+            count += 1
+            key = _time_key(timestamp)
+            latest = key if latest is None or key > latest else latest
+            for resolution in RESOLUTIONS:
+                bucket = (resolution, bucket_start(timestamp, resolution).isoformat())
+                agg = buckets.get(bucket)
+                if agg is None:
+                    buckets[bucket] = [key, key, followers, followers, followers, followers,
+                                       posts, posts, posts, posts, 1]
+                    continue
+                if key < agg[0]:
+                    agg[0], agg[2], agg[6] = key, followers, posts
+                if key >= agg[1]:
+                    agg[1], agg[3], agg[7] = key, followers, posts
+                agg[4] = min(agg[4], followers)
+                agg[5] = max(agg[5], followers)
+                if posts is not None:
+                    agg[8] = posts if agg[8] is None else min(agg[8], posts)
+                    agg[9] = posts if agg[9] is None else max(agg[9], posts)
+                agg[10] += 1
+        if not buckets:
+            return 0
+
+        values = [(account, resolution, bucket, *agg) for (resolution, bucket), agg in buckets.items()]
+        with self.lock, self.connection:
+            # Every SET expression sees the bucket's old values, so the order doesn't matter
+            self.connection.executemany('''
+                INSERT INTO rollups (account, resolution, bucket, first_time, last_time,
+                                     first_followers, last_followers, min_followers, max_followers,
+                                     first_posts, last_posts, min_posts, max_posts, samples)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (account, resolution, bucket) DO UPDATE SET
+                    first_time = MIN(first_time, excluded.first_time),
+                    first_followers = CASE WHEN excluded.first_time < first_time
+                                           THEN excluded.first_followers ELSE first_followers END,
+                    first_posts = CASE WHEN excluded.first_time < first_time
+                                       THEN excluded.first_posts ELSE first_posts END,
+                    last_time = MAX(last_time, excluded.last_time),
+                    last_followers = CASE WHEN excluded.last_time >= last_time
+                                          THEN excluded.last_followers ELSE last_followers END,
+                    last_posts = CASE WHEN excluded.last_time >= last_time
+                                      THEN excluded.last_posts ELSE last_posts END,
+                    min_followers = MIN(min_followers, excluded.min_followers),
+                    max_followers = MAX(max_followers, excluded.max_followers),
+                    min_posts = MIN(COALESCE(min_posts, excluded.min_posts), COALESCE(excluded.min_posts, min_posts)),
+                    max_posts = MAX(COALESCE(max_posts, excluded.max_posts), COALESCE(excluded.max_posts, max_posts)),
+                    samples = samples + excluded.samples
+            ''', values)
+            self.connection.execute('''
+                INSERT INTO rollup_state (account, last_time) VALUES (?, ?)
+                ON CONFLICT (account) DO UPDATE SET last_time = MAX(last_time, excluded.last_time)
+            ''', (account, latest))
+        return count
+
+    def add_stats_rows(self, account, rows):
+        """Merge row dicts (see stats_row), as written by the fetcher."""
+        return self.add(account, [stats_row_values(row) for row in rows])
+
+    def last_time(self, account):
+        """Return the time of the latest sample merged for the account, or None."""
+        with self.lock:
+            row = self.connection.execute('SELECT last_time FROM rollup_state WHERE account = ?',
+                                          (account,)).fetchone()
+        return parse_timestamp(row[0]) if row else None
+
+    def update_from_storage(self, storage, account):
+        """
+        Compact the rows a storage backend holds beyond the rollups' last merged sample.
+
+        Only the tail of the account's data is read. Rows older than the last merged
+        sample that arrive later are not picked up; rebuild() the account for those.
+
+        Returns:
+            int: Number of rows merged
+        """
+        last = self.last_time(account)
+        if last is None:
+            rows = storage.read(account)
+        else:
+            rows = [row for row in storage.read(account, start=last) if row[0] > last]
+        return self.add(account, rows)
+
+    def rebuild(self, storage, account):
+        """Drop the account's rollups and compact all of its rows again."""
+        with self.lock, self.connection:
+            self.connection.execute('DELETE FROM rollups WHERE account = ?', (account,))
+            self.connection.execute('DELETE FROM rollup_state WHERE account = ?', (account,))
+        return self.update_from_storage(storage, account)
+
+    def buckets(self, account, resolution, start=None, end=None):
+        """
+        Read an account's buckets at one resolution.
+
+        Args:
+            account (str): Account name
+            resolution (str): 'minute', 'hour' or 'day'
+            start (datetime): Only buckets containing or after this time
+            end (datetime): Only buckets starting at or before this time
+
+        Returns:
+            list: dicts with bucket, first_time, last_time (datetimes) and the
+            first/last/min/max followers and posts and samples, oldest first
+        """
+        query = ('SELECT bucket, first_time, last_time, first_followers, last_followers, min_followers, '
+                 'max_followers, first_posts, last_posts, min_posts, max_posts, samples '
+                 'FROM rollups WHERE account = ? AND resolution = ?')
+        params = [account, resolution]
+        if start is not None:
+            query += ' AND bucket >= ?'
+            params.append(bucket_start(start, resolution).isoformat())
+        if end is not None:
+            query += ' AND bucket <= ?'
+            params.append(bucket_start(end, resolution).isoformat())
+        query += ' ORDER BY bucket'
+        with self.lock:
+            cursor = self.connection.execute(query, params)
+            names = [column[0] for column in cursor.description]
+            rows = cursor.fetchall()
+        buckets = []
+        for row in rows:
+            bucket = dict(zip(names, row))
+            for name in ('bucket', 'first_time', 'last_time'):
+                bucket[name] = parse_timestamp(bucket[name])
+            buckets.append(bucket)
+        return buckets
+
+    def history(self, account, resolution, start=None, before=None):
+        """
+        Build a StatsHistory from the first and last sample of each bucket.
+
+        Nearest-sample lookups on it are off by at most one bucket, and the first
+        sample of every hour, day or week at or above the resolution is exact, so
+        gain_series gives the same answer as on the raw samples.
+
+        Args:
+            account (str): Account name
+            resolution (str): 'minute', 'hour' or 'day'
+            start (datetime): Only buckets containing or after this time
+            before (datetime): Only samples strictly before this time
+        """
+        return StatsHistory(self.edge_rows(account, resolution, start, before))
+
+    def edge_rows(self, account, resolution, start=None, before=None):
+        """
+        Return the first and last sample of each bucket as (datetime, posts, following, followers) rows.
+
+        following is always None and posts is None where the sample had none;
+        see history for the arguments.
+        """
+        rows = []
+        for bucket in self.buckets(account, resolution, start):
+            rows.append((bucket['first_time'], bucket['first_posts'], None, bucket['first_followers']))
+            if bucket['last_time'] != bucket['first_time']:
+                rows.append((bucket['last_time'], bucket['last_posts'], None, bucket['last_followers']))
+        if before is not None:
+            rows = [row for row in rows if row[0] < before]
+        return rows
+
+    def load_history(self, account, storage=None, seconds=None, points=ROLLUP_POINTS, raw_seconds=RAW_SECONDS):
+        """
+        Like stats_history.load_history, answering long spans from the rollups.
+
+        The last raw_seconds come from the raw samples, so short windows stay
+        exact; everything older comes from the coarsest rollup that still splits
+        the span into points buckets. Falls back to the raw samples when the
+        rollups have not caught up with them.
+
+        Returns:
+            StatsHistory
+        """
+        if seconds is None or seconds <= raw_seconds:
+            return load_history(account, storage, seconds)
+        recent = load_history(account, storage, raw_seconds)
+        if len(recent) == 0:
+            return recent
+        first = recent.datetime_at(0)
+        last = self.last_time(account)
+        if last is None or last < first:
+            return load_history(account, storage, seconds)
+
+        resolution = choose_resolution(seconds, points)
+        start = recent.datetime_at(len(recent) - 1) - timedelta(seconds=seconds + RESOLUTIONS[resolution])
+        history = self.history(account, resolution, start=start, before=first)
+        if history.tzinfo is None:
+            history.tzinfo = recent.tzinfo
+        history.times.extend(recent.times)
+        history.followers.extend(recent.followers)
+        history.posts.extend(recent.posts)
+        return history
+
+    def load_columns(self, account, storage, seconds, points=ROLLUP_POINTS, raw_seconds=RAW_SECONDS):
+        """
+        Like load_history, as StatsColumns for charts (see storage.read_columns).
+
+        The last raw_seconds are read with storage.read_columns, so 'N/A' counts
+        stay masked and every column is kept; older samples are the bucket edges
+        of the coarsest rollup that splits the span into points buckets, with
+        following masked. Falls back to the raw samples when the rollups have not
+        caught up with them.
+
+        Returns:
+            StatsColumns
+        """
+        if seconds <= raw_seconds:
+            return storage.read_columns(account, recent=seconds)
+        recent = storage.read_columns(account, recent=raw_seconds)
+        if len(recent) == 0:
+            return recent
+        last = self.last_time(account)
+        if last is None or recent.to_datetime64(last) < recent.times[0]:
+            return storage.read_columns(account, recent=seconds)
+
+        resolution = choose_resolution(seconds, points)
+        end = recent.times[-1] - np.timedelta64(int((seconds + RESOLUTIONS[resolution]) * 1_000_000), 'us')
+        # last is at or before the latest raw sample, so this reads a superset of the span
+        start = last - timedelta(seconds=seconds + RESOLUTIONS[resolution])
+        older = columns_from_rows(self.edge_rows(account, resolution, start), list(recent.counts))
+        older = older.select((older.times >= end) & (older.times < recent.times[0]))
+        return older.concat(recent)
+
+    def accounts(self):
+        with self.lock:
+            return [row[0] for row in self.connection.execute('SELECT account FROM rollup_state ORDER BY account')]
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+class RollupStorage:
+    """
+    A storage backend that also merges every appended row into a RollupStore.
+
+    Wrap the fetcher's storage with it to keep the rollups current without a
+    separate compaction step; everything but append goes to the wrapped storage.
+    """
+
+    def __init__(self, storage, rollups):
+        self.storage = storage
+        self.rollups = rollups
+
+    def append(self, account, rows):
+        self.storage.append(account, rows)
+        self.rollups.add_stats_rows(account, rows)
+
+    def __getattr__(self, name):
+        return getattr(self.storage, name)
+
+if __name__ == "__main__":
+    init(autoreset=True)  # Initialize colorama
+    parser = argparse.ArgumentParser(description='Compact stats into minute, hour and day rollups')
+    parser.add_argument('db', help='Rollup database to create or update')
+    parser.add_argument('accounts', nargs='*', help='Account name(s) to compact (default: every account in the storage)')
+    parser.add_argument('--storage', type=str, default='csv',
+                        help='Where the stats are stored: csv (<account>_stats.csv, default), csv:DIR or sqlite:PATH')
+    parser.add_argument('--rebuild', action='store_true',
+                        help="Drop the accounts' rollups and compact all of their rows again")
+    args = parser.parse_args()
+
+    storage = open_storage(args.storage)
+    rollups = RollupStore(args.db)
+    for account in args.accounts or storage.accounts():
+        try:
+            count = rollups.rebuild(storage, account) if args.rebuild else rollups.update_from_storage(storage, account)
+        except FileNotFoundError:
+            print(f"{Fore.RED}No stats for {account}")
+            continue
+        print(f"{Fore.GREEN}Compacted {Style.BRIGHT}{count:,}{Style.NORMAL} new rows for {account}")
+    rollups.close()
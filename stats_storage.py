@@ -0,0 +1,724 @@
+#!/usr/bin/env python
+
+import os
+import csv
+import glob
+import sqlite3
+import argparse
+import threading
+import warnings
+from datetime import datetime, timedelta, timezone
+from colorama import init, Fore, Style
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # read_columns needs NumPy; read() works without it
+
+FIELDNAMES = ['datetime', 'posts', 'following', 'followers']
+
+def parse_timestamp(value):
+    """Parse a stored ISO timestamp, accepting a trailing 'Z' for UTC."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+def parse_int(value):
+    """Parse a stored count; empty cells and 'N/A' become None."""
+    if value is None or value == '' or value == 'N/A':
+        return None
+    return int(value)
+
+def stats_row(stats, timestamp=None):
+    """Build a storage row dict from fetched profile stats."""
+    return {
+        'datetime': timestamp or datetime.now().isoformat(),
+        'posts': stats.get('posts', ''),
+        'following': stats.get('following', ''),
+        'followers': stats.get('followers', ''),
+    }
+
+def stats_row_values(row):
+    """Convert a row dict (see stats_row) to the (datetime, posts, following, followers) tuple the readers return."""
+    return (parse_timestamp(row['datetime']), parse_int(str(row['posts'])),
+            parse_int(str(row['following'])), parse_int(str(row['followers'])))
+
+class CsvStorage:
+    """Per-account {account}_stats.csv files, the original storage format."""
+
+    def __init__(self, directory='.'):
+        self.directory = directory
+
+    def path(self, account):
+        return os.path.join(self.directory, f"{account}_stats.csv")
+
+    def describe(self, account):
+        return self.path(account)
+
+    def append(self, account, rows):
+        """Append row dicts (see stats_row) to the account's CSV, writing the header for a new file."""
+        filename = self.path(account)
+        file_exists = os.path.isfile(filename)
+        with open(filename, 'a', newline='') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=FIELDNAMES)
+            if not file_exists:
+                writer.writeheader()
+            writer.writerows(rows)
+
+    def tail(self, account):
+        """Return a CsvTail that reads only rows appended since its last update."""
+        return CsvTail(self.path(account))
+
+    def read(self, account, start=None, end=None, include_previous=False):
+        """
+        Read an account's samples.
+
+        Args:
+            account (str): Account name
+            start (datetime): Only return samples at or after this time
+            end (datetime): Only return samples at or before this time
+            include_previous (bool): Also return the samples from the last one before
+                start that has a followers count, so nearest-sample lookups at the
+                window edge see both neighbours
+
+        Returns:
+            list: (datetime, posts, following, followers) tuples sorted by time;
+            counts are None where the CSV has 'N/A' or an empty cell
+
+        Raises:
+            FileNotFoundError: If the account has no CSV file
+        """
+        # Only the part of the file from just before start is parsed
+        rows = read_csv_rows(self.path(account), start=start)
+        return filter_rows(rows, start, end, include_previous)
+
+    def read_recent(self, account, seconds):
+        """
+        Read the samples within seconds of the account's latest one with a followers count.
+
+        Rows go back to the last earlier sample with a followers count, so the window
+        edge keeps its anchor when the rows around it are 'N/A' (see filter_rows).
+        """
+        rows = read_csv_rows(self.path(account), recent=seconds)
+        if not rows:
+            return rows
+        return filter_rows(rows, recent_cutoff(rows, seconds), include_previous=True)
+
+    def read_columns(self, account, columns=None, start=None, end=None, recent=None):
+        """Bulk-load an account's samples as StatsColumns; see read_csv_columns."""
+        return read_csv_columns(self.path(account), columns, start, end, recent)
+
+    def signature(self, account):
+        """Return a value that changes whenever the account's data does: the file's size and mtime."""
+        try:
+            stat = os.stat(self.path(account))
+        except FileNotFoundError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def accounts(self):
+        suffix = '_stats.csv'
+        return sorted(os.path.basename(path)[:-len(suffix)]
+                      for path in glob.glob(os.path.join(self.directory, f"*{suffix}")))
+
+def header_columns(header):
+    """Return the (time, posts, following, followers) column positions of a stats CSV header; following may be None."""
+    timestamp_index = next(i for i, key in enumerate(header) if 'time' in key.lower())
+    post_index = next(i for i, key in enumerate(header) if 'post' in key.lower())
+    following_index = next((i for i, key in enumerate(header) if 'following' in key.lower()), None)
+    fol_index = next(i for i, key in enumerate(header) if 'follower' in key.lower())
+    return timestamp_index, post_index, following_index, fol_index
+
+def parse_csv_row(row, columns):
+    """Parse one CSV row into a (datetime, posts, following, followers) tuple."""
+    timestamp_index, post_index, following_index, fol_index = columns
+    return (
+        parse_timestamp(row[timestamp_index]),
+        parse_int(row[post_index]),
+        parse_int(row[following_index]) if following_index is not None else None,
+        parse_int(row[fol_index]),
+    )
+
+def _line_timestamp(line, timestamp_index):
+    return parse_timestamp(line.decode('utf-8').rstrip('\r\n').split(',')[timestamp_index])
+
+def _last_timestamp(file, data_start, size, timestamp_index):
+    """Return the timestamp of the last complete line of a CSV, or None if there is none."""
+    block = 4096
+    while True:
+        pos = max(data_start, size - block)
+        file.seek(pos)
+        lines = file.read(size - pos).split(b'\n')
+        # The first piece may be the end of an earlier line, the last one a line still being written
+        candidates = lines[1:-1] if pos > data_start else lines[:-1]
+        for line in reversed(candidates):
+            if line.strip():
+                return _line_timestamp(line, timestamp_index)
+        if pos == data_start:
+            return None
+        block *= 4
+
+def _window_offset(file, data_start, timestamp_index, start=None, recent=None):
+    """
+    Find where to start parsing a time-sorted CSV so that a time window is covered.
+
+    Seeks backward from the end in steps that double in size, parsing one line per
+    step, until it finds a line older than the window start. The bytes left to
+    parse are therefore proportional to the window, not to the file.
+
+    Returns:
+        int: Offset of a line at or before the last row older than the window, or
+        data_start when the window reaches the first row or a timestamp cannot be read
+    """
+    size = file.seek(0, os.SEEK_END)
+    try:
+        cutoff = start
+        if recent is not None:
+            latest = _last_timestamp(file, data_start, size, timestamp_index)
+            if latest is None:
+                return data_start
+            cutoff = latest - timedelta(seconds=recent)
+            if start is not None:
+                cutoff = min(cutoff, start)
+        step = 1 << 16
+        pos = size
+        while pos > data_start:
+            pos = max(data_start, pos - step)
+            step *= 2
+            file.seek(pos)
+            if pos > data_start:
+                file.readline()  # Skip to the next line start
+            line_start = file.tell()
+            line = file.readline()
+            if line.strip() and _line_timestamp(line, timestamp_index) < cutoff:
+                return line_start
+    except (ValueError, IndexError, TypeError):
+        pass  # Unparseable timestamp, or naive and aware times mixed: read everything
+    return data_start
+
+def read_csv_tail(path, start=None, recent=None):
+    """
+    Read a stats CSV's header and the part of its body a time window needs.
+
+    Args:
+        path (str): CSV file, assumed to be appended in time order
+        start (datetime): Window start
+        recent (float): Window of this many seconds before the latest row
+
+    Returns:
+        tuple: (header fields, body text, complete) where complete is False when
+        the body starts part-way through the file
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    with open(path, 'rb') as file:
+        header = file.readline().decode('utf-8').strip('\r\n').split(',')
+        data_start = file.tell()
+        offset = data_start
+        if start is not None or recent is not None:
+            offset = _window_offset(file, data_start, header_columns(header)[0], start, recent)
+        file.seek(offset)
+        body = file.read().decode('utf-8')
+    return header, body, offset == data_start
+
+def recent_cutoff(rows, seconds):
+    """
+    Return where a window of seconds before the latest sample starts.
+
+    The window is measured from the latest row with a followers count, as the
+    growth windows are, falling back to the latest row when none has one.
+    """
+    latest = next((row[0] for row in reversed(rows) if row[3] is not None), rows[-1][0] if rows else None)
+    return latest - timedelta(seconds=seconds) if latest is not None else None
+
+def read_csv_rows(path, start=None, recent=None):
+    """
+    Read a stats CSV as (datetime, posts, following, followers) tuples sorted by time.
+
+    With start or recent only the tail of the file the window needs is parsed
+    (plus some rows before it; see read_csv_tail). If that tail turns out not to be
+    in time order, or a recent window's tail has no earlier row with a followers
+    count to anchor it, the whole file is read instead.
+    """
+    for window in ((start, recent), (None, None)):
+        header, body, complete = read_csv_tail(path, *window)
+        columns = header_columns(header)
+        rows = [parse_csv_row(row, columns) for row in csv.reader(body.splitlines()) if row]
+        if complete:
+            break
+        if all(a[0] <= b[0] for a, b in zip(rows, rows[1:])):
+            if recent is None:
+                break
+            cutoff = recent_cutoff(rows, recent)
+            if any(row[0] < cutoff and row[3] is not None for row in rows):
+                break
+    rows.sort(key=lambda row: row[0])
+    return rows
+
+class CsvTail:
+    """
+    Follow a growing stats CSV, parsing only the rows appended since the last update.
+
+    The byte offset of the last complete line is remembered between updates, so the
+    cost of an update is proportional to the new rows. A file that shrinks
+    (truncation) or is replaced by a new file (rotation) is re-read from the start.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.offset = 0
+        self.file_id = None
+        self.columns = None
+
+    def update(self):
+        """
+        Read the rows appended since the previous update.
+
+        Returns:
+            tuple: (rows, reset) where rows are (datetime, posts, following, followers)
+            tuples in file order, and reset is True when the file was truncated or
+            rotated, in which case rows is the whole new file and earlier rows must
+            be discarded
+
+        Raises:
+            FileNotFoundError: If the file does not exist on the first update
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            if self.file_id is None:
+                raise
+            return [], False  # Rotated away; the new file has not been created yet
+
+        reset = False
+        file_id = (stat.st_dev, stat.st_ino)
+        if self.file_id is not None and (file_id != self.file_id or stat.st_size < self.offset):
+            reset = True
+            self.offset = 0
+            self.columns = None
+        self.file_id = file_id
+        if stat.st_size == self.offset:
+            return [], reset
+
+        with open(self.path, 'rb') as file:
+            file.seek(self.offset)
+            chunk = file.read()
+        # Leave a partially written last line for the next update
+        end = chunk.rfind(b'\n') + 1
+        if end == 0:
+            return [], reset
+        self.offset += end
+
+        lines = chunk[:end].decode('utf-8').splitlines()
+        reader = csv.reader(lines)
+        if self.columns is None:
+            self.columns = header_columns(next(reader))
+        return [parse_csv_row(row, self.columns) for row in reader if row], reset
+
+    def skip_to_end(self):
+        """
+        Start following from the current end of the file, without parsing it.
+
+        The next update returns only rows appended after this call (a partially
+        written last line counts as appended). Call it before bulk-loading the
+        file, then drop rows the load already saw.
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return
+        if stat.st_size == 0:
+            return  # No header yet; the first update reads the file from the start
+        with open(self.path, 'rb') as file:
+            self.columns = header_columns(next(csv.reader([file.readline().decode('utf-8')]), []))
+            data_start = file.tell()
+            file.seek(max(data_start, stat.st_size - 65536))
+            chunk = file.read(stat.st_size - file.tell())
+        self.file_id = (stat.st_dev, stat.st_ino)
+        last_newline = chunk.rfind(b'\n')
+        self.offset = stat.st_size - len(chunk) + last_newline + 1 if last_newline >= 0 else data_start
+
+class StatsColumns:
+    """
+    Stats samples as NumPy columns, sorted by time.
+
+    times is datetime64[us]: wall-clock time for naive timestamps, UTC for
+    timezone-aware ones, with the zone kept in tzinfo. Counts are int64 masked
+    arrays; 'N/A' and empty cells are masked.
+    """
+
+    def __init__(self, times, counts, tzinfo=None):
+        self.times = times
+        self.counts = counts
+        self.tzinfo = tzinfo
+
+    def __len__(self):
+        return len(self.times)
+
+    def __getitem__(self, name):
+        return self.times if name == 'datetime' else self.counts[name]
+
+    def is_sorted(self):
+        return len(self.times) < 2 or not (self.times[1:] < self.times[:-1]).any()
+
+    def sorted(self):
+        """Return the samples in time order; equal timestamps keep their file order."""
+        return self if self.is_sorted() else self.select(np.argsort(self.times, kind='stable'))
+
+    def select(self, index):
+        """Return the samples at index (a slice, mask or index array) as new StatsColumns."""
+        return StatsColumns(self.times[index], {name: values[index] for name, values in self.counts.items()},
+                            self.tzinfo)
+
+    def window(self, start=None, end=None, recent=None):
+        """
+        Restrict to a time range.
+
+        Args:
+            start (datetime): Keep samples at or after this time
+            end (datetime): Keep samples at or before this time
+            recent (float): Keep samples within this many seconds of the latest one with
+                a followers count, back to the last earlier one with a count, like read_recent
+        """
+        lo, hi = 0, len(self.times)
+        if recent is not None and hi:
+            lo = self._recent_start(recent)[0]
+        if start is not None:
+            lo = max(lo, int(np.searchsorted(self.times, self.to_datetime64(start), side='left')))
+        if end is not None:
+            hi = int(np.searchsorted(self.times, self.to_datetime64(end), side='right'))
+        if lo == 0 and hi == len(self.times):
+            return self
+        return self.select(slice(lo, max(lo, hi)))
+
+    def concat(self, other):
+        """Return these samples followed by other's, which must have the same count columns."""
+        return StatsColumns(np.concatenate([self.times, other.times]),
+                            {name: np.ma.concatenate([values, other.counts[name]])
+                             for name, values in self.counts.items()}, self.tzinfo or other.tzinfo)
+
+    def _recent_start(self, recent):
+        """
+        Find where a recent window starts: the last sample with a followers count before its cutoff.
+
+        The cutoff is measured from the latest sample with a followers count, like recent_cutoff.
+
+        Returns:
+            tuple: (index, anchored) where anchored is False if no sample before the
+            cutoff has a followers count (index is then the sample just before it)
+        """
+        if 'followers' in self.counts:
+            counted = np.flatnonzero(~np.ma.getmaskarray(self.counts['followers']))
+        else:
+            counted = np.arange(len(self.times))
+        if not len(counted):
+            return 0, False
+        cutoff = self.times[counted[-1]] - np.timedelta64(int(recent * 1_000_000), 'us')
+        before = counted[self.times[counted] < cutoff]
+        if len(before):
+            return int(before[-1]), True
+        return max(int(np.searchsorted(self.times, cutoff, side='left')) - 1, 0), False
+
+    def to_datetime64(self, moment):
+        """Convert a datetime to the datetime64[us] scale of times."""
+        if moment.tzinfo is not None:
+            moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+        return np.datetime64(moment, 'us')
+
+def columns_from_rows(rows, columns=None):
+    """Build StatsColumns from (datetime, posts, following, followers) tuples, in the given order."""
+    columns = columns or FIELDNAMES[1:]
+    tzinfo = rows[0][0].tzinfo if rows else None
+    times = np.array([timestamp if timestamp.tzinfo is None else
+                      timestamp.astimezone(timezone.utc).replace(tzinfo=None) for timestamp, *_ in rows],
+                     dtype='datetime64[us]')
+    counts = {}
+    for name in columns:
+        position = FIELDNAMES.index(name)
+        values = [row[position] for row in rows]
+        mask = np.array([value is None for value in values], dtype=bool)
+        counts[name] = np.ma.MaskedArray(np.array([0 if value is None else value for value in values],
+                                                  dtype=np.int64), mask)
+    return StatsColumns(times, counts, tzinfo)
+
+def _load_csv_body(body, positions, columns):
+    """
+    Parse a stats CSV body (no header) with NumPy's C text loader.
+
+    'N/A' and empty counts are rewritten to nan in bulk first, so each count column
+    loads as float64 and is masked where it is nan.
+
+    Returns:
+        StatsColumns, or None if the body needs the row-by-row parser
+    """
+    if '"' in body:
+        return None
+    if ',N/A' in body:
+        body = body.replace(',N/A', ',nan')
+    if ',,' in body:
+        body = body.replace(',,', ',nan,').replace(',,', ',nan,')
+    if ',\n' in body:
+        body = body.replace(',\n', ',nan\n')
+    if body.endswith(','):
+        body += 'nan'
+
+    loaded = [name for name in columns if positions[name] is not None]
+    dtype = [('datetime', 'S40')] + [(name, 'f8') for name in loaded]
+    try:
+        with warnings.catch_warnings():
+            # numpy only warns, rather than failing, on a trailing Z or UTC offset
+            warnings.simplefilter('error')
+            table = np.loadtxt(body.splitlines(), delimiter=',', dtype=dtype, comments=None, ndmin=1,
+                               usecols=[positions['datetime']] + [positions[name] for name in loaded])
+            stamps = np.ascontiguousarray(table['datetime'])
+            if len(stamps) and stamps.view(np.uint8).reshape(len(stamps), -1)[:, -1].any():
+                return None  # A timestamp filled the whole field and may have been cut off
+            times = stamps.astype('datetime64[us]')
+    except (ValueError, UserWarning, DeprecationWarning):
+        return None
+
+    counts = {}
+    for name in columns:
+        if positions[name] is None:
+            counts[name] = np.ma.masked_all(len(times), dtype=np.int64)
+        else:
+            values = table[name]
+            mask = np.isnan(values)
+            counts[name] = np.ma.MaskedArray(np.where(mask, 0, values).astype(np.int64), mask)
+    return StatsColumns(times, counts)
+
+def read_csv_columns(path, columns=None, start=None, end=None, recent=None):
+    """
+    Bulk-load a datetime,posts,following,followers CSV into NumPy columns.
+
+    The file is parsed by NumPy's C loader and the timestamps with one datetime64
+    cast, so there is no per-row Python work. Files the fast path cannot handle
+    (quoted fields, ragged rows, timestamps with a UTC offset) are parsed row by
+    row instead, with the same result.
+
+    Args:
+        path (str): CSV file
+        columns (list): Count columns to load (default: posts, following, followers)
+        start, end, recent: Time range, see StatsColumns.window; with start or
+            recent only the tail of the file is parsed (see read_csv_tail), unless
+            a recent window's earlier followers count is not in that tail
+
+    Returns:
+        StatsColumns
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    columns = columns or FIELDNAMES[1:]
+    # Parse only the tail the window needs; a tail out of time order means the
+    # file is not append-only, so read all of it instead
+    for window in ((start, recent), (None, None)):
+        header, body, complete = read_csv_tail(path, *window)
+        positions = dict(zip(FIELDNAMES, header_columns(header)))
+        body = body.replace('\r', '').strip('\n')
+        result = _load_csv_body(body, positions, columns) if body else columns_from_rows([], columns)
+        if result is None:
+            header_positions = header_columns(header)
+            result = columns_from_rows([parse_csv_row(row, header_positions)
+                                        for row in csv.reader(body.splitlines()) if row], columns)
+        if complete:
+            break
+        if result.is_sorted() and (recent is None or not len(result) or result._recent_start(recent)[1]):
+            break
+    return result.sorted().window(start, end, recent)
+
+def filter_rows(rows, start=None, end=None, include_previous=False):
+    """
+    Restrict time-sorted rows to [start, end].
+
+    With include_previous, rows are kept from the last one before start that has a
+    followers count (or the row just before start if none has), so the window edge
+    still has an anchor when the rows just before it are 'N/A'.
+    """
+    if start is not None:
+        first = next((i for i, row in enumerate(rows) if row[0] >= start), len(rows))
+        if include_previous and first > 0:
+            first = next((i for i in range(first - 1, -1, -1) if rows[i][3] is not None), first - 1)
+        rows = rows[first:]
+    if end is not None:
+        rows = [row for row in rows if row[0] <= end]
+    return rows
+
+class SQLiteStorage:
+    """
+    All accounts in one SQLite database, keyed by (account, datetime).
+
+    The primary key doubles as the index, so window reads are index range scans.
+    One connection is shared between threads behind a lock; WAL mode lets analytics
+    processes read while the fetcher writes.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.execute('''
+            CREATE TABLE IF NOT EXISTS stats (
+                account TEXT NOT NULL,
+                datetime TEXT NOT NULL,
+                posts INTEGER,
+                following INTEGER,
+                followers INTEGER,
+                PRIMARY KEY (account, datetime)
+            ) WITHOUT ROWID
+        ''')
+        self.connection.commit()
+
+    def describe(self, account):
+        return f"{self.path} (account {account})"
+
+    def append(self, account, rows):
+        """Insert row dicts (see stats_row) in one transaction; a repeated timestamp replaces the old row."""
+        values = [(account, row['datetime'], parse_int(str(row['posts'])), parse_int(str(row['following'])),
+                   parse_int(str(row['followers']))) for row in rows]
+        with self.lock, self.connection:
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO stats (account, datetime, posts, following, followers) '
+                'VALUES (?, ?, ?, ?, ?)', values)
+
+    def tail(self, account):
+        """Return an SQLiteTail that reads only rows added since its last update."""
+        return SQLiteTail(self, account)
+
+    def latest(self, account, counted=False):
+        """Return the account's latest timestamp as stored (with counted, the latest with followers), or None."""
+        query = 'SELECT MAX(datetime) FROM stats WHERE account = ?'
+        if counted:
+            query += ' AND followers IS NOT NULL'
+        with self.lock:
+            return self.connection.execute(query, (account,)).fetchone()[0]
+
+    def read(self, account, start=None, end=None, include_previous=False):
+        """Read an account's samples; same arguments and result as CsvStorage.read."""
+        query = 'SELECT datetime, posts, following, followers FROM stats WHERE account = ?'
+        params = [account]
+        if start is not None:
+            if include_previous:
+                # Back to the last earlier sample with a followers count, like filter_rows
+                query += (' AND datetime >= COALESCE((SELECT MAX(datetime) FROM stats '
+                          'WHERE account = ? AND datetime < ? AND followers IS NOT NULL), '
+                          '(SELECT MAX(datetime) FROM stats WHERE account = ? AND datetime < ?), ?)')
+                params += [account, start.isoformat(), account, start.isoformat(), start.isoformat()]
+            else:
+                query += ' AND datetime >= ?'
+                params.append(start.isoformat())
+        if end is not None:
+            query += ' AND datetime <= ?'
+            params.append(end.isoformat())
+        query += ' ORDER BY datetime'
+        with self.lock:
+            rows = self.connection.execute(query, params).fetchall()
+        return [(parse_timestamp(timestamp), posts, following, followers)
+                for timestamp, posts, following, followers in rows]
+
+    def read_recent(self, account, seconds):
+        """Read the samples within seconds of the account's latest one; see CsvStorage.read_recent."""
+        latest = self.latest(account, counted=True) or self.latest(account)
+        if latest is None:
+            return []
+        return self.read(account, start=parse_timestamp(latest) - timedelta(seconds=seconds), include_previous=True)
+
+    def read_columns(self, account, columns=None, start=None, end=None, recent=None):
+        """Load an account's samples as StatsColumns; see read_csv_columns."""
+        rows = self.read_recent(account, recent) if recent is not None else self.read(account, start, end)
+        return columns_from_rows(rows, columns)
+
+    def signature(self, account):
+        """Return a value that changes when rows are added: the latest timestamp, from the primary key index."""
+        return self.latest(account)
+
+    def accounts(self):
+        with self.lock:
+            return [row[0] for row in self.connection.execute('SELECT DISTINCT account FROM stats ORDER BY account')]
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+class SQLiteTail:
+    """Follow an account in an SQLiteStorage; same interface as CsvTail."""
+
+    def __init__(self, storage, account):
+        self.storage = storage
+        self.account = account
+        self.last = None
+
+    def update(self):
+        """Read the rows newer than the previous update; see CsvTail.update."""
+        latest = self.storage.latest(self.account)
+        reset = self.last is not None and (latest is None or latest < self.last)
+        if reset:
+            self.last = None
+        with self.storage.lock:
+            rows = self.storage.connection.execute(
+                'SELECT datetime, posts, following, followers FROM stats '
+                'WHERE account = ? AND datetime > ? ORDER BY datetime', (self.account, self.last or '')).fetchall()
+        if rows:
+            self.last = rows[-1][0]
+        return [(parse_timestamp(timestamp), posts, following, followers)
+                for timestamp, posts, following, followers in rows], reset
+
+    def skip_to_end(self):
+        """Start following from the account's latest row; see CsvTail.skip_to_end."""
+        self.last = self.storage.latest(self.account)
+
+def open_storage(spec=None):
+    """
+    Open a storage backend from a command-line spec.
+
+    Args:
+        spec (str): None or 'csv' for {account}_stats.csv files in the current
+            directory, 'csv:DIR' for another directory, or 'sqlite:PATH' (or a path
+            ending in .db/.sqlite) for an SQLite database
+
+    Returns:
+        CsvStorage or SQLiteStorage
+    """
+    if spec is None or spec == 'csv':
+        return CsvStorage()
+    if spec.startswith('csv:'):
+        return CsvStorage(spec[len('csv:'):])
+    if spec.startswith('sqlite:'):
+        return SQLiteStorage(spec[len('sqlite:'):])
+    if spec.endswith(('.db', '.sqlite', '.sqlite3')):
+        return SQLiteStorage(spec)
+    raise ValueError(f"Unknown storage '{spec}' (use csv, csv:DIR or sqlite:PATH)")
+
+def import_csv_files(storage, csv_files, batch_size=10000):
+    """Copy {account}_stats.csv files into a storage backend in batches; returns rows imported per account."""
+    imported = {}
+    for csv_file in csv_files:
+        account = os.path.basename(csv_file)
+        if account.endswith('_stats.csv'):
+            account = account[:-len('_stats.csv')]
+        rows = CsvStorage(os.path.dirname(csv_file) or '.').read(account)
+        batch = []
+        for timestamp, posts, following, followers in rows:
+            batch.append({'datetime': timestamp.isoformat(), 'posts': '' if posts is None else posts,
+                          'following': '' if following is None else following,
+                          'followers': '' if followers is None else followers})
+            if len(batch) >= batch_size:
+                storage.append(account, batch)
+                batch = []
+        if batch:
+            storage.append(account, batch)
+        imported[account] = len(rows)
+    return imported
+
+if __name__ == "__main__":
+    init(autoreset=True)  # Initialize colorama
+    parser = argparse.ArgumentParser(description='Import {account}_stats.csv files into an SQLite stats database')
+    parser.add_argument('db', help='SQLite database to create or extend')
+    parser.add_argument('csv_files', nargs='+', help='CSV files to import, named <account>_stats.csv')
+    args = parser.parse_args()
+
+    storage = SQLiteStorage(args.db)
+    for account, count in import_csv_files(storage, args.csv_files).items():
+        print(f"{Fore.GREEN}Imported {Style.BRIGHT}{count:,}{Style.NORMAL} rows for {account}")
+    storage.close()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import get_profile_stats
+from get_profile_stats import create_http_session, fetch_profile, get_profile_stats_http
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'profile.html')
+
+with open(FIXTURE, 'rb') as f:
+    PROFILE_HTML = f.read()
+
+# Path -> (status, content type, body) served by the stub server
+RESPONSES = {
+    '/someone': (200, 'text/html; charset=utf-8', PROFILE_HTML),
+    '/missing': (404, 'text/html; charset=utf-8', b'<html><body>Not found</body></html>'),
+    '/no-markers': (200, 'text/html; charset=utf-8', b'<html><body>Something went wrong</body></html>'),
+    '/empty': (200, 'text/html; charset=utf-8', b''),
+    '/rate-limited': (200, 'text/plain', b'Rate limit exceeded. Please try again later.'),
+    '/zero-counts': (200, 'text/html; charset=utf-8', PROFILE_HTML.replace(b'123456', b'0').replace(b'789', b'0')),
+    '/json-error': (200, 'application/json', b'{"errors":[{"code":88,"message":"Rate limit exceeded"}]}'),
+}
+
+class StubProfileHandler(BaseHTTPRequestHandler):
+    """Serve the recorded responses in RESPONSES."""
+
+    def do_GET(self):
+        status, content_type, body = RESPONSES.get(self.path, (404, 'text/plain', b'unknown path'))
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class HttpBackendTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), StubProfileHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.http_session = create_http_session(pool_size=2)
+        self.addCleanup(self.http_session.close)
+        # Stands in for the Selenium path so the tests never start Chrome
+        patcher = mock.patch.object(get_profile_stats, 'fetch_with_session',
+                                    return_value={'followers': 1, 'source': 'selenium'})
+        self.fallback = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def fetch(self, path):
+        return fetch_profile(None, self.base_url + path, self.http_session, save_html=False)
+
+    def test_recorded_profile_is_extracted_over_http(self):
+        stats = get_profile_stats_http(self.http_session, self.base_url + '/someone', save_html=False)
+        self.assertEqual(stats['followers'], 123456)
+        self.assertEqual(stats['posts'], 4321)
+        self.assertEqual(stats['following'], 789)
+        self.assertIn('userInteractionCount', stats['html_source'])
+
+    def test_zero_counts_are_kept(self):
+        stats = self.fetch('/zero-counts')
+        self.assertEqual(stats['followers'], 0)
+        self.assertEqual(stats['following'], 0)
+        self.assertEqual(stats['posts'], 4321)
+        self.fallback.assert_not_called()
+
+    def test_success_does_not_fall_back(self):
+        stats = self.fetch('/someone')
+        self.assertEqual(stats['followers'], 123456)
+        self.fallback.assert_not_called()
+
+    def test_non_200_falls_back_to_selenium(self):
+        self.assertIsNone(get_profile_stats_http(self.http_session, self.base_url + '/missing', save_html=False))
+        self.assertEqual(self.fetch('/missing')['source'], 'selenium')
+        self.fallback.assert_called_once()
+
+    def test_missing_markers_fall_back_to_selenium(self):
+        self.assertEqual(self.fetch('/no-markers')['source'], 'selenium')
+        self.fallback.assert_called_once()
+
+    def test_markup_free_bodies_fall_back_to_selenium(self):
+        for path in ('/empty', '/rate-limited', '/json-error'):
+            with self.subTest(path=path):
+                self.fallback.reset_mock()
+                self.assertIsNone(get_profile_stats_http(self.http_session, self.base_url + path, save_html=False))
+                self.assertEqual(self.fetch(path)['source'], 'selenium')
+                self.fallback.assert_called_once()
+
+    def test_connection_error_falls_back_to_selenium(self):
+        self.http_session.close()
+        stats = fetch_profile(None, 'http://127.0.0.1:9/someone', self.http_session, save_html=False)
+        self.assertEqual(stats['source'], 'selenium')
+
+if __name__ == '__main__':
+    unittest.main()
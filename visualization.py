@@ -1,21 +1,336 @@
 #!/usr/bin/env python
 
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import argparse
+import os
 import time
 from datetime import datetime
 from matplotlib.animation import FuncAnimation
 from tqdm import tqdm
+from stats_storage import CsvStorage, CsvTail, open_storage, read_csv_columns
+from stats_rollup import RollupStore, RAW_SECONDS
 
-def plot_followers_and_posts(file_path, history_days, fig, ax1, ax2):
+# Buckets to aim for when a long history is drawn from rollups, about one per pixel
+PLOT_POINTS = 2000
+
+def frame_from_history(history):
+    """Build a stats DataFrame from a StatsHistory; the following column is all NaN."""
+    micros = (np.frombuffer(history.times, dtype=np.float64) * 1_000_000).astype(np.int64)
+    if history.tzinfo is None:
+        times = pd.to_datetime(micros.astype('datetime64[us]'))
+    else:
+        times = pd.to_datetime(micros, unit='us', utc=True).tz_convert(history.tzinfo)
+    return pd.DataFrame({
+        'datetime': times,
+        'posts': np.array(history.posts, dtype=np.float64),
+        'following': np.full(len(history), np.nan),
+        'followers': np.array(history.followers, dtype=np.float64),
+    })
+
+def load_stats_frame(file_path, storage=None, history_days=None, rollups=None):
+    """
+    Load stats as a DataFrame, from a CSV path or from a storage backend.
+
+    CSV files go through the bulk column loader; 'N/A' and empty counts become NaN,
+    as with pd.read_csv. With a non-CSV storage, file_path names the account (a
+    trailing _stats.csv is stripped). Only the last history_days are kept.
+    With a RollupStore, histories longer than 7 days are drawn from the first and
+    last sample of each rollup bucket before the last 7 days (see
+    RollupStore.load_columns); the last 7 days are read as without rollups.
+    """
+    recent = history_days * 86400 if history_days is not None else None
+    account = os.path.basename(file_path)
+    if account.endswith('_stats.csv'):
+        account = account[:-len('_stats.csv')]
+    if rollups is not None and recent is not None and recent > RAW_SECONDS:
+        if storage is None or isinstance(storage, CsvStorage):
+            storage = CsvStorage(os.path.dirname(file_path) or '.')
+        columns = rollups.load_columns(account, storage, recent, points=PLOT_POINTS)
+    elif storage is None or isinstance(storage, CsvStorage):
+        columns = read_csv_columns(file_path, recent=recent)
+    else:
+        columns = storage.read_columns(account, recent=recent)
+    return pd.DataFrame({name: columns[name] for name in ('datetime', 'posts', 'following', 'followers')})
+
+def followers_per_post_loop(filtered_df, window_size):
+    """
+    Followers gained per post over a window_size-day window centred on each row.
+
+    The original row-by-row implementation, O(n^2): it filters the whole frame
+    once per row. Kept as the reference for followers_per_post and for frames
+    that are not in time order.
+
+    Returns:
+        list: One value per row; 0 where the window has fewer than two rows, no
+        posts were made or followers were lost, and for the last row
+    """
+    followers_gained_list = []
+    posts_made_list = []
+    for i in tqdm(range(len(filtered_df) - 1), desc="Processing data"):
+        current_date = filtered_df['datetime'].iloc[i]
+        window_end_date = current_date + pd.Timedelta(days=window_size/2)
+        window_start_date = current_date - pd.Timedelta(days=window_size/2)
+
+        # Directly use the window boundaries to filter data
+        window_df = filtered_df[
+            (filtered_df['datetime'] >= window_start_date) &
+            (filtered_df['datetime'] <= window_end_date)
+        ]
+
+        if len(window_df) > 1:  # Make sure we have at least 2 points to calculate difference
+            followers_gained = window_df['followers'].iloc[-1] - window_df['followers'].iloc[0]
+            posts_made = window_df['posts'].iloc[-1] - window_df['posts'].iloc[0]
+
+            if posts_made > 0 and followers_gained >= 0:
+                followers_gained_list.append(followers_gained)
+                posts_made_list.append(posts_made)
+            else:
+                followers_gained_list.append(0)
+                posts_made_list.append(0)
+        else:
+            followers_gained_list.append(0)
+            posts_made_list.append(0)
+
+    followers_per_post_values = []
+    for i in range(len(followers_gained_list)):
+        if posts_made_list[i] > 0:
+            followers_per_post_values.append(followers_gained_list[i] / posts_made_list[i])
+        else:
+            followers_per_post_values.append(0)
+    # The last row has no window of its own
+    while len(followers_per_post_values) < len(filtered_df):
+        followers_per_post_values.append(0)
+    return followers_per_post_values
+
+def followers_per_post(filtered_df, window_size):
+    """
+    Same result as followers_per_post_loop in one O(n log n) pass.
+
+    On time-ordered rows each window is a contiguous range, so its first and last
+    rows are found for every row at once with searchsorted. Frames that are not in
+    time order fall back to the loop.
+    """
+    if not filtered_df['datetime'].is_monotonic_increasing:
+        return followers_per_post_loop(filtered_df, window_size)
+    n = len(filtered_df)
+    times = filtered_df['datetime'].to_numpy(dtype='datetime64[ns]')
+    half = np.timedelta64(pd.Timedelta(days=window_size/2).value, 'ns')
+    first = np.searchsorted(times, times - half, side='left')
+    last = np.searchsorted(times, times + half, side='right') - 1
+
+    followers = filtered_df['followers'].to_numpy(dtype=np.float64)
+    posts = filtered_df['posts'].to_numpy(dtype=np.float64)
+    followers_gained = followers[last] - followers[first]
+    posts_made = posts[last] - posts[first]
+    # NaN counts fail both comparisons, as in the loop
+    keep = (last > first) & (posts_made > 0) & (followers_gained >= 0) & (np.arange(n) < n - 1)
+    values = np.zeros(n)
+    np.divide(followers_gained, posts_made, out=values, where=keep)
+    return values.tolist()
+
+def point_budget(fig, max_points=None):
+    """
+    Points to draw per line: two per pixel column of the figure, or max_points if given.
+
+    Returns:
+        int: The budget, or None to draw every sample (max_points=0)
+    """
+    if max_points is not None:
+        return max_points or None
+    return 2 * int(fig.get_figwidth() * fig.dpi)
+
+def downsample_indices(times, values, budget):
+    """
+    Pick at most about budget samples of a time-ordered series that keep its shape.
+
+    The time range is split into budget // 2 equal buckets, roughly one per pixel
+    column, and each bucket keeps the positions of its minimum and maximum (the
+    first one on ties), plus the series' first and last sample. Peaks and dips
+    therefore survive, where plain decimation could skip them. NaN samples are
+    dropped from series that need reducing.
+
+    Args:
+        times (numpy.ndarray): int64 timestamps in ascending order
+        values (numpy.ndarray): float64 values
+        budget (int): Maximum number of points to keep, None for all
+
+    Returns:
+        numpy.ndarray: Sorted positions of the samples to keep
+    """
+    if budget is None or len(values) <= budget:
+        return np.arange(len(values))
+    index = np.flatnonzero(~np.isnan(values))
+    times, values = times[index], values[index]
+    n = len(values)
+    if n == 0:
+        return index  # Nothing to draw, e.g. a posts column that was never extracted
+    buckets = max(1, (budget - 2) // 2)
+    span = float(times[-1] - times[0])
+    if span > 0:
+        bucket = np.minimum(((times - times[0]) / span * buckets).astype(np.int64), buckets - 1)
+    else:
+        bucket = np.zeros(n, dtype=np.int64)
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    segment = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, n]))
+    keep = [[0, n - 1]]
+    for extreme in (np.minimum.reduceat(values, starts), np.maximum.reduceat(values, starts)):
+        hits = np.flatnonzero(values == extreme[segment])
+        keep.append(hits[np.r_[True, segment[hits][1:] != segment[hits][:-1]]])
+    return index[np.unique(np.concatenate(keep))]
+
+# Downsampled lines per (file, history_days, budget): (data signature, lines)
+_series_cache = {}
+
+def stats_series(filtered_df, window_size=7, show_followers_per_post=False, budget=None, cache_key=None):
+    """
+    Compute the lines to draw: followers, posts and, if enabled, followers gained per post.
+
+    Followers per post is computed on every row and then each line is reduced to
+    the point budget (see downsample_indices). With a cache_key such as
+    (file, history_days, budget), the lines are reused until the frame's length
+    or first or last timestamp changes, so a refresh without new rows skips both.
+
+    Returns:
+        dict: 'followers', 'posts' and 'per_post' (if enabled) -> (times, values)
+    """
+    times = filtered_df['datetime']
+    signature = (len(filtered_df), times.iloc[0] if len(times) else None,
+                 times.iloc[-1] if len(times) else None, window_size, show_followers_per_post)
+    if cache_key is not None and cache_key in _series_cache and _series_cache[cache_key][0] == signature:
+        return _series_cache[cache_key][1]
+
+    columns = {
+        'followers': filtered_df['followers'].to_numpy(dtype=np.float64),
+        'posts': filtered_df['posts'].to_numpy(dtype=np.float64),
+    }
+    if show_followers_per_post:
+        columns['per_post'] = np.asarray(followers_per_post(filtered_df, window_size), dtype=np.float64)
+    if budget is not None and times.is_monotonic_increasing:
+        ns = times.to_numpy(dtype='datetime64[ns]').astype(np.int64)
+        series = {}
+        for name, values in columns.items():
+            index = downsample_indices(ns, values, budget)
+            series[name] = (times.iloc[index], values[index])
+    else:
+        series = {name: (times, values) for name, values in columns.items()}
+    if cache_key is not None:
+        _series_cache[cache_key] = (signature, series)
+    return series
+
+def draw_stats_frame(filtered_df, ax1, ax2, ax3=None, window_size=7, budget=None, cache_key=None):
+    """
+    Clear the axes and draw the followers and posts lines, and followers gained per post on ax3 if given.
+
+    Each line is reduced to budget points; see stats_series for budget and cache_key.
+
+    Returns:
+        tuple: The (followers, posts, followers per post) line artists; the last is
+        None without ax3
+    """
+    show_followers_per_post = ax3 is not None
     # Clear the axes
     ax1.clear()
     ax2.clear()
+    if show_followers_per_post:
+        # clear() also resets the spine that was moved outward for the third axis
+        spine_position = ax3.spines['right'].get_position()
+        ax3.clear()
+        ax3.spines['right'].set_position(spine_position)
+    per_post_line = None
+
+    # Followers per post is only calculated if the flag is set
+    series = stats_series(filtered_df, window_size, show_followers_per_post, budget, cache_key)
+    # Plot followers on primary y-axis
+    color1 = '#1DA1F2'  # Twitter blue
+    followers_line, = ax1.plot(*series['followers'], color=color1, linewidth=2, label='Followers')
+    ax1.set_xlabel('Datetime')
+    ax1.set_ylabel('Followers', color=color1)
+    ax1.tick_params(axis='y', labelcolor=color1)
+    
+    # Calculate time range of data
+    time_range = filtered_df['datetime'].max() - filtered_df['datetime'].min()
+    
+    # Adjust date formatting based on time range
+    if time_range <= pd.Timedelta(days=2):
+        # For 2 days or less, show every 12 hours
+        ax1.xaxis.set_major_formatter(plt.matplotlib.dates.DateFormatter('%m-%d %H:%M'))
+        ax1.xaxis.set_major_locator(plt.matplotlib.dates.HourLocator(interval=12))
+    elif time_range <= pd.Timedelta(days=7):
+        # For 2-7 days, show every other day
+        ax1.xaxis.set_major_formatter(plt.matplotlib.dates.DateFormatter('%m-%d'))
+        ax1.xaxis.set_major_locator(plt.matplotlib.dates.DayLocator(interval=2))
+    elif time_range <= pd.Timedelta(days=30):
+        # For 7-30 days, show every 4 days
+        ax1.xaxis.set_major_formatter(plt.matplotlib.dates.DateFormatter('%m-%d'))
+        ax1.xaxis.set_major_locator(plt.matplotlib.dates.DayLocator(interval=4))
+    elif time_range <= pd.Timedelta(days=90):
+        # For 30-90 days, show every week
+        ax1.xaxis.set_major_formatter(plt.matplotlib.dates.DateFormatter('%m-%d'))
+        ax1.xaxis.set_major_locator(plt.matplotlib.dates.DayLocator(interval=7))
+    else:
+        # For longer periods, show every 2 weeks
+        ax1.xaxis.set_major_formatter(plt.matplotlib.dates.DateFormatter('%m-%d'))
+        ax1.xaxis.set_major_locator(plt.matplotlib.dates.DayLocator(interval=14))
+    
+    # Remove minor ticks
+    ax1.xaxis.set_minor_locator(plt.NullLocator())
+    
+    # Plot posts on secondary y-axis
+    color2 = '#17BF63'  # Twitter green
+    posts_line, = ax2.plot(*series['posts'], color=color2, linewidth=2, label='Posts')
+    ax2.set_ylabel('Posts', color=color2)
+    ax2.tick_params(axis='y', labelcolor=color2)
+    
+    # Only plot followers gained per post if enabled
+    if show_followers_per_post:
+        # Plot followers gained per post on tertiary y-axis
+        color3 = '#FF5733'  # Custom color for followers gained per post
+        per_post_line, = ax3.plot(*series['per_post'], color=color3, linewidth=2, label='Followers Gained per Post')
+        ax3.set_ylabel('Followers Gained per Post', color=color3)
+        ax3.tick_params(axis='y', labelcolor=color3)
+        
+        # Add legends for all axes
+        lines1, labels1 = ax1.get_legend_handles_labels()
+        lines2, labels2 = ax2.get_legend_handles_labels()
+        lines3, labels3 = ax3.get_legend_handles_labels()
+        ax1.legend(lines1 + lines2 + lines3, labels1 + labels2 + labels3, loc='upper left')
+    else:
+        # Add legends for primary and secondary axes only
+        lines1, labels1 = ax1.get_legend_handles_labels()
+        lines2, labels2 = ax2.get_legend_handles_labels()
+        ax1.legend(lines1 + lines2, labels1 + labels2, loc='upper left')
+    
+    # Update the plot
+    plt.xticks(rotation=45)
+    plt.tight_layout()
+
+    return followers_line, posts_line, per_post_line
+
+def print_overall_followers_per_post(filtered_df):
+    """Print followers gained per post over the whole window, for interactive charts."""
+    filtered_followers_gained = filtered_df['followers'].iloc[-1] - filtered_df['followers'].iloc[0]
+    filtered_posts_made = filtered_df['posts'].iloc[-1] - filtered_df['posts'].iloc[0]
+
+    if filtered_posts_made > 0 and filtered_followers_gained >= 0:
+        overall_followers_per_post = filtered_followers_gained / filtered_posts_made
+        print(f"Followers gained per post: {overall_followers_per_post:.1f}")
+    else:
+        print("Not enough data to calculate followers per post for this period")
+
+def plot_followers_and_posts(file_path, history_days, fig, ax1, ax2, ax3=None, window_size=7,
+                             storage=None, rollups=None, max_points=None):
+    """
+    Load the last history_days and redraw the chart (see draw_stats_frame); returns the line artists.
+
+    Lines are downsampled to point_budget(fig, max_points) points and cached per
+    (file, history_days, budget).
+    """
     print(f"\nRefresh timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
-    # Load the CSV file
-    df = pd.read_csv(file_path)
+    # Load the CSV file (or the account's rows from the configured storage)
+    df = load_stats_frame(file_path, storage, history_days, rollups)
     
     # Convert datetime column to pandas datetime format
     df['datetime'] = pd.to_datetime(df['datetime'])
@@ -27,10 +342,6 @@ def plot_followers_and_posts(file_path, history_days, fig, ax1, ax2):
     print(f"Length of filtered_df: {len(filtered_df)}")
     print(f"Length of df: {len(df)}")
     
-    followers_per_post_values = []  # Initialize as an empty list
-    followers_gained_list = []  # Initialize as an empty list
-    posts_made_list = []  # Initialize as an empty list
-    
     # Calculate followers gained per post for each day within the window
 #    for i in range(len(filtered_df) - 1):
 #        current_date = filtered_df['datetime'].iloc[i]
@@ -94,128 +405,106 @@ def plot_followers_and_posts(file_path, history_days, fig, ax1, ax2):
 #                print("followers_gained:", followers_gained)
 #                posts_made_list.append(posts_made)
 #                print("posts_made:", posts_made)
-    # Only calculate followers-per-post metrics if the flag is set
-    if args.show_followers_per_post:
-        followers_per_post_values = []  # Initialize as an empty list
-        followers_gained_list = []  # Initialize as an empty list
-        posts_made_list = []  # Initialize as an empty list
-        
-        # Calculate followers gained per post for each day within the window
-        for i in tqdm(range(len(filtered_df) - 1), desc="Processing data"):
-            current_date = filtered_df['datetime'].iloc[i]
-            window_end_date = current_date + pd.Timedelta(days=args.window_size/2)
-            window_start_date = current_date - pd.Timedelta(days=args.window_size/2)
-            
-            # Directly use the window boundaries to filter data
-            window_df = filtered_df[
-                (filtered_df['datetime'] >= window_start_date) & 
-                (filtered_df['datetime'] <= window_end_date)
-            ]
-            
-            if len(window_df) > 1:  # Make sure we have at least 2 points to calculate difference
-                followers_gained = window_df['followers'].iloc[-1] - window_df['followers'].iloc[0]
-                posts_made = window_df['posts'].iloc[-1] - window_df['posts'].iloc[0]
-                
-                if posts_made > 0 and followers_gained >= 0:
-                    followers_gained_list.append(followers_gained)
-                    posts_made_list.append(posts_made)
-                    theoretical_followers_per_post = followers_gained / posts_made
-                    print("theoretical_followers_per_post:", theoretical_followers_per_post)
-                    print()
-                else:
-                    followers_gained_list.append(0)
-                    posts_made_list.append(0)
-            else:
-                followers_gained_list.append(0)
-                posts_made_list.append(0)
-        
-        # Calculate followers gained per post for each window
-        for i in tqdm(range(len(followers_gained_list)), desc="Calculating followers per post"):
-            if posts_made_list[i] > 0:
-                followers_per_post = followers_gained_list[i] / posts_made_list[i]
-                followers_per_post_values.append(followers_per_post)
-            else:
-                followers_per_post_values.append(0)
-    else:
-        followers_per_post_values = [0] * len(filtered_df)  # Initialize with zeros
-    # Plot followers on primary y-axis
-    color1 = '#1DA1F2'  # Twitter blue
-    ax1.plot(filtered_df['datetime'], filtered_df['followers'], color=color1, linewidth=2, label='Followers')
-    ax1.set_xlabel('Datetime')
-    ax1.set_ylabel('Followers', color=color1)
-    ax1.tick_params(axis='y', labelcolor=color1)
-    
-    # Calculate time range of data
-    time_range = filtered_df['datetime'].max() - filtered_df['datetime'].min()
-    
-    # Adjust date formatting based on time range
-    if time_range <= pd.Timedelta(days=2):
-        # For 2 days or less, show every 12 hours
-        ax1.xaxis.set_major_formatter(plt.matplotlib.dates.DateFormatter('%m-%d %H:%M'))
-        ax1.xaxis.set_major_locator(plt.matplotlib.dates.HourLocator(interval=12))
-    elif time_range <= pd.Timedelta(days=7):
-        # For 2-7 days, show every other day
-        ax1.xaxis.set_major_formatter(plt.matplotlib.dates.DateFormatter('%m-%d'))
-        ax1.xaxis.set_major_locator(plt.matplotlib.dates.DayLocator(interval=2))
-    elif time_range <= pd.Timedelta(days=30):
-        # For 7-30 days, show every 4 days
-        ax1.xaxis.set_major_formatter(plt.matplotlib.dates.DateFormatter('%m-%d'))
-        ax1.xaxis.set_major_locator(plt.matplotlib.dates.DayLocator(interval=4))
-    elif time_range <= pd.Timedelta(days=90):
-        # For 30-90 days, show every week
-        ax1.xaxis.set_major_formatter(plt.matplotlib.dates.DateFormatter('%m-%d'))
-        ax1.xaxis.set_major_locator(plt.matplotlib.dates.DayLocator(interval=7))
-    else:
-        # For longer periods, show every 2 weeks
-        ax1.xaxis.set_major_formatter(plt.matplotlib.dates.DateFormatter('%m-%d'))
-        ax1.xaxis.set_major_locator(plt.matplotlib.dates.DayLocator(interval=14))
-    
-    # Remove minor ticks
-    ax1.xaxis.set_minor_locator(plt.NullLocator())
-    
-    # Plot posts on secondary y-axis
-    color2 = '#17BF63'  # Twitter green
-    ax2.plot(filtered_df['datetime'], filtered_df['posts'], color=color2, linewidth=2, label='Posts')
-    ax2.set_ylabel('Posts', color=color2)
-    ax2.tick_params(axis='y', labelcolor=color2)
-    
     # Only calculate overall followers per post if the flag is set
-    if args.show_followers_per_post:
-        filtered_followers_gained = filtered_df['followers'].iloc[-1] - filtered_df['followers'].iloc[0]
-        filtered_posts_made = filtered_df['posts'].iloc[-1] - filtered_df['posts'].iloc[0]
-        
-        if filtered_posts_made > 0 and filtered_followers_gained >= 0:
-            followers_per_post = filtered_followers_gained / filtered_posts_made
-            print(f"Followers gained per post: {followers_per_post:.1f}")
+    if ax3 is not None:
+        print_overall_followers_per_post(filtered_df)
+    budget = point_budget(fig, max_points)
+    return draw_stats_frame(filtered_df, ax1, ax2, ax3, window_size, budget, (file_path, history_days, budget))
+
+# Fraction of history_days of out-of-window rows a live plot keeps before it is rebuilt
+ROLLOVER_FRACTION = 0.1
+
+class LivePlot:
+    """
+    Keep the chart of an account's last history_days current without redrawing it.
+
+    The history is loaded and drawn once. Each update reads only the rows appended
+    since the previous one (CsvTail or SQLiteTail), passes the rows inside the
+    window to the existing line artists with set_data and rescales the axes, so
+    its cost does not grow with the file. The chart is rebuilt from memory, with
+    fresh date ticks, only once ROLLOVER_FRACTION of history_days has scrolled
+    out of the window, and reloaded when the file is truncated or rotated.
+    """
+
+    def __init__(self, file_path, history_days, fig, ax1, ax2, ax3=None, window_size=7,
+                 storage=None, rollups=None, max_points=None):
+        self.file_path = file_path
+        self.history_days = history_days
+        self.fig = fig
+        self.axes = (ax1, ax2, ax3)
+        self.window_size = window_size
+        self.storage = storage
+        self.rollups = rollups
+        self.max_points = max_points
+        if storage is None or isinstance(storage, CsvStorage):
+            self.tail = CsvTail(file_path)
         else:
-            print("Not enough data to calculate followers per post for this period")
-    
-    # Ensure the length of followers_per_post_values matches filtered_df
-    while len(followers_per_post_values) < len(filtered_df):
-        followers_per_post_values.append(0)  # Append zeros to match the length
-    
-    # Only plot followers gained per post if enabled
-    if args.show_followers_per_post:
-        # Plot followers gained per post on tertiary y-axis
-        color3 = '#FF5733'  # Custom color for followers gained per post
-        ax3.plot(filtered_df['datetime'], followers_per_post_values, color=color3, linewidth=2, label='Followers Gained per Post')
-        ax3.set_ylabel('Followers Gained per Post', color=color3)
-        ax3.tick_params(axis='y', labelcolor=color3)
-        
-        # Add legends for all axes
-        lines1, labels1 = ax1.get_legend_handles_labels()
-        lines2, labels2 = ax2.get_legend_handles_labels()
-        lines3, labels3 = ax3.get_legend_handles_labels()
-        ax1.legend(lines1 + lines2 + lines3, labels1 + labels2 + labels3, loc='upper left')
-    else:
-        # Add legends for primary and secondary axes only
-        lines1, labels1 = ax1.get_legend_handles_labels()
-        lines2, labels2 = ax2.get_legend_handles_labels()
-        ax1.legend(lines1 + lines2, labels1 + labels2, loc='upper left')
-    
-    # Update the plot
-    plt.xticks(rotation=45)
-    plt.tight_layout()
+            account = os.path.basename(file_path)
+            if account.endswith('_stats.csv'):
+                account = account[:-len('_stats.csv')]
+            self.tail = storage.tail(account)
+        self.reload()
+
+    def reload(self):
+        """Load the window from storage and draw it from scratch."""
+        # Follow from the current end first; rows written during the load come back once and are dropped by time
+        self.tail.skip_to_end()
+        df = load_stats_frame(self.file_path, self.storage, self.history_days, self.rollups)
+        self.frame = df[['datetime', 'posts', 'followers']].reset_index(drop=True)
+        self.rebuild()
+
+    def rebuild(self):
+        """Drop rows that left the window and redraw the chart from the rows in memory."""
+        cutoff = self.frame['datetime'].max() - pd.Timedelta(days=self.history_days)
+        self.frame = self.frame[self.frame['datetime'] >= cutoff].reset_index(drop=True)
+        self.lines = draw_stats_frame(self.frame, *self.axes, self.window_size,
+                                      point_budget(self.fig, self.max_points))
+
+    def update(self):
+        """
+        Append the rows added since the last update to the chart.
+
+        Returns:
+            int: Number of new rows
+        """
+        start = time.perf_counter()
+        rows, reset = self.tail.update()
+        if reset:
+            self.reload()
+            return len(self.frame)
+        latest = self.frame['datetime'].max()
+        rows = [row for row in rows if pd.isna(latest) or pd.Timestamp(row[0]) > latest]
+        if rows:
+            new = pd.DataFrame({
+                'datetime': pd.to_datetime([row[0] for row in rows]),
+                'posts': [np.nan if row[1] is None else row[1] for row in rows],
+                'followers': [np.nan if row[3] is None else row[3] for row in rows],
+            })
+            self.frame = pd.concat([self.frame, new], ignore_index=True)
+            self.redraw()
+        print(f"Refresh timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} "
+              f"({len(rows)} new rows, {(time.perf_counter() - start) * 1000:.1f} ms)")
+        return len(rows)
+
+    def redraw(self):
+        """Point the line artists at the rows inside the window, or rebuild once enough have rolled out."""
+        times = self.frame['datetime']
+        cutoff = times.iloc[-1] - pd.Timedelta(days=self.history_days)
+        if times.iloc[0] < cutoff - pd.Timedelta(days=self.history_days * ROLLOVER_FRACTION):
+            self.rebuild()
+            return
+        visible = self.frame.iloc[times.searchsorted(cutoff, side='left'):]
+        followers_line, posts_line, per_post_line = self.lines
+        series = stats_series(visible, self.window_size, per_post_line is not None,
+                              point_budget(self.fig, self.max_points))
+        followers_line.set_data(*series['followers'])
+        posts_line.set_data(*series['posts'])
+        if per_post_line is not None:
+            per_post_line.set_data(*series['per_post'])
+        for ax in self.axes:
+            if ax is not None:
+                ax.relim()
+                ax.autoscale_view()
 
 if __name__ == "__main__":
     # Set up argument parser
@@ -226,23 +515,38 @@ if __name__ == "__main__":
     parser.add_argument('--refresh_interval', type=int, default=0, help='Refresh interval in seconds (default: 0, no refresh)')
     parser.add_argument('--show-followers-per-post', action='store_true', 
                        help='Enable followers gained per post visualization (default: False)')
+    parser.add_argument('--storage', type=str, default='csv',
+                       help='Where the stats are stored: csv (default) or sqlite:PATH, in which case file_path is the account name')
+    parser.add_argument('--rollups', type=str, default=None, metavar='DB',
+                       help='Rollup database (see stats_rollup.py) to draw histories longer than 7 days from')
+    parser.add_argument('--max-points', type=int, default=None,
+                       help='Points per line after min/max downsampling (default: twice the figure width in pixels, 0 = all)')
     args = parser.parse_args()
+    storage = open_storage(args.storage)
+    rollups = RollupStore(args.rollups) if args.rollups else None
     
     # Create figure with primary and secondary y-axes
     fig, ax1 = plt.subplots(figsize=(10, 5))
     ax2 = ax1.twinx()
     
     # Only create tertiary axis if followers-per-post visualization is enabled
+    ax3 = None
     if args.show_followers_per_post:
         ax3 = ax1.twinx()
         ax3.spines['right'].set_position(('outward', 60))
 
-    def update(frame):
-        plot_followers_and_posts(args.file_path, args.history_days, fig, ax1, ax2)
-        
     if args.refresh_interval > 0:
+        # Draw once, then only append new rows on each tick
+        live = LivePlot(args.file_path, args.history_days, fig, ax1, ax2, ax3, args.window_size, storage, rollups,
+                        args.max_points)
+
+        def update(frame):
+            live.update()
+
         # Create animation that updates every refresh_interval milliseconds
-        ani = FuncAnimation(fig, update, interval=args.refresh_interval * 1000, save_count=100)
-        
-    plot_followers_and_posts(args.file_path, args.history_days, fig, ax1, ax2)
+        ani = FuncAnimation(fig, update, interval=args.refresh_interval * 1000, save_count=100,
+                            cache_frame_data=False)
+    else:
+        plot_followers_and_posts(args.file_path, args.history_days, fig, ax1, ax2, ax3, args.window_size, storage, rollups,
+                                 args.max_points)
     plt.show()